@@ -0,0 +1,94 @@
+"""Microbenchmark: per-call client overhead of @remote functions.
+
+Compares the legacy hot path (resolve the resource through the ResourceManager
+and build a new stub on every call) against the cached call plan used by
+``remote()``. The endpoint round trip is replaced by an in-memory response so
+only client-side overhead is measured.
+
+Usage:
+    python benchmarks/bench_call_plan.py [--calls N]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from runpod_flash.client import remote
+from runpod_flash.core.resources import LiveServerless, ResourceManager
+from runpod_flash.protos.remote_execution import FunctionResponse
+from runpod_flash.runtime.serialization import serialize_arg
+from runpod_flash.stubs import stub_resource
+from runpod_flash.stubs.live_serverless import LiveServerlessStub
+
+
+async def _fake_execute(self, request, sync=False):
+    return FunctionResponse(success=True, result=serialize_arg(None))
+
+
+def _echo(x):
+    return x
+
+
+async def _legacy_call(resource_config, func, *args):
+    """Reproduces the pre-call-plan wrapper body."""
+    resource_manager = ResourceManager()
+    remote_resource = await resource_manager.get_or_deploy_resource(resource_config)
+    stub = stub_resource(remote_resource)
+    return await stub(func, None, None, True, *args)
+
+
+async def _run(calls: int) -> None:
+    resource_config = LiveServerless(name="bench-call-plan")
+    resource_config.id = "bench-endpoint"
+
+    manager = ResourceManager()
+    manager._add_resource(resource_config.get_resource_key(), resource_config)
+
+    wrapped = remote(resource_config)(_echo)
+
+    with (
+        patch.object(LiveServerless, "is_deployed", return_value=True),
+        patch.object(LiveServerlessStub, "ExecuteFunction", _fake_execute),
+    ):
+        # Warm up both paths (imports, linecache, plan resolution)
+        await _legacy_call(resource_config, _echo, 1)
+        await wrapped(1)
+
+        start = time.perf_counter()
+        for i in range(calls):
+            await _legacy_call(resource_config, _echo, i)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(calls):
+            await wrapped(i)
+        planned = time.perf_counter() - start
+
+    legacy_us = legacy / calls * 1e6
+    planned_us = planned / calls * 1e6
+    print(f"calls:            {calls}")
+    print(f"legacy per call:  {legacy_us:8.1f} us")
+    print(f"plan per call:    {planned_us:8.1f} us")
+    print(f"speedup:          {legacy_us / planned_us:8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    # ResourceManager persists state under ./.runpod, keep it out of the repo
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            asyncio.run(_run(args.calls))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Microbenchmark: blob compression ratio and cost per codec.
+
+Serializes a compressible payload (repetitive records) and an incompressible
+one (random bytes, standing in for images or model weights) with each
+available codec, with and without adaptive sampling. Adaptive mode should
+leave incompressible blobs untouched for roughly the cost of one sample.
+
+Usage:
+    python benchmarks/bench_compression.py [--size 8M]
+"""
+
+import argparse
+import os
+import time
+
+from runpod_flash.runtime.compression import CompressionPolicy, available_codecs
+from runpod_flash.runtime.serialization import deserialize_arg, serialize_arg
+
+_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def _parse_size(text: str) -> int:
+    text = text.strip().upper()
+    if text[-1] in _UNITS:
+        return int(float(text[:-1]) * _UNITS[text[-1]])
+    return int(text)
+
+
+def _payloads(size: int):
+    record = {"id": 0, "label": "cat", "score": 0.5, "tags": ["a", "b"]}
+    records = [dict(record, id=i) for i in range(size // 64)]
+    return {"records": records, "random": os.urandom(size)}
+
+
+def _measure(payload, policy):
+    start = time.perf_counter()
+    encoded = serialize_arg(payload, policy)
+    encode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    deserialize_arg(encoded)
+    decode = time.perf_counter() - start
+    return len(encoded), encode, decode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", default="8M")
+    args = parser.parse_args()
+
+    payloads = _payloads(_parse_size(args.size))
+    print(
+        f"{'payload':>8} {'codec':>6} {'adaptive':>8} {'wire bytes':>12}"
+        f" {'ratio':>6} {'encode ms':>10} {'decode ms':>10}"
+    )
+    for name, payload in payloads.items():
+        baseline, encode, decode = _measure(payload, None)
+        print(
+            f"{name:>8} {'off':>6} {'-':>8} {baseline:>12} {1.0:>6.2f}"
+            f" {encode * 1e3:>10.2f} {decode * 1e3:>10.2f}"
+        )
+        for codec in available_codecs():
+            for adaptive in (False, True):
+                policy = CompressionPolicy(codec=codec, adaptive=adaptive)
+                wire, encode, decode = _measure(payload, policy)
+                print(
+                    f"{name:>8} {codec:>6} {str(adaptive).lower():>8} {wire:>12}"
+                    f" {wire / baseline:>6.2f} {encode * 1e3:>10.2f}"
+                    f" {decode * 1e3:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Microbenchmark: repeated large arguments with blob store de-duplication.
+
+Sends the same argument (a large weight buffer inside a dict) N times,
+as a loop calling a remote function with shared model weights would. Without
+de-duplication every call carries and unpickles the full payload; with it,
+the first call uploads the blob and later calls send a 35-byte reference that
+the worker resolves from its LRU.
+
+Usage:
+    python benchmarks/bench_dedup.py [--size 64M] [--calls 10]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from runpod_flash.runtime.blob_store import (
+    BlobDeduplicator,
+    LocalBlobStore,
+    set_blob_store,
+)
+from runpod_flash.runtime.serialization import deserialize_arg, serialize_arg
+
+_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def _parse_size(text: str) -> int:
+    text = text.strip().upper()
+    if text[-1] in _UNITS:
+        return int(float(text[:-1]) * _UNITS[text[-1]])
+    return int(text)
+
+
+def _run(payload, calls: int, dedup):
+    wire = 0
+    start = time.perf_counter()
+    for _ in range(calls):
+        encoded = serialize_arg(payload, dedup=dedup)
+        wire += len(encoded)
+        deserialize_arg(encoded)
+    return wire, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", default="64M")
+    parser.add_argument("--calls", type=int, default=10)
+    args = parser.parse_args()
+
+    payload = {"weights": os.urandom(_parse_size(args.size)), "scale": 0.5}
+    print(f"{'mode':>6} {'calls':>6} {'wire bytes':>14} {'total ms':>10}")
+    with tempfile.TemporaryDirectory() as root:
+        store = LocalBlobStore(root)
+        set_blob_store(store)
+        for name, dedup in (("inline", None), ("dedup", BlobDeduplicator(store))):
+            wire, elapsed = _run(payload, args.calls, dedup)
+            print(f"{name:>6} {args.calls:>6} {wire:>14} {elapsed * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
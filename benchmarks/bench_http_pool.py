@@ -0,0 +1,124 @@
+"""Microbenchmark: per-request HTTP clients versus the shared connection pool.
+
+Starts a local uvicorn server standing in for a load-balanced endpoint's
+/execute route and measures request latency for two client strategies:
+
+- fresh: a new get_authenticated_httpx_client() per request, as the
+  load-balancer stub used to do (TCP handshake on every call)
+- pooled: get_shared_httpx_client(), reusing keep-alive connections
+
+Requests are issued with a fixed number in flight. Against a real endpoint the
+handshake includes TLS, so the gap is larger than on loopback.
+
+Requires uvicorn (and h2 to exercise HTTP/2 over TLS endpoints).
+
+Usage:
+    python benchmarks/bench_http_pool.py [--requests 2000] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import threading
+import time
+
+import uvicorn
+
+from runpod_flash.core.utils.http import (
+    close_shared_httpx_clients,
+    get_authenticated_httpx_client,
+    get_shared_httpx_client,
+)
+
+_BODY = json.dumps({"success": True, "result": "gAVLKi4="}).encode()
+
+
+async def _app(scope, receive, send):
+    """Minimal ASGI /execute stand-in answering every request with a result."""
+    if scope["type"] != "http":
+        return
+    while (await receive()).get("more_body"):
+        pass
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": _BODY})
+
+
+def _serve() -> str:
+    """Run the stand-in on a free loopback port and return its base URL."""
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    server = uvicorn.Server(
+        uvicorn.Config(_app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+async def _fresh(url: str) -> None:
+    async with get_authenticated_httpx_client(timeout=30.0) as client:
+        response = await client.post(url, json={"function_name": "f"})
+        response.raise_for_status()
+
+
+async def _pooled(url: str) -> None:
+    client = get_shared_httpx_client(url)
+    response = await client.post(url, json={"function_name": "f"}, timeout=30.0)
+    response.raise_for_status()
+
+
+async def _run(send, url: str, requests: int, concurrency: int):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await send(url)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, time.perf_counter() - start
+
+
+def _percentile(values, pct: float) -> float:
+    return statistics.quantiles(values, n=100)[int(pct) - 1]
+
+
+async def _main(requests: int, concurrency: int) -> None:
+    url = f"{_serve()}/execute"
+    print(f"{'client':>7} {'reqs':>6} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>9}")
+    for name, send in (("fresh", _fresh), ("pooled", _pooled)):
+        # Warm up (imports, first connection) outside the measurement
+        await send(url)
+        latencies, elapsed = await _run(send, url, requests, concurrency)
+        print(
+            f"{name:>7} {requests:>6} {_percentile(latencies, 50) * 1e3:>8.2f} "
+            f"{_percentile(latencies, 99) * 1e3:>8.2f} {requests / elapsed:>9.0f}"
+        )
+    await close_shared_httpx_clients()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(_main(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
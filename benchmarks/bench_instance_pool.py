@@ -0,0 +1,91 @@
+"""Microbenchmark: repeated method calls on a remote class instance.
+
+Runs N method calls of one class instance through the generic handler, as
+successive calls of a RemoteClassWrapper would reach a worker. The class
+loads "weights" in __init__ (a large allocation plus a sleep standing in for
+disk or GPU transfers). Without an instance_id every job constructs the
+class again; with one, the worker's instance pool constructs it once and
+later calls only run the method.
+
+Usage:
+    python benchmarks/bench_instance_pool.py [--calls 20] [--init-ms 200] [--size 256M]
+"""
+
+import argparse
+import base64
+import statistics
+import time
+
+import cloudpickle
+
+from runpod_flash.runtime.generic_handler import create_handler
+from runpod_flash.runtime.instance_pool import InstancePool, set_instance_pool
+
+_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def _parse_size(text: str) -> int:
+    text = text.strip().upper()
+    if text[-1] in _UNITS:
+        return int(float(text[:-1]) * _UNITS[text[-1]])
+    return int(text)
+
+
+def _encode(value) -> str:
+    return base64.b64encode(cloudpickle.dumps(value)).decode("utf-8")
+
+
+class Model:
+    def __init__(self, size: int, init_seconds: float):
+        self.weights = bytearray(size)
+        time.sleep(init_seconds)
+
+    def predict(self, x: int) -> int:
+        return len(self.weights) + x
+
+
+def _run(handler, job_input, calls: int):
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        response = handler({"input": {**job_input, "create_new_instance": i == 0}})
+        latencies.append(time.perf_counter() - start)
+        assert response["success"], response.get("error")
+    return latencies, response.get("instance_info")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--init-ms", type=float, default=200.0)
+    parser.add_argument("--size", default="256M")
+    args = parser.parse_args()
+
+    set_instance_pool(InstancePool())
+    handler = create_handler({"Model": Model})
+    job_input = {
+        "function_name": "Model",
+        "execution_type": "class",
+        "args": [_encode(_parse_size(args.size)), _encode(args.init_ms / 1000)],
+        "method_name": "predict",
+        "method_args": [_encode(1)],
+    }
+
+    print(f"{'mode':>9} {'calls':>6} {'first ms':>9} {'p50 ms':>9} {'total ms':>10}")
+    for name, extra in (("construct", {}), ("pooled", {"instance_id": "Model_bench"})):
+        latencies, info = _run(handler, {**job_input, **extra}, args.calls)
+        print(
+            f"{name:>9} {args.calls:>6} {latencies[0] * 1e3:>9.1f} "
+            f"{statistics.median(latencies[1:] or latencies) * 1e3:>9.2f} "
+            f"{sum(latencies) * 1e3:>10.1f}"
+        )
+        if info:
+            print(
+                f"{'':>9} instance calls={info['call_count']} "
+                f"memory={info['memory_bytes'] / 1024**2:.0f}MiB "
+                f"hits={info['pool_hits']} misses={info['pool_misses']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Benchmark: runtime serialization hot path for representative payloads.
+
+Each payload goes through these stages:
+
+- ``codec``: serialize_arg / deserialize_arg on their own
+- ``typed``: the same with every available type codec enabled
+  (runtime.type_codecs), so specialized encoders can be compared to pickle
+- ``request``: LiveServerlessStub.prepare_request plus the job payload dump
+  sent to the endpoint
+- ``e2e``: request construction, generic_handler execution (argument
+  decode, call, result encode) and LiveServerlessStub.handle_response
+
+For every stage the best time over ``--repeat`` runs is reported together
+with throughput over the pickled payload size and the peak memory traced
+while the stage runs. NumPy and pandas payloads are skipped when those
+packages are not installed.
+
+Results can be saved with ``--save`` and compared against a saved run with
+``--compare`` to spot regressions between local checkouts.
+
+Usage:
+    python benchmarks/bench_serialization.py [--repeat 5] [--only dict,list1m]
+    python benchmarks/bench_serialization.py --save base.json
+    python benchmarks/bench_serialization.py --compare base.json
+"""
+
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+import cloudpickle
+
+from runpod_flash.protos.remote_execution import FunctionResponse
+from runpod_flash.runtime.generic_handler import create_handler
+from runpod_flash.runtime.serialization import deserialize_arg, serialize_arg
+from runpod_flash.runtime.type_codecs import type_codec_names
+from runpod_flash.stubs.live_serverless import LiveServerlessStub
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+def echo(value):
+    return value
+
+
+def _payloads():
+    payloads = {
+        "scalar": lambda: 42,
+        "dict": lambda: {
+            f"user_{i}": {"id": i, "name": f"name {i}", "tags": ["a", "b"]}
+            for i in range(1000)
+        },
+        "list1m": lambda: list(range(1_000_000)),
+        "bytes8m": lambda: os.urandom(8 * 1024 * 1024),
+    }
+    if np is not None:
+        payloads["ndarray"] = lambda: np.random.rand(1_000_000)
+    if pd is not None:
+        payloads["dataframe"] = lambda: pd.DataFrame(
+            {"a": range(200_000), "b": [0.5] * 200_000, "c": ["label"] * 200_000}
+        )
+    return payloads
+
+
+def _stages(value):
+    stub = LiveServerlessStub(server=None)
+    handler = create_handler({"echo": echo})
+
+    def codec():
+        return deserialize_arg(serialize_arg(value))
+
+    def typed():
+        return deserialize_arg(serialize_arg(value, type_codecs=type_codec_names()))
+
+    def request():
+        return stub.prepare_request(echo, None, None, True, value).model_dump(
+            exclude_none=True
+        )
+
+    def e2e():
+        job = {"input": request()}
+        return stub.handle_response(FunctionResponse(**handler(job)))
+
+    return {"codec": codec, "typed": typed, "request": request, "e2e": e2e}
+
+
+def _best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(repeat: int, only=None):
+    results = {}
+    for name, build in _payloads().items():
+        if only and name not in only:
+            continue
+        value = build()
+        size = len(cloudpickle.dumps(value))
+        for stage, fn in _stages(value).items():
+            fn()  # warm up caches (function source, imports)
+            seconds = _best_time(fn, repeat)
+            results[f"{name}/{stage}"] = {
+                "bytes": size,
+                "ms": seconds * 1e3,
+                "mb_per_s": size / seconds / 1e6,
+                "peak_bytes": _peak_memory(fn),
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="Comma-separated payload names")
+    parser.add_argument("--save", help="Write results to a JSON file")
+    parser.add_argument("--compare", help="Compare against a saved JSON file")
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    results = run(args.repeat, only)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print(
+        f"{'case':>18} {'pickled':>10} {'ms':>9} {'MB/s':>8} {'peak KiB':>10}"
+        + (f" {'vs base':>8}" if baseline else "")
+    )
+    for case, r in results.items():
+        line = (
+            f"{case:>18} {r['bytes']:>10} {r['ms']:>9.3f} {r['mb_per_s']:>8.1f}"
+            f" {r['peak_bytes'] / 1024:>10.1f}"
+        )
+        if case in baseline:
+            line += f" {r['ms'] / baseline[case]['ms']:>7.2f}x"
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
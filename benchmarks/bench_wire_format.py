@@ -0,0 +1,157 @@
+"""Microbenchmark: /execute wire size, encode/decode cost and peak memory.
+
+For each payload size a single bytearray argument is carried as a request the
+way LoadBalancerSlsStub can send it:
+
+- ``json``: cloudpickle + base64 strings inside a JSON body (legacy)
+- ``frames``: in-band cloudpickle blobs in the binary frames envelope
+- ``oob``: pickle protocol 5 with the buffer out-of-band, streamed in chunks
+  and read back into a single writable buffer
+
+Encode covers serialize + body encoding (streaming the chunks for ``oob``),
+decode covers body reading/parsing + deserialize. Peak is the memory
+allocated while encoding or decoding, relative to the payload size.
+
+Usage:
+    python benchmarks/bench_wire_format.py [--sizes 1K,100K,1M,10M,100M]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+
+from runpod_flash.runtime.serialization import (
+    deserialize_arg,
+    deserialize_arg_bytes,
+    deserialize_arg_frames,
+    serialize_arg,
+    serialize_arg_bytes,
+    serialize_arg_frames,
+)
+from runpod_flash.runtime.wire import (
+    encode_message,
+    iter_chunks,
+    pack_message,
+    read_body,
+    unpack_message,
+)
+
+_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def _parse_size(text: str) -> int:
+    text = text.strip().upper()
+    if text[-1] in _UNITS:
+        return int(float(text[:-1]) * _UNITS[text[-1]])
+    return int(text)
+
+
+def _timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _json_format(payload: bytearray):
+    def encode() -> bytes:
+        body = {"function_name": "f", "args": [serialize_arg(payload)]}
+        return json.dumps(body).encode("utf-8")
+
+    body = encode()
+
+    def decode():
+        return deserialize_arg(json.loads(body)["args"][0])
+
+    return len(body), encode, decode
+
+
+def _frames_format(payload: bytearray):
+    def encode() -> bytes:
+        body = {"function_name": "f", "args": [serialize_arg_bytes(payload)]}
+        return pack_message(body)
+
+    body = encode()
+
+    def decode():
+        return deserialize_arg_bytes(unpack_message(body)["args"][0])
+
+    return len(body), encode, decode
+
+
+def _oob_format(payload: bytearray):
+    # One loop for all runs; asyncio.run per call adds its own overhead
+    loop = asyncio.new_event_loop()
+
+    async def send():
+        body = {"function_name": "f", "args": [serialize_arg_frames(payload)]}
+        # Consume the stream chunk by chunk, as the HTTP client would
+        return [chunk async for chunk in iter_chunks(encode_message(body))]
+
+    def encode():
+        loop.run_until_complete(send())
+
+    chunks = loop.run_until_complete(send())
+    size = sum(len(c) for c in chunks)
+
+    async def receive():
+        async def replay():
+            for chunk in chunks:
+                yield chunk
+
+        body = await read_body(replay(), size)
+        return deserialize_arg_frames(unpack_message(body)["args"][0])
+
+    def decode():
+        return loop.run_until_complete(receive())
+
+    return size, encode, decode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1K,100K,1M,10M,100M")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'payload':>10} {'format':>7} {'wire bytes':>12} {'overhead':>9}"
+        f" {'encode ms':>10} {'decode ms':>10} {'enc peak':>9} {'dec peak':>9}"
+    )
+    formats = (
+        ("json", _json_format),
+        ("frames", _frames_format),
+        ("oob", _oob_format),
+    )
+    for size in (_parse_size(s) for s in args.sizes.split(",")):
+        payload = bytearray(os.urandom(size))
+        repeat = args.repeat if size < 50 * _UNITS["M"] else 2
+        for name, build in formats:
+            wire_bytes, encode, decode = build(payload)
+            encode_ms = _timeit(encode, repeat) * 1e3
+            decode_ms = _timeit(decode, repeat) * 1e3
+            encode_peak = _peak(encode) / size
+            decode_peak = _peak(decode) / size
+            print(
+                f"{size:>10} {name:>7} {wire_bytes:>12} {wire_bytes / size:>8.2f}x"
+                f" {encode_ms:>10.2f} {decode_ms:>10.2f}"
+                f" {encode_peak:>8.2f}x {decode_peak:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,10 @@ from typing import TYPE_CHECKING  # noqa: E402
 
 if TYPE_CHECKING:
     from .client import remote
+    from .hedging import HedgePolicy
+    from .jobs import JobHandle
+    from .micro_batch import BatchPolicy
+    from .result_cache import CachePolicy
     from .core.resources import (
         CpuInstanceType,
         CpuLiveLoadBalancer,
@@ -41,6 +45,22 @@ def __getattr__(name):
         from .client import remote
 
         return remote
+    elif name == "BatchPolicy":
+        from .micro_batch import BatchPolicy
+
+        return BatchPolicy
+    elif name == "HedgePolicy":
+        from .hedging import HedgePolicy
+
+        return HedgePolicy
+    elif name == "JobHandle":
+        from .jobs import JobHandle
+
+        return JobHandle
+    elif name == "CachePolicy":
+        from .result_cache import CachePolicy
+
+        return CachePolicy
     elif name in (
         "CpuInstanceType",
         "CpuLiveLoadBalancer",
@@ -108,6 +128,10 @@ def __getattr__(name):
 
 __all__ = [
     "remote",
+    "BatchPolicy",
+    "HedgePolicy",
+    "JobHandle",
+    "CachePolicy",
     "CpuInstanceType",
     "CpuLiveLoadBalancer",
     "CpuLiveServerless",
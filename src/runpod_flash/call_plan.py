@@ -0,0 +1,128 @@
+"""
+Resolved call plans for @remote functions.
+
+Resolving a resource (config hashing, ResourceManager locks, deployment checks)
+and building a stub is expensive relative to a single remote call. A call plan
+captures that work once per decorated function so the hot path only has to
+verify that the plan is still current before dispatching to the cached stub.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from .core.resources import DeployableResource, ResourceManager
+from .core.resources.health_monitor import (
+    HealthState,
+    ResourceHealthMonitor,
+    is_endpoint_failure,
+)
+from .stubs import stub_resource
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class CallPlan:
+    """Resolved execution plan for a decorated function.
+
+    Attributes:
+        resource: Deployed resource returned by the ResourceManager
+        stub: Stub callable created for the resource
+        resource_key: ResourceManager key of the resource (ResourceType:name)
+        generation: ResourceManager generation of the key at resolution time
+        health: Health monitor tracking the resource
+    """
+
+    resource: DeployableResource
+    stub: Callable[..., Any]
+    resource_key: str
+    generation: int
+    health: ResourceHealthMonitor
+
+    def is_current(self) -> bool:
+        """Check whether the plan can still be used without re-resolution.
+
+        The ResourceManager bumps a per-key generation whenever a resource is
+        added, updated, redeployed or removed, so a plain dict lookup is enough
+        to detect drift without recomputing config hashes or taking locks. A
+        resource the background health monitor has seen go down also
+        invalidates the plan so the ResourceManager can redeploy it.
+        """
+        if ResourceManager.get_resource_generation(self.resource_key) != (
+            self.generation
+        ):
+            return False
+        return self.health.get_state(self.resource_key) is not HealthState.UNHEALTHY
+
+
+@dataclass
+class CallPlanner:
+    """Computes and caches the CallPlan for a single decorated function.
+
+    The fast path is lock-free: a current plan is returned as-is. Concurrent
+    first calls may each resolve, which is safe because ResourceManager already
+    serializes deployments per resource; the last resolved plan wins.
+
+    The plan is invalidated when the ResourceManager reports drift for the
+    resource, when resolution fails (nothing is cached), when a call fails
+    because of the endpoint (report_failure()), or explicitly through
+    invalidate().
+    """
+
+    resource_config: DeployableResource
+    extra: Dict[str, Any] = field(default_factory=dict)
+    _plan: Optional[CallPlan] = field(default=None, init=False, repr=False)
+
+    @property
+    def plan(self) -> Optional[CallPlan]:
+        """Currently cached plan, if any."""
+        return self._plan
+
+    async def get(self) -> CallPlan:
+        """Return the cached plan, resolving a new one when missing or stale."""
+        plan = self._plan
+        if plan is not None and plan.is_current():
+            return plan
+        return await self.resolve()
+
+    async def resolve(self) -> CallPlan:
+        """Resolve the resource and stub, replacing any cached plan.
+
+        Raises:
+            Exception: Propagates deployment errors; no plan is cached on failure.
+        """
+        self._plan = None
+        resource_manager = ResourceManager()
+        resource = await resource_manager.get_or_deploy_resource(self.resource_config)
+
+        resource_key = self.resource_config.get_resource_key()
+        plan = CallPlan(
+            resource=resource,
+            stub=stub_resource(resource, **self.extra),
+            resource_key=resource_key,
+            generation=ResourceManager.get_resource_generation(resource_key),
+            health=ResourceHealthMonitor(),
+        )
+        self._plan = plan
+        log.debug(f"Resolved call plan for {resource_key} (gen {plan.generation})")
+        return plan
+
+    def invalidate(self) -> None:
+        """Drop the cached plan so the next call resolves the resource again."""
+        self._plan = None
+
+    def report_failure(self, error: BaseException) -> None:
+        """Record a failed call.
+
+        For endpoint failures (transport errors, timeouts, HTTP 5xx; see
+        is_endpoint_failure), drops the plan and clears the cached health
+        verdict, so the next call goes through the ResourceManager and
+        re-probes the resource. Errors raised by the remote function are
+        ignored.
+        """
+        if not is_endpoint_failure(error):
+            return
+        plan, self._plan = self._plan, None
+        if plan is not None:
+            plan.health.mark_failed(plan.resource_key)
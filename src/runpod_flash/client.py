@@ -1,12 +1,18 @@
+import asyncio
 import os
 import inspect
 import logging
 from functools import wraps
-from typing import List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
 
-from .core.resources import LoadBalancerSlsResource, ResourceManager, ServerlessResource
+from .call_plan import CallPlanner
+from .core.resources import LoadBalancerSlsResource, ServerlessResource
 from .execute_class import create_remote_class
-from .stubs import stub_resource
+from .fanout import DEFAULT_MAP_CHUNK_SIZE, DEFAULT_MAP_CONCURRENCY, map_inputs
+from .hedging import HedgePolicy
+from .jobs import JobHandle
+from .micro_batch import BatchPolicy, MicroBatcher
+from .result_cache import CachePolicy, ResultCache
 
 log = logging.getLogger(__name__)
 
@@ -19,6 +25,11 @@ def remote(
     local: bool = False,
     method: Optional[str] = None,
     path: Optional[str] = None,
+    batch: Optional[BatchPolicy] = None,
+    idempotent: bool = False,
+    hedge: Optional[HedgePolicy] = None,
+    cache: Optional[CachePolicy] = None,
+    affinity: bool = False,
     **extra,
 ):
     """
@@ -34,6 +45,19 @@ def remote(
 
     In both cases, the decorated function returns an awaitable that must be called with `await`.
 
+    Decorated functions also provide `.map(inputs, concurrency=16, chunk_size=1, ordered=True)`,
+    an async iterator that runs the function once per input with at most `concurrency` requests
+    in flight. With `chunk_size` > 1, inputs are packed into batched requests where the endpoint
+    supports it (load-balanced endpoints and cross-endpoint calls in Flash deployments).
+
+    On queue-based endpoints, `await fn.submit(...)` queues a call and returns a `JobHandle`
+    right away; await the handle (or `jobs.gather`/`jobs.as_completed` many of them) to
+    collect the result later, or persist it with `to_dict()`.
+
+    Instances of decorated classes provide `obj.pipeline()`, which records several method calls
+    and sends them in one request; later calls can take earlier results as arguments without
+    transferring them (see `runpod_flash.pipeline`).
+
     Args:
         resource_config (ServerlessResource): Configuration object specifying the serverless resource
             to be provisioned or used. Not used when local=True.
@@ -52,6 +76,24 @@ def remote(
         path (str, optional): HTTP path for load-balanced endpoints (LoadBalancerSlsResource).
             Required for LoadBalancerSlsResource. Must start with "/". Example: "/api/process".
             Ignored for queue-based endpoints. Defaults to None.
+        batch (BatchPolicy, optional): Coalesce concurrent calls into one remote call (functions
+            only). The function then receives one list per argument and must return a list with
+            one result per call; each caller still passes and receives a single value.
+            Defaults to None.
+        idempotent (bool, optional): Mark the function as safe to run more than once for the
+            same call, which hedging requires. Defaults to False.
+        hedge (HedgePolicy, optional): Send a duplicate request for calls that are slower than
+            a percentile of recent latencies and use the first response (load-balanced
+            endpoints and idempotent functions only). Defaults to None.
+        cache (CachePolicy, optional): Cache results by function source and arguments in memory
+            and under .runpod/result_cache, for functions whose result depends only on their
+            arguments (functions only). Concurrent identical calls share one execution.
+            Defaults to None.
+        affinity (bool, optional): Track the worker serving each instance of a decorated
+            class (classes only), send it as a hint with every call and log when the instance
+            moves. Workers keep instances alive between method calls either way; endpoints
+            cannot route a call to a given worker, so a call reaching another worker costs at
+            most one extra request to re-establish the instance. Defaults to False.
         extra (dict, optional): Additional parameters for the execution of the resource. Defaults to an empty dict.
 
     Returns:
@@ -79,6 +121,41 @@ def remote(
         async def api_endpoint(x: int, y: int) -> dict:
             return {"result": x + y}
 
+        # Hedged requests: slow calls are retried on another worker
+        @remote(
+            resource_config=LoadBalancerSlsResource(name="api-service"),
+            method="POST",
+            path="/api/embed",
+            idempotent=True,
+            hedge=HedgePolicy(percentile=95, budget=0.05),
+        )
+        async def embed_one(text: str) -> list:
+            return [len(text)]
+
+        # Micro-batched inference: concurrent calls share one job
+        @remote(
+            resource_config=LiveServerless(name="embedder"),
+            batch=BatchPolicy(max_size=32, max_wait_ms=5),
+        )
+        async def embed(texts: list) -> list:
+            return [len(text) for text in texts]
+
+        # Cached preprocessing: repeated calls skip the endpoint for a day
+        @remote(
+            resource_config=LiveServerless(name="preprocess"),
+            cache=CachePolicy(ttl=24 * 3600),
+        )
+        async def tokenize(text: str) -> list:
+            return text.split()
+
+        # Submit now, collect later
+        handle = await gpu_task.submit({"input": 1})
+        result = await handle
+
+        # Fan out over many inputs, 8 inputs per request, 4 requests in flight
+        async for result in gpu_task.map(datasets, concurrency=4, chunk_size=8):
+            print(result)
+
         # Local execution (testing/development)
         @remote(
             resource_config=my_resource_config,
@@ -116,6 +193,18 @@ def remote(
                 f"They will be ignored."
             )
 
+        if hedge is not None:
+            if not idempotent:
+                raise ValueError(
+                    "hedge sends duplicate requests and requires idempotent=True"
+                )
+            if not is_lb_resource:
+                log.warning(
+                    f"hedge is only used with LoadBalancerSlsResource, but "
+                    f"resource_config is {type(resource_config).__name__}. "
+                    f"It will be ignored."
+                )
+
         # Store routing metadata for scanner and build system
         routing_config = {
             "resource_config": resource_config,
@@ -123,6 +212,7 @@ def remote(
             "path": path,
             "dependencies": dependencies,
             "system_dependencies": system_dependencies,
+            "idempotent": idempotent,
         }
 
         if os.getenv("RUNPOD_POD_ID") or os.getenv("RUNPOD_ENDPOINT_ID"):
@@ -137,6 +227,12 @@ def remote(
 
         # Remote execution mode
         if inspect.isclass(func_or_class):
+            if batch is not None:
+                raise ValueError("batch is only supported for functions, not classes")
+            if hedge is not None:
+                raise ValueError("hedge is only supported for functions, not classes")
+            if cache is not None:
+                raise ValueError("cache is only supported for functions, not classes")
             # Handle class decoration
             wrapped_class = create_remote_class(
                 func_or_class,
@@ -145,30 +241,159 @@ def remote(
                 system_dependencies,
                 accelerate_downloads,
                 extra,
+                affinity=affinity,
             )
             wrapped_class.__remote_config__ = routing_config
             return wrapped_class
         else:
-            # Handle function decoration
-            @wraps(func_or_class)
-            async def wrapper(*args, **kwargs):
-                resource_manager = ResourceManager()
-                remote_resource = await resource_manager.get_or_deploy_resource(
-                    resource_config
+            if affinity:
+                raise ValueError(
+                    "affinity is only supported for classes, not functions"
                 )
+            # Handle function decoration
+            # Resource resolution and stub creation happen once per function and
+            # are reused until the ResourceManager reports drift or refresh() is called
+            planner = CallPlanner(
+                resource_config, {**extra, "hedge": hedge} if hedge else extra
+            )
+
+            async def execute(*args, **kwargs):
+                plan = await planner.get()
+                try:
+                    return await plan.stub(
+                        func_or_class,
+                        dependencies,
+                        system_dependencies,
+                        accelerate_downloads,
+                        *args,
+                        **kwargs,
+                    )
+                except Exception as e:
+                    # Re-resolve and re-probe the resource on the next call
+                    # if the endpoint failed
+                    planner.report_failure(e)
+                    raise
+
+            if batch is not None:
+                # Concurrent calls are coalesced into one call with list arguments
+                batcher = MicroBatcher(batch, execute)
+
+                @wraps(func_or_class)
+                async def wrapper(*args, **kwargs):
+                    return await batcher.submit(*args, **kwargs)
+
+            else:
+                wrapper = wraps(func_or_class)(execute)
 
-                stub = stub_resource(remote_resource, **extra)
-                return await stub(
-                    func_or_class,
-                    dependencies,
-                    system_dependencies,
-                    accelerate_downloads,
-                    *args,
-                    **kwargs,
+            result_cache = ResultCache(cache) if cache is not None else None
+            if result_cache is not None:
+                uncached = wrapper
+
+                @wraps(func_or_class)
+                async def wrapper(*args, **kwargs):
+                    return await result_cache.call(
+                        func_or_class, lambda: uncached(*args, **kwargs), args, kwargs
+                    )
+
+            async def run_chunk(items: List[Any]) -> List[Any]:
+                inputs = [((item,), {}) for item in items]
+                plan = await planner.get()
+                execute_batch = getattr(plan.stub, "execute_batch", None)
+                if (
+                    batch is not None
+                    or result_cache is not None
+                    or execute_batch is None
+                    or len(inputs) == 1
+                ):
+                    return await asyncio.gather(
+                        *(wrapper(*args, **kwargs) for args, kwargs in inputs),
+                        return_exceptions=True,
+                    )
+                try:
+                    return await execute_batch(
+                        func_or_class,
+                        dependencies,
+                        system_dependencies,
+                        accelerate_downloads,
+                        inputs,
+                    )
+                except Exception as e:
+                    planner.report_failure(e)
+                    raise
+
+            def map_over(
+                inputs: Union[Iterable[Any], AsyncIterable[Any]],
+                concurrency: int = DEFAULT_MAP_CONCURRENCY,
+                chunk_size: int = DEFAULT_MAP_CHUNK_SIZE,
+                ordered: bool = True,
+                return_exceptions: bool = False,
+            ) -> AsyncIterator[Any]:
+                """Call the function once per input with bounded fan-out.
+
+                Args:
+                    inputs: Sync or async iterable; each item is passed as the
+                        single positional argument. Consumed lazily.
+                    concurrency: Maximum number of requests in flight.
+                    chunk_size: Inputs packed into one request. Stubs without
+                        batch support send one request per input, so up to
+                        concurrency * chunk_size calls may then be in flight.
+                    ordered: Yield results in input order; otherwise as they
+                        complete.
+                    return_exceptions: Yield the exception of a failed input
+                        instead of raising it.
+
+                Returns:
+                    Async iterator over the results.
+                """
+                return map_inputs(
+                    run_chunk,
+                    inputs,
+                    concurrency=concurrency,
+                    chunk_size=chunk_size,
+                    ordered=ordered,
+                    return_exceptions=return_exceptions,
                 )
 
+            async def submit(*args, **kwargs) -> JobHandle:
+                """Queue a call as a job and return without waiting for it.
+
+                Micro-batching, result caching and hedging do not apply to
+                submitted calls.
+
+                Returns:
+                    JobHandle to await, persist, poll in bulk or cancel.
+
+                Raises:
+                    NotImplementedError: If the endpoint type has no job queue
+                        (load-balanced endpoints).
+                """
+                plan = await planner.get()
+                submit_job = getattr(plan.stub, "submit", None)
+                if submit_job is None:
+                    raise NotImplementedError(
+                        f"submit() is only supported for queue-based endpoints, "
+                        f"not {type(resource_config).__name__}"
+                    )
+                try:
+                    return await submit_job(
+                        func_or_class,
+                        dependencies,
+                        system_dependencies,
+                        accelerate_downloads,
+                        *args,
+                        **kwargs,
+                    )
+                except Exception as e:
+                    planner.report_failure(e)
+                    raise
+
             # Store routing metadata on wrapper for scanner
             wrapper.__remote_config__ = routing_config
+            wrapper.__call_planner__ = planner
+            wrapper.refresh = planner.invalidate
+            wrapper.map = map_over
+            wrapper.submit = submit
+            wrapper.result_cache = result_cache
             return wrapper
 
     return decorator
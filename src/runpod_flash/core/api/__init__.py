@@ -1,6 +1,8 @@
+from .endpoint import EndpointClient
 from .runpod import RunpodGraphQLClient, RunpodRestClient
 
 __all__ = [
+    "EndpointClient",
     "RunpodGraphQLClient",
     "RunpodRestClient",
 ]
@@ -0,0 +1,108 @@
+"""
+Async client for the serverless endpoint API (/run, /runsync, /status, /cancel,
+/health).
+
+Replaces the synchronous runpod SDK calls for job traffic: requests go through
+a pooled keep-alive httpx client shared per API host, so many in-flight jobs
+can be driven from one event loop without a thread per call.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from runpod_flash.core.utils.http import get_shared_httpx_client
+
+log = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT_BASE_URL = "https://api.runpod.ai/v2"
+
+# Request timeouts in seconds
+RUNSYNC_TIMEOUT = 60.0
+REQUEST_TIMEOUT = 10.0
+
+
+class EndpointClient:
+    """Async client for one serverless endpoint's job API.
+
+    Args:
+        endpoint_id: Serverless endpoint ID
+        base_url: Endpoint API base URL (default: https://api.runpod.ai/v2)
+    """
+
+    def __init__(self, endpoint_id: str, base_url: Optional[str] = None):
+        self.endpoint_id = endpoint_id
+        self.base_url = (base_url or DEFAULT_ENDPOINT_BASE_URL).rstrip("/")
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: float = REQUEST_TIMEOUT,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send a request to the endpoint and return the decoded JSON body.
+
+        Raises:
+            httpx.HTTPStatusError: If the API answers with an error status
+            httpx.RequestError: If the request fails
+        """
+        client = get_shared_httpx_client(self.base_url)
+        response = await client.request(
+            method,
+            f"/{self.endpoint_id}/{path}",
+            json=json,
+            params=params,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a job. Payloads without an "input" key are wrapped in one.
+
+        Returns:
+            Job dict with "id" and "status"
+        """
+        if "input" not in payload:
+            payload = {"input": payload}
+        return await self._request("POST", "run", payload)
+
+    async def run_sync(
+        self,
+        payload: Dict[str, Any],
+        timeout: float = RUNSYNC_TIMEOUT,
+        wait: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run a job and wait for its result.
+
+        Payloads without an "input" key are wrapped in one.
+
+        Args:
+            payload: Job payload
+            timeout: HTTP request timeout in seconds
+            wait: Server-side wait in seconds before /runsync returns an
+                unfinished job (default: the API's own limit)
+
+        Returns:
+            Job dict; "status" is not terminal if the job outlived the
+            server-side wait, and the job keeps running under its "id"
+        """
+        if "input" not in payload:
+            payload = {"input": payload}
+        params = {"wait": int(wait * 1000)} if wait is not None else None
+        return await self._request(
+            "POST", "runsync", payload, timeout=timeout, params=params
+        )
+
+    async def status(self, job_id: str) -> Dict[str, Any]:
+        """Fetch a job, including its output once it is finished."""
+        return await self._request("GET", f"status/{job_id}")
+
+    async def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a queued or running job."""
+        return await self._request("POST", f"cancel/{job_id}")
+
+    async def health(self) -> Dict[str, Any]:
+        """Fetch worker and job counts of the endpoint."""
+        return await self._request("GET", "health")
@@ -0,0 +1,231 @@
+"""Background liveness tracking for deployed resources.
+
+`DeployableResource.is_deployed()` is a network round trip for serverless
+endpoints (``endpoint.health()``), and ResourceManager used to call it on every
+`get_or_deploy_resource` invocation. The monitor keeps a cached verdict per
+resource key, refreshes it from a background task with backoff and jitter, and
+only lets callers skip the probe while the verdict is healthy and fresh.
+
+Failed calls clear the verdict only when the failure points at the endpoint
+(see is_endpoint_failure); an exception raised by the remote function says
+nothing about the endpoint's health.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional
+
+import httpx
+
+from ..utils.backoff import get_backoff_delay
+from ..utils.singleton import SingletonMixin
+from .base import DeployableResource
+
+log = logging.getLogger(__name__)
+
+# Seconds between background checks of a healthy resource
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+# Verdicts older than this are treated as unknown
+DEFAULT_HEALTH_STALENESS_BUDGET = 60.0
+# Base delay for re-checking an unhealthy resource (exponential backoff)
+DEFAULT_HEALTH_RETRY_BASE = 1.0
+# Fractional jitter applied to every scheduled check
+DEFAULT_HEALTH_JITTER = 0.2
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """Whether a failed call points at the endpoint rather than user code.
+
+    Transport errors, timeouts and HTTP 5xx responses count, also when a stub
+    wrapped them (followed through __cause__). Errors raised by the remote
+    function and HTTP 4xx responses do not.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, httpx.HTTPStatusError):
+            return current.response.status_code >= 500
+        if isinstance(
+            current,
+            (httpx.TransportError, ConnectionError, TimeoutError, asyncio.TimeoutError),
+        ):
+            return True
+        current = current.__cause__
+    return False
+
+
+class HealthState(str, Enum):
+    """Cached liveness verdict for a resource."""
+
+    UNKNOWN = "unknown"
+    HEALTHY = "healthy"
+    UNHEALTHY = "unhealthy"
+
+
+@dataclass
+class _HealthRecord:
+    resource: DeployableResource
+    healthy: Optional[bool] = None
+    checked_at: float = 0.0
+    next_check_at: float = 0.0
+    failures: int = 0
+
+
+class ResourceHealthMonitor(SingletonMixin):
+    """Shared, event-loop driven health tracker for known resources.
+
+    Resources are registered with watch(). A single background task per event
+    loop re-probes them: healthy resources every ``check_interval`` seconds,
+    unhealthy ones with exponential backoff. Probes run in a worker thread so
+    synchronous SDK health checks never block the event loop.
+    """
+
+    def __init__(
+        self,
+        check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        staleness_budget: float = DEFAULT_HEALTH_STALENESS_BUDGET,
+        retry_base: float = DEFAULT_HEALTH_RETRY_BASE,
+        jitter: float = DEFAULT_HEALTH_JITTER,
+    ):
+        # SingletonMixin re-runs __init__ on every instantiation
+        if getattr(self, "_initialized", False):
+            return
+
+        self.check_interval = check_interval
+        self.staleness_budget = staleness_budget
+        self.retry_base = retry_base
+        self.jitter = jitter
+        self._records: Dict[str, _HealthRecord] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._initialized = True
+
+    def watch(self, key: str, resource: DeployableResource) -> None:
+        """Start tracking a resource, resetting state if the object changed."""
+        record = self._records.get(key)
+        if record is None or record.resource is not resource:
+            # Callers probe unknown resources themselves; background follows later
+            self._records[key] = _HealthRecord(
+                resource=resource,
+                next_check_at=time.monotonic() + self.check_interval,
+            )
+        self._ensure_running()
+
+    def forget(self, key: str) -> None:
+        """Stop tracking a resource key."""
+        self._records.pop(key, None)
+
+    def get_state(self, key: str) -> HealthState:
+        """Return the cached verdict, or UNKNOWN when missing or stale."""
+        record = self._records.get(key)
+        if record is None or record.healthy is None:
+            return HealthState.UNKNOWN
+        if time.monotonic() - record.checked_at > self.staleness_budget:
+            return HealthState.UNKNOWN
+        return HealthState.HEALTHY if record.healthy else HealthState.UNHEALTHY
+
+    def mark_failed(self, key: str) -> None:
+        """Invalidate the verdict after an endpoint failure so the next use re-probes."""
+        record = self._records.get(key)
+        if record is not None:
+            record.healthy = None
+
+    def record(self, key: str, healthy: bool) -> None:
+        """Store a probe result and schedule the next background check."""
+        record = self._records.get(key)
+        if record is None:
+            return
+
+        now = time.monotonic()
+        record.healthy = healthy
+        record.checked_at = now
+
+        if healthy:
+            record.failures = 0
+            delay = self.check_interval * random.uniform(
+                1 - self.jitter, 1 + self.jitter
+            )
+        else:
+            delay = get_backoff_delay(
+                record.failures,
+                base=self.retry_base,
+                max_seconds=self.check_interval,
+                jitter=self.jitter,
+            )
+            record.failures += 1
+
+        record.next_check_at = now + delay
+
+    async def check_now(self, key: str, resource: DeployableResource) -> bool:
+        """Probe a resource synchronously (off-loop) and cache the result."""
+        self.watch(key, resource)
+        healthy = await self._probe(key, resource)
+        self.record(key, healthy)
+        return healthy
+
+    @staticmethod
+    async def _probe(key: str, resource: DeployableResource) -> bool:
+        try:
+            return bool(await asyncio.to_thread(resource.is_deployed))
+        except Exception as e:
+            log.debug(f"Health check for {key} raised: {e}")
+            return False
+
+    def _ensure_running(self) -> None:
+        """Start the background task on the current event loop if needed."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+
+        self._task = loop.create_task(self._run(), name="flash-health-monitor")
+
+    async def _run(self) -> None:
+        while self._records:
+            now = time.monotonic()
+            due = [
+                (key, record.resource)
+                for key, record in list(self._records.items())
+                if record.next_check_at <= now
+            ]
+
+            for key, resource in due:
+                await self._background_check(key, resource)
+
+            next_due = min(
+                (r.next_check_at for r in self._records.values()),
+                default=now + self.check_interval,
+            )
+            await asyncio.sleep(
+                min(max(next_due - time.monotonic(), 0.0), self.check_interval)
+            )
+
+    async def _background_check(self, key: str, resource: DeployableResource) -> None:
+        record = self._records.get(key)
+        # Skip resources replaced or forgotten while earlier probes ran
+        if record is None or record.resource is not resource:
+            return
+
+        healthy = await self._probe(key, resource)
+        if self._records.get(key) is record:
+            if not healthy:
+                log.debug(f"Background health check: {key} is unhealthy")
+            self.record(key, healthy)
+
+    async def stop(self) -> None:
+        """Cancel the background task (e.g. on shutdown)."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
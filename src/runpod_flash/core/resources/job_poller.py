@@ -0,0 +1,255 @@
+"""Multiplexed status polling for queue-based serverless jobs.
+
+`ServerlessResource.run` used to run its own polling loop per job, so thousands
+of concurrent jobs meant thousands of independent pollers and an unbounded
+/status request rate. A JobPoller tracks every outstanding job of one endpoint,
+schedules their status checks on a single timer heap, paces the requests to a
+maximum rate and resolves the futures of the job's waiters once it reaches a
+terminal state.
+
+Check intervals adapt per job: while a job is younger than the endpoint's
+typical runtime (moving average of ``delayTime + executionTime`` over completed
+jobs) the next check is aimed at that expected finish; after that, and when
+nothing is known yet, checks back off exponentially while the status is
+unchanged.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..api.endpoint import EndpointClient
+from ..utils.backoff import get_backoff_delay
+
+log = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = frozenset({"COMPLETED", "FAILED", "CANCELLED", "TIMED_OUT"})
+
+# Bounds of the per-job check interval, in seconds
+DEFAULT_MIN_POLL_INTERVAL = 0.1
+DEFAULT_MAX_POLL_INTERVAL = 10.0
+# Maximum /status requests per second per endpoint
+DEFAULT_STATUS_QPS = 50.0
+# Weight of the latest completed job in the runtime moving average
+RUNTIME_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class _PolledJob:
+    job_id: str
+    submitted_at: float
+    # One future per waiter, so a cancelled waiter does not cancel the others
+    waiters: List[asyncio.Future] = field(default_factory=list)
+    status: Optional[str] = None
+    attempt: int = 0
+
+    def resolve(
+        self,
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Resolve every waiting future with a response or an error."""
+        waiters, self.waiters = self.waiters, []
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if error is not None:
+                waiter.set_exception(error)
+            else:
+                waiter.set_result(response)
+
+
+@dataclass
+class JobPoller:
+    """Shared status poller for the outstanding jobs of one endpoint.
+
+    Use get_job_poller() to obtain the poller of an endpoint on the running
+    event loop. A background task runs while jobs are outstanding.
+
+    Attributes:
+        client: Job API client of the endpoint
+        min_interval: Shortest delay between two checks of a job
+        max_interval: Longest delay between two checks of a job
+        max_qps: Maximum status requests per second
+    """
+
+    client: EndpointClient
+    min_interval: float = DEFAULT_MIN_POLL_INTERVAL
+    max_interval: float = DEFAULT_MAX_POLL_INTERVAL
+    max_qps: float = DEFAULT_STATUS_QPS
+    expected_runtime: Optional[float] = None
+    _jobs: Dict[str, _PolledJob] = field(default_factory=dict, init=False)
+    _heap: List[Tuple[float, int, str]] = field(default_factory=list, init=False)
+    _seq: Any = field(default_factory=itertools.count, init=False)
+    _next_slot: float = field(default=0.0, init=False)
+    _wakeup: Optional[asyncio.Event] = field(default=None, init=False)
+    _task: Optional[asyncio.Task] = field(default=None, init=False)
+    _checks: set = field(default_factory=set, init=False)
+
+    async def wait(self, job_id: str) -> Dict[str, Any]:
+        """Wait until a job reaches a terminal status.
+
+        Args:
+            job_id: ID of a job submitted to this endpoint
+
+        Returns:
+            The job's final /status response, including its output
+
+        Raises:
+            Exception: If a status request fails
+        """
+        # A cancelled waiter cancels its own future; the job is dropped once
+        # no waiter is left
+        return await self.track(job_id)
+
+    def track(self, job_id: str) -> asyncio.Future:
+        """Start polling a job without a waiting coroutine.
+
+        Args:
+            job_id: ID of a job submitted to this endpoint
+
+        Returns:
+            A new future, resolved with the job's final /status response (or
+            the status request's exception). Each call gets its own future;
+            cancelling it affects no other waiter, and polling stops once
+            every future of the job is cancelled. The job itself keeps
+            running.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            now = time.monotonic()
+            job = _PolledJob(job_id=job_id, submitted_at=now)
+            self._jobs[job_id] = job
+            self._schedule(job, now)
+        waiter = asyncio.get_running_loop().create_future()
+        job.waiters.append(waiter)
+        waiter.add_done_callback(lambda done: self._discard_waiter(job, done))
+        return waiter
+
+    @staticmethod
+    def _discard_waiter(job: _PolledJob, waiter: asyncio.Future) -> None:
+        if waiter.cancelled() and waiter in job.waiters:
+            job.waiters.remove(waiter)
+
+    @property
+    def outstanding(self) -> int:
+        """Number of jobs being polled."""
+        return len(self._jobs)
+
+    def _next_delay(self, job: _PolledJob, now: float) -> float:
+        """Delay until the next check of a job."""
+        expected = self.expected_runtime
+        age = now - job.submitted_at
+        if expected is not None and age < expected:
+            delay = expected - age
+        else:
+            delay = get_backoff_delay(
+                job.attempt, base=self.min_interval, max_seconds=self.max_interval
+            )
+        return min(max(delay, self.min_interval), self.max_interval)
+
+    def _schedule(self, job: _PolledJob, now: float) -> None:
+        due = now + self._next_delay(job, now)
+        heapq.heappush(self._heap, (due, next(self._seq), job.job_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+        self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="flash-job-poller")
+
+    async def _run(self) -> None:
+        while self._heap:
+            due, _, job_id = self._heap[0]
+            now = time.monotonic()
+            if due > now:
+                # Sleep until the earliest check, or until an earlier one is added
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), due - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue
+            if not job.waiters:
+                # Every waiter went away
+                self._jobs.pop(job_id, None)
+                continue
+
+            # Pace requests to max_qps across all jobs
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.max_qps
+            if slot > now:
+                await asyncio.sleep(slot - now)
+
+            check = asyncio.ensure_future(self._check(job))
+            self._checks.add(check)
+            check.add_done_callback(self._checks.discard)
+
+    async def _check(self, job: _PolledJob) -> None:
+        try:
+            response = await self.client.status(job.job_id)
+        except Exception as e:
+            self._jobs.pop(job.job_id, None)
+            job.resolve(error=e)
+            return
+
+        status = response.get("status")
+        if status in TERMINAL_JOB_STATUSES:
+            self._jobs.pop(job.job_id, None)
+            self._observe_runtime(response)
+            job.resolve(response)
+            return
+
+        if status == job.status:
+            job.attempt += 1
+        else:
+            log.debug(f"Job:{job.job_id} | Status: {status}")
+            job.status = status
+            job.attempt = 0
+        self._schedule(job, time.monotonic())
+
+    def _observe_runtime(self, response: Dict[str, Any]) -> None:
+        """Fold a finished job's queue and execution time into the average."""
+        if response.get("status") != "COMPLETED":
+            return
+        try:
+            runtime = (
+                response.get("delayTime", 0) + response.get("executionTime", 0)
+            ) / 1000
+        except TypeError:
+            return
+        if self.expected_runtime is None:
+            self.expected_runtime = runtime
+        else:
+            self.expected_runtime += RUNTIME_EWMA_ALPHA * (
+                runtime - self.expected_runtime
+            )
+
+
+# Pollers per event loop, keyed by endpoint API base URL and endpoint ID
+_POLLERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], JobPoller]]" = weakref.WeakKeyDictionary()
+
+
+def get_job_poller(client: EndpointClient) -> JobPoller:
+    """Get the shared poller of an endpoint on the running event loop."""
+    pollers = _POLLERS.setdefault(asyncio.get_running_loop(), {})
+    key = (client.base_url, client.endpoint_id)
+    poller = pollers.get(key)
+    if poller is None:
+        poller = pollers[key] = JobPoller(client)
+    return poller
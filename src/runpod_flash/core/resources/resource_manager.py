@@ -10,6 +10,7 @@ from ..utils.singleton import SingletonMixin
 from ..utils.file_lock import file_lock, FileLockError
 
 from .base import DeployableResource
+from .health_monitor import HealthState, ResourceHealthMonitor
 
 
 log = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class ResourceManager(SingletonMixin):
     # Class variables shared across all instances (singleton)
     _resources: Dict[str, DeployableResource] = {}
     _resource_configs: Dict[str, str] = {}  # Tracks config hashes for drift detection
+    _resource_generations: Dict[str, int] = {}  # Bumped on every add/remove of a key
     _deployment_locks: Dict[str, asyncio.Lock] = {}
     _global_lock: Optional[asyncio.Lock] = None
     _lock_initialized = False
@@ -157,10 +159,28 @@ class ResourceManager(SingletonMixin):
             log.error(f"Failed to save resources to {RESOURCE_STATE_FILE}: {e}")
             raise
 
+    @classmethod
+    def get_resource_generation(cls, uid: str) -> int:
+        """Get the change counter for a tracked resource key.
+
+        The counter increases every time the resource stored under ``uid`` is
+        added, replaced or removed. Callers caching a resolved resource can
+        compare generations to detect redeployments and config drift updates
+        without recomputing config hashes.
+        """
+        return cls._resource_generations.get(uid, 0)
+
+    def _bump_generation(self, uid: str) -> None:
+        ResourceManager._resource_generations[uid] = (
+            ResourceManager._resource_generations.get(uid, 0) + 1
+        )
+
     def _add_resource(self, uid: str, resource: DeployableResource):
         """Add a resource to the manager (protected method for internal use)."""
         self._resources[uid] = resource
         self._resource_configs[uid] = resource.config_hash
+        self._bump_generation(uid)
+        ResourceHealthMonitor().forget(uid)  # Verdicts belong to the old object
         self._save_resources()
 
     def _remove_resource(self, uid: str):
@@ -171,6 +191,8 @@ class ResourceManager(SingletonMixin):
 
         del self._resources[uid]
         self._resource_configs.pop(uid, None)  # Remove config hash too
+        self._bump_generation(uid)
+        ResourceHealthMonitor().forget(uid)
         log.debug(f"Removed resource {uid}")
 
         self._save_resources()
@@ -201,6 +223,19 @@ class ResourceManager(SingletonMixin):
             error_msg = f"Cannot deploy resource '{config.name}': {str(e)}"
             raise RunpodAPIKeyError(error_msg) from e
 
+    async def _is_healthy(self, uid: str, resource: DeployableResource) -> bool:
+        """Check resource liveness, preferring the health monitor's cached verdict.
+
+        A fresh healthy verdict skips the probe entirely. Unknown, stale or
+        unhealthy verdicts (including right after a failed call) trigger a
+        synchronous check that runs off the event loop.
+        """
+        monitor = ResourceHealthMonitor()
+        monitor.watch(uid, resource)
+        if monitor.get_state(uid) is HealthState.HEALTHY:
+            return True
+        return await monitor.check_now(uid, resource)
+
     async def get_resource_from_store(self, uid: str):
         return self._resources.get(uid)
 
@@ -249,7 +284,7 @@ class ResourceManager(SingletonMixin):
             if existing:
                 log.debug(f"Resource found in cache: {resource_key}")
                 # Resource exists - check if still valid
-                if not existing.is_deployed():
+                if not await self._is_healthy(resource_key, existing):
                     log.warning(f"{existing} is no longer valid, redeploying.")
                     self._remove_resource(resource_key)
                     try:
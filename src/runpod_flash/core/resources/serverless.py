@@ -2,8 +2,9 @@ import asyncio
 import logging
 import os
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Set
 
+import httpx
 from pydantic import (
     BaseModel,
     Field,
@@ -11,24 +12,33 @@ from pydantic import (
     field_validator,
     model_validator,
 )
-from runpod.endpoint.runner import Job
-
+from ..api.endpoint import REQUEST_TIMEOUT, RUNSYNC_TIMEOUT
 from ..api.runpod import RunpodGraphQLClient
-from ..utils.backoff import get_backoff_delay
 from .base import DeployableResource
 from .cloud import runpod
 from .constants import CONSOLE_URL
 from .environment import EnvironmentVars
+from .job_poller import TERMINAL_JOB_STATUSES
 from .cpu import CpuInstanceType
 from .gpu import GpuGroup, GpuType
 from .network_volume import NetworkVolume, DataCenter
 from .template import KeyValuePair, PodTemplate
 from .resource_manager import ResourceManager
 
+if TYPE_CHECKING:
+    from ..api.endpoint import EndpointClient
+
+# EndpointClient and get_job_poller are imported where they are used: they
+# reach per-event-loop weak registries, which cannot be pickled, and resource
+# classes are pickled by value when their module was reloaded
+
 
 # Prefix applied to endpoint names during live provisioning
 LIVE_PREFIX = "live-"
 
+# Seconds run_hybrid lets /runsync wait before polling the job instead
+HYBRID_RUNSYNC_WAIT = 5.0
+
 
 # Environment variables are loaded from the .env file
 def get_env_vars() -> Dict[str, str]:
@@ -198,6 +208,17 @@ class ServerlessResource(DeployableResource):
             raise ValueError("Missing self.id")
         return runpod.Endpoint(self.id)
 
+    @property
+    def endpoint_client(self) -> "EndpointClient":
+        """
+        Returns the async job API client for this serverless resource.
+        """
+        if not self.id:
+            raise ValueError("Missing self.id")
+        from ..api.endpoint import EndpointClient
+
+        return EndpointClient(self.id, runpod.endpoint_url_base)
+
     @property
     def endpoint_url(self) -> str:
         base_url = self.endpoint.rp_client.endpoint_url_base
@@ -688,82 +709,111 @@ class ServerlessResource(DeployableResource):
         if not self.id:
             raise ValueError("Serverless is not deployed")
 
-        def _fetch_job():
-            return self.endpoint.rp_client.post(
-                f"{self.id}/runsync", payload, timeout=60
-            )
+        client = self.endpoint_client
 
         try:
             # log.debug(f"[{self}] Payload: {payload}")
 
             log.info(f"{self} | API /run_sync")
-            response = await asyncio.to_thread(_fetch_job)
+            response = await client.run_sync(payload)
             return JobOutput(**response)
 
         except Exception as e:
-            health = await asyncio.to_thread(self.endpoint.health)
-            health = ServerlessHealth(**health)
+            health = ServerlessHealth(**await client.health())
             log.info(f"{self} | Health {health.workers.status}")
             log.error(f"{self} | Exception: {e}")
             raise
 
-    async def run(self, payload: Dict[str, Any]) -> "JobOutput":
+    async def run_hybrid(
+        self, payload: Dict[str, Any], wait: float = HYBRID_RUNSYNC_WAIT
+    ) -> "JobOutput":
         """
-        Executes a serverless endpoint async request with the payload.
+        Executes a serverless endpoint request via /runsync with a short
+        server-side wait; jobs still running after it are polled to completion
+        like run() without being resubmitted.
+
+        The HTTP timeout leaves the API room to hold /runsync past the
+        requested wait. If the call fails or is cancelled (e.g. by a caller's
+        timeout) once the job ID is known, the job is cancelled. /runsync
+        reports the ID only in its response, so a job whose /runsync request
+        timed out cannot be cancelled; that raises TimeoutError.
         Returns a JobOutput object.
         """
         if not self.id:
             raise ValueError("Serverless is not deployed")
 
-        job: Optional[Job] = None
+        client = self.endpoint_client
+        job_id: Optional[str] = None
+        timeout = max(wait, RUNSYNC_TIMEOUT) + REQUEST_TIMEOUT
 
         try:
-            # log.debug(f"[{self}] Payload: {payload}")
-
-            # Create a job using the endpoint
-            log.info(f"{self} | API /run")
-            job = await asyncio.to_thread(self.endpoint.run, request_input=payload)
+            log.info(f"{self} | API /runsync (wait {wait}s)")
+            try:
+                job = await client.run_sync(payload, timeout=timeout, wait=wait)
+            except httpx.TimeoutException as e:
+                raise TimeoutError(
+                    f"/runsync did not answer within {timeout}s; the job may "
+                    f"still be running on {self}"
+                ) from e
+            job_id = job.get("id")
+
+            if job.get("status") not in TERMINAL_JOB_STATUSES:
+                log.info(f"{self} | Job:{job_id} still {job.get('status')}, polling")
+                from .job_poller import get_job_poller
+
+                job = await get_job_poller(client).wait(job_id)
+            return JobOutput(**job)
+
+        except asyncio.CancelledError:
+            # The caller gave up on the job (e.g. its own timeout)
+            await self._cancel_job(client, job_id)
+            raise
 
-            log_subgroup = f"Job:{job.job_id}"
+        except Exception as e:
+            await self._cancel_job(client, job_id)
+            log.error(f"{self} | Exception: {e}")
+            raise
 
-            log.info(f"{self} | Started {log_subgroup}")
+    async def _cancel_job(self, client: "EndpointClient", job_id: Optional[str]):
+        """Cancel a started job, logging instead of raising on failure."""
+        if not job_id:
+            return
+        log.info(f"{self} | Cancelling job {job_id}")
+        try:
+            await client.cancel(job_id)
+        except Exception as e:
+            log.warning(f"{self} | Failed to cancel job {job_id}: {e}")
 
-            current_pace = 0
-            attempt = 0
-            job_status = Status.UNKNOWN
-            last_status = job_status
+    async def run(self, payload: Dict[str, Any]) -> "JobOutput":
+        """
+        Executes a serverless endpoint async request with the payload.
+        Returns a JobOutput object.
+        """
+        if not self.id:
+            raise ValueError("Serverless is not deployed")
 
-            # Poll for job status
-            while True:
-                await asyncio.sleep(current_pace)
+        client = self.endpoint_client
+        job_id: Optional[str] = None
 
-                # Check job status
-                job_status = await asyncio.to_thread(job.status)
+        try:
+            # log.debug(f"[{self}] Payload: {payload}")
 
-                if last_status == job_status:
-                    # nothing changed, increase the gap
-                    attempt += 1
-                    indicator = "." * (attempt // 2) if attempt % 2 == 0 else ""
-                    if indicator:
-                        log.info(f"{log_subgroup} | {indicator}")
-                else:
-                    # status changed, reset the gap
-                    log.info(f"{log_subgroup} | Status: {job_status}")
-                    attempt = 0
+            # Create a job using the endpoint
+            log.info(f"{self} | API /run")
+            job_id = (await client.run(payload))["id"]
 
-                last_status = job_status
+            log.info(f"{self} | Started Job:{job_id}")
 
-                # Adjust polling pace appropriately
-                current_pace = get_backoff_delay(attempt)
+            # Status checks are multiplexed with other jobs of this endpoint
+            from .job_poller import get_job_poller
 
-                if job_status in ("COMPLETED", "FAILED", "CANCELLED"):
-                    response = await asyncio.to_thread(job._fetch_job)
-                    return JobOutput(**response)
+            job = await get_job_poller(client).wait(job_id)
+            return JobOutput(**job)
 
         except Exception as e:
-            if job and job.job_id:
-                log.info(f"{self} | Cancelling job {job.job_id}")
-                await asyncio.to_thread(job.cancel)
+            if job_id:
+                log.info(f"{self} | Cancelling job {job_id}")
+                await client.cancel(job_id)
 
             log.error(f"{self} | Exception: {e}")
             raise
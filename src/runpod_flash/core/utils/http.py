@@ -1,10 +1,135 @@
 """HTTP utilities for RunPod API communication."""
 
+import asyncio
+import atexit
+import logging
 import os
-from typing import Optional
+import weakref
+from typing import Dict, Optional, Tuple
 
 import httpx
 import requests
+import runpod
+
+try:
+    # HTTP/2 support for httpx (optional "http2" extra)
+    import h2  # noqa: F401
+except ImportError:
+    h2 = None
+
+log = logging.getLogger(__name__)
+
+# Connection pool limits of shared clients, overridable with
+# FLASH_HTTP_MAX_CONNECTIONS, FLASH_HTTP_MAX_KEEPALIVE and
+# FLASH_HTTP_KEEPALIVE_EXPIRY
+SHARED_CLIENT_MAX_CONNECTIONS = 200
+SHARED_CLIENT_MAX_KEEPALIVE = 50
+SHARED_CLIENT_KEEPALIVE_EXPIRY = 60.0
+
+# Shared clients per event loop (httpx pools are bound to the loop they run on),
+# keyed by base URL and API key
+_SHARED_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Optional[str]], httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+def _api_key() -> Optional[str]:
+    """API key for job traffic: runpod.api_key, else RUNPOD_API_KEY."""
+    return runpod.api_key or os.environ.get("RUNPOD_API_KEY")
+
+
+def _auth_headers() -> Dict[str, str]:
+    """Authorization header for the API key (see _api_key), if set."""
+    api_key = _api_key()
+    return {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+
+def shared_client_limits() -> httpx.Limits:
+    """Connection pool limits of shared clients, from FLASH_HTTP_* or defaults."""
+    return httpx.Limits(
+        max_connections=int(
+            os.getenv("FLASH_HTTP_MAX_CONNECTIONS", str(SHARED_CLIENT_MAX_CONNECTIONS))
+        ),
+        max_keepalive_connections=int(
+            os.getenv("FLASH_HTTP_MAX_KEEPALIVE", str(SHARED_CLIENT_MAX_KEEPALIVE))
+        ),
+        keepalive_expiry=float(
+            os.getenv(
+                "FLASH_HTTP_KEEPALIVE_EXPIRY", str(SHARED_CLIENT_KEEPALIVE_EXPIRY)
+            )
+        ),
+    )
+
+
+def shared_client_http2() -> bool:
+    """Whether shared clients negotiate HTTP/2.
+
+    Enabled when the h2 package is installed, unless FLASH_HTTP2=false. With
+    HTTP/2 concurrent requests to a host are multiplexed over one connection.
+    """
+    if h2 is None:
+        return False
+    return os.getenv("FLASH_HTTP2", "true").lower() in ("1", "true", "yes")
+
+
+def get_shared_httpx_client(base_url: str) -> httpx.AsyncClient:
+    """Get the pooled keep-alive httpx AsyncClient for a host.
+
+    Unlike get_authenticated_httpx_client, the client is shared by every
+    caller on the running event loop and must not be closed by them;
+    connections stay open between requests instead of being re-established
+    per call (see shared_client_limits and shared_client_http2). Requests
+    pass their own timeout and may use absolute URLs.
+
+    Args:
+        base_url: Base URL requests are made relative to
+
+    Returns:
+        Shared httpx.AsyncClient with Authorization header
+    """
+    loop = asyncio.get_running_loop()
+    clients = _SHARED_CLIENTS.setdefault(loop, {})
+    key = (base_url, _api_key())
+
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=_auth_headers(),
+            timeout=30.0,
+            limits=shared_client_limits(),
+            http2=shared_client_http2(),
+        )
+        clients[key] = client
+    return client
+
+
+async def close_shared_httpx_clients() -> None:
+    """Close the shared clients of the running event loop.
+
+    Call on shutdown (e.g. from a FastAPI lifespan) to release pooled
+    connections gracefully; later calls to get_shared_httpx_client open new
+    clients.
+    """
+    clients = _SHARED_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+@atexit.register
+def _close_shared_clients_at_exit() -> None:
+    """Close shared clients whose event loop can still run at interpreter exit.
+
+    Clients of closed loops (e.g. after asyncio.run) are dropped; their
+    sockets are released with the process.
+    """
+    for loop, clients in list(_SHARED_CLIENTS.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+        for client in clients.values():
+            try:
+                loop.run_until_complete(client.aclose())
+            except Exception as e:
+                log.debug(f"Failed to close shared HTTP client: {e}")
+    _SHARED_CLIENTS.clear()
 
 
 def get_authenticated_httpx_client(
@@ -12,9 +137,10 @@ def get_authenticated_httpx_client(
 ) -> httpx.AsyncClient:
     """Create httpx AsyncClient with RunPod authentication.
 
-    Automatically includes Authorization header if RUNPOD_API_KEY is set.
-    This provides a centralized place to manage authentication headers for
-    all RunPod HTTP requests, avoiding repetitive manual header addition.
+    Automatically includes Authorization header if an API key is set
+    (runpod.api_key or RUNPOD_API_KEY). This provides a centralized place to
+    manage authentication headers for all RunPod HTTP requests, avoiding
+    repetitive manual header addition.
 
     Args:
         timeout: Request timeout in seconds. Defaults to 30.0.
@@ -30,10 +156,7 @@ def get_authenticated_httpx_client(
         async with get_authenticated_httpx_client(timeout=60.0) as client:
             response = await client.get(url)
     """
-    headers = {}
-    api_key = os.environ.get("RUNPOD_API_KEY")
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
+    headers = _auth_headers()
 
     timeout_config = timeout if timeout is not None else 30.0
     return httpx.AsyncClient(timeout=timeout_config, headers=headers)
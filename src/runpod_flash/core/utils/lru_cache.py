@@ -9,7 +9,7 @@ Thread-safe for concurrent access.
 
 import threading
 from collections import OrderedDict
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 
 class LRUCache:
@@ -20,37 +20,83 @@ class LRUCache:
     the maximum size limit. Provides dict-like interface with O(1) operations.
     Thread-safe for concurrent access using RLock.
 
+    With max_bytes, items are also evicted while the summed sizeof() of the
+    cached values exceeds it; a value larger than max_bytes is not cached.
+
     Args:
         max_size: Maximum number of items to store in cache (default: 1000)
+        max_bytes: Optional size budget of the cached values
+        sizeof: Size of a value in bytes, required with max_bytes
     """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("sizeof is required with max_bytes")
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes = 0
+        self._sizeof = sizeof
+        self._sizes: Dict[str, int] = {}
         self._lock = threading.RLock()
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get item from cache, moving it to end (most recent) if found."""
         with self._lock:
             if key in self.cache:
+                self.hits += 1
                 self.cache.move_to_end(key)
                 return self.cache[key]
+            self.misses += 1
             return None
 
     def set(self, key: str, value: Dict[str, Any]) -> None:
         """Set item in cache, evicting oldest if at capacity."""
         with self._lock:
+            size = self._sizeof(value) if self._sizeof else 0
+            if self.max_bytes is not None and size > self.max_bytes:
+                self._pop(key)
+                return
             if key in self.cache:
                 self.cache.move_to_end(key)
+                self.total_bytes -= self._sizes.get(key, 0)
             else:
                 if len(self.cache) >= self.max_size:
-                    self.cache.popitem(last=False)  # Remove oldest
+                    self._pop(next(iter(self.cache)))  # Remove oldest
             self.cache[key] = value
+            self._sizes[key] = size
+            self.total_bytes += size
+            while self.max_bytes is not None and self.total_bytes > self.max_bytes:
+                self._pop(next(iter(self.cache)))
+
+    def _pop(self, key: str) -> None:
+        if key in self.cache:
+            del self.cache[key]
+            self.total_bytes -= self._sizes.pop(key, 0)
+
+    def stats(self) -> Dict[str, int]:
+        """Item count, value bytes, hits and misses of get() lookups."""
+        with self._lock:
+            return {
+                "size": len(self.cache),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
 
     def clear(self) -> None:
         """Clear all items from cache."""
         with self._lock:
             self.cache.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
 
     def __contains__(self, key: str) -> bool:
         """Check if key exists in cache."""
@@ -66,8 +112,10 @@ class LRUCache:
         """Get item using bracket notation, moving to end if found."""
         with self._lock:
             if key in self.cache:
+                self.hits += 1
                 self.cache.move_to_end(key)
                 return self.cache[key]
+            self.misses += 1
             raise KeyError(key)
 
     def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
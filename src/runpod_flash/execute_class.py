@@ -3,30 +3,79 @@ Class execution module for remote class instantiation and method calls.
 
 This module provides functionality to create and execute remote class instances,
 with automatic caching of class serialization data to improve performance and
-prevent memory leaks through LRU eviction.
+prevent memory leaks through LRU eviction (bounded by entry count and by
+FLASH_CLASS_CACHE_MAX_BYTES).
+
+Method calls follow a session protocol: calls carry the class code and
+constructor arguments until the worker reports keeping the instance alive
+(see runtime.instance_pool); later calls send only the instance ID, method
+name and arguments, and re-establish the instance if the worker no longer
+has it. instance.pipeline() sends several method calls in one request (see
+runpod_flash.pipeline).
 """
 
 import hashlib
 import inspect
 import logging
+import os
+import pickle
 import textwrap
+import threading
 import uuid
-from typing import List, Optional, Type
-
-import cloudpickle
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from .core.resources import ResourceManager, ServerlessResource
 from .core.utils.constants import HASH_TRUNCATE_LENGTH, UUID_FALLBACK_LENGTH
 from .core.utils.lru_cache import LRUCache
+from .pipeline import Pipeline
 from .protos.remote_execution import FunctionRequest
-from .runtime.exceptions import SerializationError
+from .runtime.exceptions import SerializationError, UnknownInstanceError
 from .runtime.serialization import serialize_args, serialize_kwargs
 from .stubs import stub_resource
 
 log = logging.getLogger(__name__)
 
+# Serialized class data (class code and constructor arguments) shared by
+# remote instances with identical constructor arguments
+DEFAULT_CLASS_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+def _class_data_size(data: Any) -> int:
+    """Approximate size of a cached class data entry in bytes.
+
+    Entries without class data fall back to their pickled (or string) length.
+    """
+    if not isinstance(data, dict) or "class_code" not in data:
+        try:
+            return len(pickle.dumps(data))
+        except Exception:
+            return len(str(data))
+
+    size = len(data.get("class_code") or "")
+    size += sum(len(arg) for arg in data.get("constructor_args") or ())
+    size += sum(
+        len(key) + len(arg)
+        for key, arg in (data.get("constructor_kwargs") or {}).items()
+    )
+    return size
+
+
 # Global in-memory cache for serialized class data with LRU eviction
-_SERIALIZED_CLASS_CACHE = LRUCache(max_size=1000)
+_SERIALIZED_CLASS_CACHE = LRUCache(
+    max_size=1000,
+    max_bytes=int(
+        os.getenv("FLASH_CLASS_CACHE_MAX_BYTES", str(DEFAULT_CLASS_CACHE_MAX_BYTES))
+    ),
+    sizeof=_class_data_size,
+)
+
+# Clean class code and its SHA-256 per class object. Weak keys let classes
+# defined at runtime be collected; a redefined class is a new key.
+_CLASS_SOURCES: "weakref.WeakKeyDictionary[type, Tuple[str, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_class_sources_lock = threading.Lock()
 
 
 def serialize_constructor_args(args, kwargs):
@@ -34,57 +83,94 @@ def serialize_constructor_args(args, kwargs):
     return serialize_args(args), serialize_kwargs(kwargs)
 
 
-def get_or_cache_class_data(
-    cls: Type, args: tuple, kwargs: dict, cache_key: str
-) -> str:
-    """Get class code from cache or extract and cache it."""
-    if cache_key not in _SERIALIZED_CLASS_CACHE:
-        # Cache miss - extract and cache class code
-        clean_class_code = extract_class_code_simple(cls)
+def get_class_source(cls: Type) -> Tuple[str, str]:
+    """Clean class code and its SHA-256 hex digest, extracted once per class."""
+    with _class_sources_lock:
+        cached = _CLASS_SOURCES.get(cls)
+    if cached is None:
+        class_code = extract_class_code_simple(cls)
+        cached = (class_code, hashlib.sha256(class_code.encode()).hexdigest())
+        with _class_sources_lock:
+            _CLASS_SOURCES[cls] = cached
+    return cached
 
-        try:
-            serialized_args, serialized_kwargs = serialize_constructor_args(
-                args, kwargs
-            )
 
-            # Cache the serialized data
-            _SERIALIZED_CLASS_CACHE.set(
-                cache_key,
-                {
-                    "class_code": clean_class_code,
-                    "constructor_args": serialized_args,
-                    "constructor_kwargs": serialized_kwargs,
-                },
-            )
+def _constructor_digest(serialized_args: List[str], serialized_kwargs: dict) -> str:
+    """SHA-256 of serialized constructor arguments (keyword order ignored)."""
+    digest = hashlib.sha256()
+    for arg in serialized_args:
+        digest.update(arg.encode())
+        digest.update(b"\0")
+    for key, arg in sorted(serialized_kwargs.items()):
+        digest.update(f"\x01{key}=".encode())
+        digest.update(arg.encode())
+    return digest.hexdigest()
 
-            log.debug(f"Cached class data for {cls.__name__} with key: {cache_key}")
 
-        except (TypeError, AttributeError, OSError, SerializationError) as e:
-            log.warning(
-                f"Could not serialize constructor arguments for {cls.__name__}: {e}"
-            )
-            log.warning(
-                f"Skipping constructor argument caching for {cls.__name__} due to unserializable arguments"
-            )
+def _cache_key(cls: Type, class_hash: str, args_hash: str) -> str:
+    return (
+        f"{cls.__name__}_{class_hash[:HASH_TRUNCATE_LENGTH]}"
+        f"_{args_hash[:HASH_TRUNCATE_LENGTH]}"
+    )
 
-            # Store minimal cache entry to avoid repeated attempts
-            _SERIALIZED_CLASS_CACHE.set(
-                cache_key,
-                {
-                    "class_code": clean_class_code,
-                    "constructor_args": None,  # Signal that args couldn't be cached
-                    "constructor_kwargs": None,
-                },
-            )
 
-        return clean_class_code
+def _fallback_cache_key(cls: Type) -> str:
+    return f"{cls.__name__}_{uuid.uuid4().hex[:UUID_FALLBACK_LENGTH]}"
+
+
+def get_class_data(cls: Type, args: tuple, kwargs: dict) -> Tuple[str, Dict[str, Any]]:
+    """Get the cache key and serialized class data of a remote instance.
+
+    The class source is extracted and hashed once per class, and constructor
+    arguments are serialized once: their digest forms the cache key and the
+    serialized form is the request payload. Instances with identical
+    arguments share one cache entry.
+
+    Args:
+        cls: The class being instantiated remotely
+        args: Positional constructor arguments
+        kwargs: Keyword constructor arguments
+
+    Returns:
+        Tuple of (cache key, {"class_code", "constructor_args",
+        "constructor_kwargs"}); constructor arguments are None if they could
+        not be serialized, and the key is then unique to the instance
+    """
+    class_code, class_hash = get_class_source(cls)
+    try:
+        serialized_args, serialized_kwargs = serialize_constructor_args(args, kwargs)
+    except (TypeError, AttributeError, OSError, SerializationError) as e:
+        log.warning(
+            f"Could not serialize constructor arguments for {cls.__name__}: {e}"
+        )
+        log.warning(
+            f"Skipping constructor argument caching for {cls.__name__} due to unserializable arguments"
+        )
+        cache_key = _fallback_cache_key(cls)
+        data = {
+            "class_code": class_code,
+            "constructor_args": None,  # Signal that args couldn't be cached
+            "constructor_kwargs": None,
+        }
     else:
-        # Cache hit - retrieve cached data
-        cached_data = _SERIALIZED_CLASS_CACHE.get(cache_key)
-        log.debug(
-            f"Retrieved cached class data for {cls.__name__} with key: {cache_key}"
+        cache_key = _cache_key(
+            cls, class_hash, _constructor_digest(serialized_args, serialized_kwargs)
         )
-        return cached_data["class_code"]
+        cached = _SERIALIZED_CLASS_CACHE.get(cache_key)
+        if cached is not None:
+            log.debug(
+                f"Retrieved cached class data for {cls.__name__} with key: {cache_key}"
+            )
+            return cache_key, cached
+        data = {
+            "class_code": class_code,
+            "constructor_args": serialized_args,
+            "constructor_kwargs": serialized_kwargs,
+        }
+
+    _SERIALIZED_CLASS_CACHE.set(cache_key, data)
+    log.debug(f"Cached class data for {cls.__name__} with key: {cache_key}")
+    return cache_key, data
 
 
 def extract_class_code_simple(cls: Type) -> str:
@@ -169,26 +255,21 @@ def get_class_cache_key(
         which disables caching benefits but maintains functionality.
     """
     try:
-        # Get class source code for hashing
-        class_source = extract_class_code_simple(cls)
-
-        # Create hash of class source
-        class_hash = hashlib.sha256(class_source.encode()).hexdigest()
-
-        # Create hash of constructor arguments
-        args_data = cloudpickle.dumps((constructor_args, constructor_kwargs))
-        args_hash = hashlib.sha256(args_data).hexdigest()
-
-        # Combine hashes for final cache key
-        cache_key = f"{cls.__name__}_{class_hash[:HASH_TRUNCATE_LENGTH]}_{args_hash[:HASH_TRUNCATE_LENGTH]}"
+        _, class_hash = get_class_source(cls)
+        serialized_args, serialized_kwargs = serialize_constructor_args(
+            constructor_args, constructor_kwargs
+        )
+        cache_key = _cache_key(
+            cls, class_hash, _constructor_digest(serialized_args, serialized_kwargs)
+        )
 
         log.debug(f"Generated cache key for {cls.__name__}: {cache_key}")
         return cache_key
 
-    except (TypeError, AttributeError, OSError) as e:
+    except (TypeError, AttributeError, OSError, SerializationError) as e:
         log.warning(f"Could not generate cache key for {cls.__name__}: {e}")
         # Fallback to basic key without caching benefits
-        return f"{cls.__name__}_{uuid.uuid4().hex[:UUID_FALLBACK_LENGTH]}"
+        return _fallback_cache_key(cls)
 
 
 def create_remote_class(
@@ -198,9 +279,17 @@ def create_remote_class(
     system_dependencies: Optional[List[str]],
     accelerate_downloads: bool,
     extra: dict,
+    affinity: bool = False,
 ):
     """
     Create a remote class wrapper.
+
+    With affinity, each instance follows the worker that serves it: calls
+    name that worker as a hint, and a move to another worker is logged.
+    Neither queue-based nor load-balanced endpoints can route a request to a
+    given worker, so a call that lands elsewhere runs like any pooled call:
+    on that worker's live copy, or re-established there with one extra
+    request.
     """
     # Validate inputs
     if not inspect.isclass(cls):
@@ -222,12 +311,16 @@ def create_remote_class(
                 f"{cls.__name__}_{uuid.uuid4().hex[:UUID_FALLBACK_LENGTH]}"
             )
             self._initialized = False
+            # Whether a request asking the worker to construct the instance
+            # was sent; later calls reuse the worker's pooled instance
+            self._instance_requested = False
+            # Worker the instance is pinned to (affinity mode)
+            self._worker_id: Optional[str] = None
 
-            # Generate cache key and get class code
-            self._cache_key = get_class_cache_key(cls, args, kwargs)
-            self._clean_class_code = get_or_cache_class_data(
-                cls, args, kwargs, self._cache_key
-            )
+            # Generate cache key and get class code; the wrapper keeps its
+            # data, so cache eviction does not affect it
+            self._cache_key, self._class_data = get_class_data(cls, args, kwargs)
+            self._clean_class_code = self._class_data["class_code"]
 
             log.debug(f"Created remote class wrapper for {cls.__name__}")
 
@@ -247,6 +340,132 @@ def create_remote_class(
             # We'll do this on first method call
             self._initialized = True
 
+        def pipeline(self, return_exceptions: bool = False) -> Pipeline:
+            """Record method calls and run them in one request.
+
+            Args:
+                return_exceptions: Return the error of a failed call instead
+                    of raising it
+
+            Returns:
+                A Pipeline; see runpod_flash.pipeline
+            """
+
+            async def run(steps: List[Dict[str, Any]]) -> Any:
+                # The request's own method call is the first step, which is
+                # all that endpoints without pipeline support run
+                first = steps[0]
+                return await self._call(
+                    first["method_name"], first["args"], first["kwargs"], steps
+                )
+
+            return Pipeline(run, self._call, return_exceptions)
+
+        async def _call(
+            self,
+            name: str,
+            method_args: List[str],
+            method_kwargs: dict,
+            pipeline: Optional[List[Dict[str, Any]]] = None,
+        ) -> Any:
+            """Call a method (or run a pipeline) on the remote instance."""
+            await self._ensure_initialized()
+
+            # Once the worker pools the instance, calls carry only the
+            # instance ID, method name and arguments
+            pooled = getattr(self._stub, "pooled_instances", None)
+            if not isinstance(pooled, set) or self._instance_id not in pooled:
+                request = self._establish_request(
+                    name, method_args, method_kwargs, pipeline
+                )
+                return await self._execute(request)
+
+            request = FunctionRequest(
+                execution_type="class",
+                class_name=self._class_type.__name__,
+                method_name=name,
+                args=method_args,
+                kwargs=method_kwargs,
+                dependencies=self._dependencies,
+                system_dependencies=self._system_dependencies,
+                accelerate_downloads=self._accelerate_downloads,
+                instance_id=self._instance_id,
+                create_new_instance=False,
+                require_instance=True,
+                worker_id=self._worker_id,
+                pipeline=pipeline,
+            )
+            try:
+                return await self._execute(request)
+            except UnknownInstanceError:
+                # Evicted, or the call reached another worker: send the
+                # class code and constructor arguments again
+                log.debug(f"Re-establishing remote instance {self._instance_id}")
+                pooled.discard(self._instance_id)
+                request = self._establish_request(
+                    name, method_args, method_kwargs, pipeline
+                )
+                return await self._execute(request)
+
+        def _establish_request(
+            self,
+            name: str,
+            method_args: List[str],
+            method_kwargs: dict,
+            pipeline: Optional[List[Dict[str, Any]]] = None,
+        ) -> FunctionRequest:
+            """Method call request carrying the class code and constructor arguments."""
+            cached_data = self._class_data
+
+            # Handle constructor args - use cached if available, else serialize fresh
+            if cached_data["constructor_args"] is not None:
+                # Use cached constructor args
+                constructor_args = cached_data["constructor_args"]
+                constructor_kwargs = cached_data["constructor_kwargs"]
+            else:
+                # Constructor args couldn't be cached due to serialization issues
+                # Serialize them fresh for each method call (fallback behavior)
+                constructor_args = serialize_args(self._constructor_args)
+                constructor_kwargs = serialize_kwargs(self._constructor_kwargs)
+
+            request = FunctionRequest(
+                execution_type="class",
+                class_name=self._class_type.__name__,
+                class_code=cached_data["class_code"],
+                method_name=name,
+                args=method_args,
+                kwargs=method_kwargs,
+                constructor_args=constructor_args,
+                constructor_kwargs=constructor_kwargs,
+                dependencies=self._dependencies,
+                system_dependencies=self._system_dependencies,
+                accelerate_downloads=self._accelerate_downloads,
+                instance_id=self._instance_id,
+                # Create new only on first call
+                create_new_instance=not self._instance_requested,
+                # Unpinned: the worker that establishes the instance holds it
+                worker_id=None,
+                pipeline=pipeline,
+            )
+            self._instance_requested = True
+            return request
+
+        async def _execute(self, request: FunctionRequest):
+            """Run a method call request and follow the instance's worker."""
+            result = await self._stub.execute_class_method(request)  # type: ignore
+            workers = getattr(self._stub, "instance_workers", None)
+            if affinity and isinstance(workers, dict):
+                worker_id = workers.get(self._instance_id)
+                if worker_id and worker_id != self._worker_id:
+                    if self._worker_id:
+                        log.warning(
+                            f"Remote {cls.__name__} instance {self._instance_id} "
+                            f"moved from worker {self._worker_id} to {worker_id}; "
+                            f"it was re-created there"
+                        )
+                    self._worker_id = worker_id
+            return result
+
         def __getattr__(self, name):
             """Dynamically create method proxies for all class methods."""
             if name.startswith("_"):
@@ -255,47 +474,11 @@ def create_remote_class(
                 )
 
             async def method_proxy(*args, **kwargs):
-                await self._ensure_initialized()
-
-                # Get cached data
-                cached_data = _SERIALIZED_CLASS_CACHE.get(self._cache_key)
-
                 # Serialize method arguments (these change per call, so no caching)
-                method_args = serialize_args(args)
-                method_kwargs = serialize_kwargs(kwargs)
-
-                # Handle constructor args - use cached if available, else serialize fresh
-                if cached_data["constructor_args"] is not None:
-                    # Use cached constructor args
-                    constructor_args = cached_data["constructor_args"]
-                    constructor_kwargs = cached_data["constructor_kwargs"]
-                else:
-                    # Constructor args couldn't be cached due to serialization issues
-                    # Serialize them fresh for each method call (fallback behavior)
-                    constructor_args = serialize_args(self._constructor_args)
-                    constructor_kwargs = serialize_kwargs(self._constructor_kwargs)
-
-                request = FunctionRequest(
-                    execution_type="class",
-                    class_name=self._class_type.__name__,
-                    class_code=cached_data["class_code"],
-                    method_name=name,
-                    args=method_args,
-                    kwargs=method_kwargs,
-                    constructor_args=constructor_args,
-                    constructor_kwargs=constructor_kwargs,
-                    dependencies=self._dependencies,
-                    system_dependencies=self._system_dependencies,
-                    accelerate_downloads=self._accelerate_downloads,
-                    instance_id=self._instance_id,
-                    create_new_instance=not hasattr(
-                        self, "_stub"
-                    ),  # Create new only on first call
+                return await self._call(
+                    name, serialize_args(args), serialize_kwargs(kwargs)
                 )
 
-                # Execute via stub
-                return await self._stub.execute_class_method(request)  # type: ignore
-
             return method_proxy
 
     return RemoteClassWrapper
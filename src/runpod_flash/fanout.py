@@ -0,0 +1,154 @@
+"""
+Bounded fan-out of many inputs over a remote function.
+
+map_inputs() consumes inputs lazily, packs them into chunks, keeps at most a
+fixed number of chunks in flight and yields results as chunks complete. It is
+transport-agnostic: each chunk is handed to a callable that returns one
+outcome per input (the result, or the exception the input raised), which the
+@remote wrapper backs with a single batched request where the stub supports
+it (see runtime.batch).
+"""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAP_CONCURRENCY = 16
+DEFAULT_MAP_CHUNK_SIZE = 1
+
+ChunkRunner = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+async def _iterate(inputs: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator:
+    """Iterate a sync or async iterable asynchronously."""
+    if hasattr(inputs, "__aiter__"):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
+
+
+async def _chunks(
+    inputs: Union[Iterable[Any], AsyncIterable[Any]], chunk_size: int
+) -> AsyncIterator[Tuple[int, List[Any]]]:
+    """Yield (index of first input, inputs) chunks of up to chunk_size inputs."""
+    start, chunk = 0, []
+    async for item in _iterate(inputs):
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield start, chunk
+            start, chunk = start + len(chunk), []
+    if chunk:
+        yield start, chunk
+
+
+async def _run_chunk(
+    run: ChunkRunner, start: int, chunk: List[Any]
+) -> Tuple[int, List[Any]]:
+    """Run a chunk; a failure of the whole chunk becomes every input's outcome."""
+    try:
+        outcomes = await run(chunk)
+    except Exception as e:
+        return start, [e] * len(chunk)
+    if len(outcomes) != len(chunk):
+        error = RuntimeError(
+            f"Expected {len(chunk)} results for chunk at {start}, got {len(outcomes)}"
+        )
+        return start, [error] * len(chunk)
+    return start, list(outcomes)
+
+
+def _unwrap(outcome: Any, return_exceptions: bool) -> Any:
+    if isinstance(outcome, BaseException) and not return_exceptions:
+        raise outcome
+    return outcome
+
+
+async def map_inputs(
+    run: ChunkRunner,
+    inputs: Union[Iterable[Any], AsyncIterable[Any]],
+    concurrency: int = DEFAULT_MAP_CONCURRENCY,
+    chunk_size: int = DEFAULT_MAP_CHUNK_SIZE,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> AsyncIterator[Any]:
+    """Run inputs through a chunk runner with bounded fan-out.
+
+    Args:
+        run: Async callable taking a list of inputs and returning one outcome
+            per input (result or exception instance)
+        inputs: Sync or async iterable of inputs, consumed lazily
+        concurrency: Maximum number of chunks in flight
+        chunk_size: Maximum number of inputs per chunk
+        ordered: Yield results in input order; otherwise as they complete
+        return_exceptions: Yield exceptions of failed inputs instead of raising
+
+    Yields:
+        One result per input.
+
+    Raises:
+        ValueError: If concurrency or chunk_size is less than 1
+        Exception: The first failed input's exception, unless return_exceptions
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1. Got: {concurrency}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1. Got: {chunk_size}")
+
+    chunks = _chunks(inputs, chunk_size)
+    pending: Set[asyncio.Future] = set()
+    buffered: Dict[int, Any] = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            # Top up in-flight chunks; inputs are only read as slots free up
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    start, chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_run_chunk(run, start, chunk)))
+
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                start, outcomes = task.result()
+                if ordered:
+                    for offset, outcome in enumerate(outcomes):
+                        buffered[start + offset] = outcome
+                else:
+                    for outcome in outcomes:
+                        yield _unwrap(outcome, return_exceptions)
+
+            while next_index in buffered:
+                yield _unwrap(buffered.pop(next_index), return_exceptions)
+                next_index += 1
+    finally:
+        # Consumer stopped early or an input failed: drop outstanding chunks
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await chunks.aclose()
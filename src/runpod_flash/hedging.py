@@ -0,0 +1,146 @@
+"""
+Hedged requests for idempotent calls to load-balanced endpoints.
+
+A load-balanced endpoint routes each request to one worker, so a single slow or
+cold worker sets the tail latency. With @remote(..., idempotent=True,
+hedge=HedgePolicy(...)), a call that has not answered within a percentile of
+the function's recent latencies is sent a second time; the first successful
+response wins and the other request is cancelled:
+
+    @remote(lb, method="POST", path="/embed", idempotent=True, hedge=HedgePolicy())
+    async def embed(text: str) -> list[float]:
+        ...
+
+Duplicates are limited to a budget, a fraction of all calls, so hedging cannot
+multiply the load on an endpoint that is slow across the board.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Request hedging settings for an idempotent @remote function.
+
+    Attributes:
+        percentile: Latency percentile after which a duplicate request is sent
+        budget: Maximum duplicate requests as a fraction of calls
+        min_samples: Latencies observed before hedging starts
+        window: Number of recent latencies the percentile is taken over
+    """
+
+    percentile: float = 95.0
+    budget: float = 0.05
+    min_samples: int = 20
+    window: int = 200
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 100:
+            raise ValueError(
+                f"percentile must be between 0 and 100. Got: {self.percentile}"
+            )
+        if not 0 <= self.budget <= 1:
+            raise ValueError(f"budget must be between 0 and 1. Got: {self.budget}")
+        if self.min_samples < 1:
+            raise ValueError(f"min_samples must be at least 1. Got: {self.min_samples}")
+        if self.window < self.min_samples:
+            raise ValueError(
+                f"window must be at least min_samples ({self.min_samples}). "
+                f"Got: {self.window}"
+            )
+
+
+@dataclass
+class Hedger:
+    """Runs calls with at most one hedged duplicate each, within a budget.
+
+    Every call earns `budget` credit (capped at `budget * window`, at least
+    one) and a duplicate spends one, so over time at most a `budget` fraction
+    of calls is duplicated. Latencies of successful requests feed the
+    percentile; cancelled and failed requests are not counted.
+
+    Attributes:
+        policy: Hedging settings
+        calls: Number of calls run
+        hedges: Number of duplicate requests sent
+    """
+
+    policy: HedgePolicy
+    calls: int = field(default=0, init=False)
+    hedges: int = field(default=0, init=False)
+    _latencies: Deque[float] = field(init=False)
+    _credit: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        self._latencies = deque(maxlen=self.policy.window)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a call is hedged, or None while warming up."""
+        if len(self._latencies) < self.policy.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.policy.percentile / 100))
+        return ordered[index]
+
+    async def run(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a call, sending a duplicate if it is slow and budget allows.
+
+        Args:
+            call: Async callable making one request; invoked once or twice
+
+        Returns:
+            The result of the first request to succeed
+
+        Raises:
+            Exception: The first request's exception if every request fails
+        """
+        self.calls += 1
+        self._credit = min(
+            self._credit + self.policy.budget,
+            max(1.0, self.policy.budget * self.policy.window),
+        )
+        delay = self.hedge_delay()
+
+        primary = asyncio.ensure_future(self._timed(call))
+        tasks = [primary]
+        try:
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or self._credit < 1:
+                return await primary
+
+            self._credit -= 1
+            self.hedges += 1
+            log.debug(f"No response after {delay * 1000:.0f} ms, hedging request")
+            tasks.append(asyncio.ensure_future(self._timed(call)))
+            return await self._first_success(tasks)
+        finally:
+            # Cancel the losing request (or both, if the caller went away)
+            for task in tasks:
+                task.cancel()
+
+    async def _timed(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.monotonic()
+        result = await call()
+        self._latencies.append(time.monotonic() - start)
+        return result
+
+    @staticmethod
+    async def _first_success(tasks: list) -> Any:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        raise tasks[0].exception()
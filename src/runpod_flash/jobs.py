@@ -0,0 +1,189 @@
+"""
+Decoupled job submission and collection for queue-based endpoints.
+
+Awaiting a @remote call keeps a coroutine alive until the job finishes.
+fn.submit(...) instead returns once the job is queued, with a JobHandle: a
+small, JSON-serializable record (job ID, endpoint ID, API base URL and how to
+decode the output) that can be awaited later, stored and restored in another
+process, collected in bulk or cancelled:
+
+    handles = [await process.submit(item) for item in items]
+    saved = [handle.to_dict() for handle in handles]  # e.g. json.dump
+
+    handles = [JobHandle.from_dict(data) for data in saved]
+    results = await gather(handles, return_exceptions=True)
+
+Waiting goes through the endpoint's shared JobPoller: each outstanding job
+costs one future and one timer entry, not a coroutine or a polling loop, and
+status requests of all jobs are paced together.
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from .core.api.endpoint import DEFAULT_ENDPOINT_BASE_URL, EndpointClient
+from .core.resources.job_poller import get_job_poller
+from .stubs.live_serverless import decode_function_response, function_response_from_job
+
+log = logging.getLogger(__name__)
+
+# Job output is a Flash FunctionResponse with a cloudpickled result
+DECODE_FUNCTION = "function"
+# Job output is returned as is (ServerlessEndpoint handlers)
+DECODE_OUTPUT = "output"
+
+
+@dataclass(frozen=True)
+class JobHandle:
+    """Reference to a submitted job.
+
+    Awaiting a handle waits for the job and returns its result, or raises the
+    remote error.
+
+    Attributes:
+        job_id: ID of the queued job
+        endpoint_id: ID of the endpoint running it
+        base_url: Endpoint API base URL
+        decode: How the job output becomes the result (DECODE_FUNCTION or
+            DECODE_OUTPUT)
+        function_name: Name of the submitted function, for reference
+    """
+
+    job_id: str
+    endpoint_id: str
+    base_url: str = DEFAULT_ENDPOINT_BASE_URL
+    decode: str = DECODE_FUNCTION
+    function_name: Optional[str] = None
+
+    @property
+    def client(self) -> EndpointClient:
+        """Job API client of the handle's endpoint."""
+        return EndpointClient(self.endpoint_id, self.base_url)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable representation, restored with from_dict()."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobHandle":
+        """Restore a handle saved with to_dict()."""
+        return cls(**data)
+
+    async def status(self) -> Optional[str]:
+        """Fetch the job's current status (e.g. IN_QUEUE, COMPLETED)."""
+        return (await self.client.status(self.job_id)).get("status")
+
+    async def cancel(self) -> None:
+        """Cancel the job; waiters get an error once it is cancelled."""
+        await self.client.cancel(self.job_id)
+
+    def future(self) -> asyncio.Future:
+        """Future of the job's final /status response, from the shared poller.
+
+        Each call returns a new future. Cancelling it leaves other waiters on
+        the job untouched; polling stops once none is left, and the job keeps
+        running.
+        """
+        return get_job_poller(self.client).track(self.job_id)
+
+    async def result(self) -> Any:
+        """Wait for the job and return its decoded result.
+
+        Raises:
+            Exception: If the job failed, was cancelled or timed out
+        """
+        return decode_job(self, await self.future())
+
+    def __await__(self):
+        return self.result().__await__()
+
+
+def decode_job(handle: JobHandle, job: Dict[str, Any]) -> Any:
+    """Turn a job's final /status response into its result.
+
+    Raises:
+        Exception: If the job failed, was cancelled or timed out
+    """
+    status = job.get("status")
+    error = job.get("error")
+    output = job.get("output")
+
+    if status != "COMPLETED" and not error:
+        raise Exception(f"Remote execution failed: job {handle.job_id} {status}")
+    if handle.decode == DECODE_OUTPUT:
+        if error:
+            raise Exception(f"Remote execution failed: {error}")
+        return output
+    return decode_function_response(function_response_from_job(output, error))
+
+
+def _outcome(handle: JobHandle, future: asyncio.Future) -> Any:
+    """Result of a finished job, or the exception it raised."""
+    try:
+        return decode_job(handle, future.result())
+    except Exception as e:
+        return e
+
+
+async def gather(
+    handles: Iterable[JobHandle], return_exceptions: bool = False
+) -> List[Any]:
+    """Wait for every job and return their results in order.
+
+    Args:
+        handles: Handles of submitted jobs
+        return_exceptions: Return the exception of a failed job instead of
+            raising it
+
+    Returns:
+        One result per handle
+
+    Raises:
+        Exception: The first failed job's exception, unless return_exceptions
+    """
+    handles = list(handles)
+    futures = [handle.future() for handle in handles]
+    if futures:
+        try:
+            await asyncio.wait(futures)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    outcomes = [_outcome(handle, future) for handle, future in zip(handles, futures)]
+    if not return_exceptions:
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+    return outcomes
+
+
+async def as_completed(
+    handles: Iterable[JobHandle], return_exceptions: bool = False
+) -> AsyncIterator[Tuple[JobHandle, Any]]:
+    """Yield (handle, result) pairs as jobs finish.
+
+    Args:
+        handles: Handles of submitted jobs
+        return_exceptions: Yield the exception of a failed job instead of
+            raising it
+
+    Raises:
+        Exception: The first failed job's exception, unless return_exceptions
+    """
+    pending = {handle.future(): handle for handle in handles}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                handle = pending.pop(future)
+                outcome = _outcome(handle, future)
+                if isinstance(outcome, Exception) and not return_exceptions:
+                    raise outcome
+                yield handle, outcome
+    finally:
+        # Stop polling the jobs nobody waits for anymore
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,124 @@
+"""
+Micro-batching of concurrent calls to a @remote function.
+
+With @remote(..., batch=BatchPolicy(...)), concurrent calls to the decorated
+function are coalesced for up to max_wait_ms (or until max_size calls are
+waiting) and sent as a single remote call. The remote function receives one
+list per argument and returns a list with one result per call, which is fanned
+back out to the awaiting callers:
+
+    @remote(gpu_config, batch=BatchPolicy(max_size=32, max_wait_ms=5))
+    async def embed(texts: list[str]) -> list[list[float]]:
+        return model.encode(texts).tolist()
+
+    vector = await embed("hello")  # called with one text, runs in a batch
+
+Calls only share a batch when they pass the same number of positional
+arguments and the same keyword names.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BatchPolicy:
+    """Micro-batching settings for a @remote function.
+
+    Attributes:
+        max_size: Maximum number of calls per batch; a full batch is sent
+            immediately
+        max_wait_ms: Maximum time the first call of a batch waits for more
+    """
+
+    max_size: int = 32
+    max_wait_ms: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError(f"max_size must be at least 1. Got: {self.max_size}")
+        if self.max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0. Got: {self.max_wait_ms}")
+
+
+# One caller's arguments and the future its result is delivered to
+_Call = Tuple[tuple, Dict[str, Any], asyncio.Future]
+
+
+@dataclass
+class _PendingBatch:
+    calls: List[_Call] = field(default_factory=list)
+    timer: Any = None
+
+
+@dataclass
+class MicroBatcher:
+    """Coalesces concurrent calls into batched calls of a list-taking function.
+
+    Batches are collected per event loop and per argument shape. The batched
+    call runs as its own task, so a caller cancelling its await does not
+    cancel the batch for the other callers.
+    """
+
+    policy: BatchPolicy
+    call: Callable[..., Awaitable[Any]]
+    _pending: Dict[Any, _PendingBatch] = field(default_factory=dict, init=False)
+    _tasks: Set[asyncio.Task] = field(default_factory=set, init=False)
+
+    async def submit(self, *args: Any, **kwargs: Any) -> Any:
+        """Add a call to the current batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        key = (loop, len(args), tuple(sorted(kwargs)))
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch()
+            batch.timer = loop.call_later(
+                self.policy.max_wait_ms / 1000, self._flush, key
+            )
+
+        future = loop.create_future()
+        batch.calls.append((args, kwargs, future))
+        if len(batch.calls) >= self.policy.max_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: Any) -> None:
+        """Send the pending batch for key, if any."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        task = asyncio.ensure_future(self._run(batch.calls))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, calls: List[_Call]) -> None:
+        """Make the batched call and deliver each caller's result."""
+        first_args, first_kwargs, _ = calls[0]
+        arg_lists = [[args[i] for args, _, _ in calls] for i in range(len(first_args))]
+        kwarg_lists = {
+            name: [kwargs[name] for _, kwargs, _ in calls] for name in first_kwargs
+        }
+        log.debug(f"Sending micro-batch of {len(calls)} calls")
+
+        try:
+            results = list(await self.call(*arg_lists, **kwarg_lists))
+            if len(results) != len(calls):
+                raise ValueError(
+                    f"Batched function returned {len(results)} results "
+                    f"for {len(calls)} inputs"
+                )
+        except Exception as e:
+            for _, _, future in calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(calls, results):
+            if not future.done():
+                future.set_result(result)
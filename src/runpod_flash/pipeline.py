@@ -0,0 +1,200 @@
+"""
+Pipelined method calls on remote class instances.
+
+Calling several methods on a remote class instance costs one round trip
+(queue delay, polling) per call. A pipeline records the calls and sends them
+as one job; the worker runs them in order on the same instance and returns
+the results of the last call and of the calls marked as returned:
+
+    model = Model("weights.bin")
+    async with model.pipeline() as p:
+        tokens = p.tokenize(text)
+        embedding = p.embed(tokens)  # uses the tokenize result on the worker
+        p.store(embedding)
+        p.mark_returned(tokens)
+    tokens, stored = await p
+
+Each recorded call returns a StepRef. Passing a StepRef as an argument of a
+later call makes the worker substitute that step's result, so intermediate
+values are not sent back unless marked as returned. Refs must be passed as
+whole arguments (not inside lists or dicts). A failing step stops the
+pipeline; awaiting it raises the first error, or with return_exceptions=True
+returns the errors in place of the results.
+
+Endpoints without pipeline support run only the first call; the remaining
+calls are then sent one by one, with step results passed from the client.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .runtime.exceptions import RemoteExecutionError
+from .runtime.pipeline import PipelineResults, encode_step_arg
+
+
+@dataclass(frozen=True)
+class StepRef:
+    """Placeholder for the result of a pipeline step.
+
+    Attributes:
+        index: Position of the step in its pipeline
+        pipeline_id: Identity of the pipeline the step belongs to
+    """
+
+    index: int
+    pipeline_id: int
+
+
+class Pipeline:
+    """Recorder and runner of pipelined method calls on one remote instance.
+
+    Attribute access returns recorders for the instance's methods; the
+    pipeline runs once, when awaited or when its ``async with`` block exits.
+
+    Args:
+        run: Sends the encoded steps in one request; returns PipelineResults,
+            or the first step's result if the endpoint ran only that step
+        call: Sends one method call with encoded arguments and returns its
+            result, for endpoints without pipeline support
+        return_exceptions: Return the error of a failed step instead of
+            raising it
+    """
+
+    def __init__(
+        self,
+        run: Callable[[List[Dict[str, Any]]], Awaitable[Any]],
+        call: Callable[[str, List[Any], Dict[str, Any]], Awaitable[Any]],
+        return_exceptions: bool = False,
+    ):
+        self._run = run
+        self._call = call
+        self._return_exceptions = return_exceptions
+        self._calls: List[Tuple[str, tuple, dict]] = []
+        self._returned: Set[int] = set()
+        self._task: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __getattr__(self, name: str) -> Callable[..., StepRef]:
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+        def record(*args, **kwargs) -> StepRef:
+            return self._add(name, args, kwargs)
+
+        return record
+
+    def mark_returned(self, *refs: StepRef) -> None:
+        """Send the results of these steps back along with the last one."""
+        self._check_open()
+        for ref in refs:
+            self._check_ref(ref)
+            self._returned.add(ref.index)
+
+    def _check_open(self) -> None:
+        if self._task is not None:
+            raise RuntimeError("Cannot change a pipeline that already ran")
+
+    def _check_ref(self, ref: StepRef) -> None:
+        if ref.pipeline_id != id(self):
+            raise ValueError("StepRef belongs to a different pipeline")
+
+    def _add(self, method_name: str, args: tuple, kwargs: dict) -> StepRef:
+        self._check_open()
+        for value in (*args, *kwargs.values()):
+            if isinstance(value, StepRef):
+                self._check_ref(value)
+        self._calls.append((method_name, args, kwargs))
+        return StepRef(len(self._calls) - 1, id(self))
+
+    def _is_returned(self, index: int) -> bool:
+        return index in self._returned or index == len(self._calls) - 1
+
+    def _steps(self) -> List[Dict[str, Any]]:
+        def encode(value: Any):
+            if isinstance(value, StepRef):
+                return encode_step_arg(None, step_ref=value.index)
+            return encode_step_arg(value)
+
+        return [
+            {
+                "method_name": name,
+                "args": [encode(arg) for arg in args],
+                "kwargs": {key: encode(arg) for key, arg in kwargs.items()},
+                "returned": self._is_returned(index),
+            }
+            for index, (name, args, kwargs) in enumerate(self._calls)
+        ]
+
+    async def _run_one_by_one(self, first: Any) -> List[Any]:
+        """Run the steps after the first as single calls (see module docs)."""
+
+        def encode(value: Any):
+            return encode_step_arg(
+                values[value.index] if isinstance(value, StepRef) else value
+            )
+
+        values: List[Any] = [first]
+        outcomes: List[Any] = [first] if self._is_returned(0) else []
+        failure: Optional[Exception] = None
+        for index, (name, args, kwargs) in enumerate(self._calls[1:], start=1):
+            if failure is None:
+                try:
+                    values.append(
+                        await self._call(
+                            name,
+                            [encode(arg) for arg in args],
+                            {key: encode(arg) for key, arg in kwargs.items()},
+                        )
+                    )
+                except Exception as e:
+                    failure = RemoteExecutionError(
+                        f"Remote execution failed: Skipped: step {index} failed: {e}"
+                    )
+                    if self._is_returned(index):
+                        outcomes.append(e)
+                    continue
+            if self._is_returned(index):
+                outcomes.append(values[index] if failure is None else failure)
+        return outcomes
+
+    async def _execute(self) -> List[Any]:
+        if not self._calls:
+            return []
+        response = await self._run(self._steps())
+        if isinstance(response, PipelineResults):
+            outcomes = list(response)
+            expected = sum(map(self._is_returned, range(len(self._calls))))
+            if len(outcomes) != expected:
+                raise RemoteExecutionError(
+                    f"Remote execution failed: expected {expected} pipeline "
+                    f"result(s), got {len(outcomes)}"
+                )
+        else:
+            # The endpoint predates pipelines and ran only the first step
+            outcomes = await self._run_one_by_one(response)
+        if not self._return_exceptions:
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+        return outcomes
+
+    def _start(self) -> asyncio.Future:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._execute())
+        return self._task
+
+    def __await__(self):
+        """Run the pipeline (once) and return the returned steps' results."""
+        return self._start().__await__()
+
+    async def __aenter__(self) -> "Pipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self._start()
@@ -15,6 +15,8 @@ class FunctionRequest(BaseModel):
 
     Supports both function-based execution and class instantiation with method calls.
     All serialized data (args, kwargs, etc.) are base64-encoded cloudpickle strings.
+    Large values may instead be blob store references by SHA-256 digest (see
+    runtime.blob_store), resolved by the worker from the shared store.
     """
 
     # MADE OPTIONAL - can be None for class-only execution
@@ -75,6 +77,17 @@ class FunctionRequest(BaseModel):
         default=True,
         description="Whether to create a new instance or reuse existing one",
     )
+    require_instance: bool = Field(
+        default=False,
+        description="Call the live instance established by an earlier request; "
+        "class_code and constructor arguments are omitted and the worker reports "
+        "instance_missing instead of constructing the instance",
+    )
+    worker_id: Optional[str] = Field(
+        default=None,
+        description="Worker that last served the instance (affinity mode); a "
+        "hint only, as endpoints cannot route a request to a given worker",
+    )
 
     # Download acceleration fields
     accelerate_downloads: bool = Field(
@@ -82,6 +95,19 @@ class FunctionRequest(BaseModel):
         description="Enable download acceleration for dependencies and models",
     )
 
+    # Batched execution (see runtime.batch)
+    batch: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Per-call {'args': [...], 'kwargs': {...}} items executed in order instead of args/kwargs",
+    )
+
+    # Pipelined class method calls (see runtime.pipeline)
+    pipeline: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Ordered {'method_name', 'args', 'kwargs', 'returned'} invocations on the "
+        "instance executed instead of method_name/args/kwargs; arguments may be {'ref': step_index}",
+    )
+
     @model_validator(mode="after")
     def validate_execution_requirements(self) -> "FunctionRequest":
         """Validate that required fields are provided based on execution_type.
@@ -135,6 +161,27 @@ class FunctionResponse(BaseModel):
         default=None,
         description="Metadata about the class instance (creation time, call count, etc.)",
     )
+    instance_pooled: bool = Field(
+        default=False,
+        description="The worker keeps the instance alive, so later calls may omit "
+        "the class code and constructor arguments",
+    )
+    instance_missing: bool = Field(
+        default=False,
+        description="The request required a live instance the worker does not have",
+    )
+    worker_id: Optional[str] = Field(
+        default=None,
+        description="ID of the worker that executed the request",
+    )
+    results: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Per-item {'success', 'result' | 'error'} entries for batched and pipelined requests",
+    )
+    pipeline: bool = Field(
+        default=False,
+        description="results holds the returned steps of a pipelined request",
+    )
 
 
 class RemoteExecutorStub(ABC):
@@ -0,0 +1,318 @@
+"""
+Client-side result cache for deterministic @remote functions.
+
+With @remote(..., cache=CachePolicy(...)), results are stored under a key
+derived from the function's source hash and a digest of its serialized
+arguments. Repeated calls are answered from an in-memory LRU and, across runs,
+from an on-disk store under .runpod/result_cache without contacting the
+endpoint:
+
+    @remote(gpu_config, cache=CachePolicy(ttl=24 * 3600))
+    async def embed(document: str) -> list[float]:
+        ...
+
+Concurrent identical calls share one remote execution (single-flight).
+Failed calls are not cached. Only use the cache for functions whose result
+depends on nothing but their source and arguments; arguments must pickle to
+the same bytes for equal values.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import cloudpickle
+
+from .runtime.metrics import ResultCacheMetrics
+from .stubs.live_serverless import get_function_source
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".runpod") / "result_cache"
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+# Disk entries start with their expiry time (0 for none)
+_EXPIRY_HEADER = struct.Struct("!d")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Result caching settings for a @remote function.
+
+    Attributes:
+        ttl: Seconds a result stays valid; None keeps it until evicted
+        max_bytes: Size limit of the in-memory LRU of serialized results
+        persist: Also store results on disk, shared across runs
+        max_disk_bytes: Size limit of the on-disk store; least recently used
+            entries are removed first
+        directory: On-disk store location (default: .runpod/result_cache)
+    """
+
+    ttl: Optional[float] = None
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    persist: bool = True
+    max_disk_bytes: int = DEFAULT_CACHE_MAX_DISK_BYTES
+    directory: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError(f"ttl must be positive. Got: {self.ttl}")
+        if self.max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0. Got: {self.max_bytes}")
+        if self.max_disk_bytes < 0:
+            raise ValueError(f"max_disk_bytes must be >= 0. Got: {self.max_disk_bytes}")
+
+
+def _expired(expires_at: float) -> bool:
+    return expires_at != 0 and expires_at <= time.time()
+
+
+class DiskResultStore:
+    """Serialized results on the local filesystem, keyed by cache key.
+
+    Entries are written atomically (temp file + rename) under a two-level
+    fan-out; reads refresh the modification time, which orders eviction.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes stored, computed on first write
+        self._size: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        """Load an entry as (expiry time, serialized result).
+
+        Returns None if the entry is absent or expired. Truncated entries are
+        deleted and treated as absent.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            (expires_at,) = _EXPIRY_HEADER.unpack_from(data)
+        except struct.error:
+            log.warning(f"Discarding truncated result cache entry {path}")
+            path.unlink(missing_ok=True)
+            return None
+        blob = data[_EXPIRY_HEADER.size :]
+        if _expired(expires_at):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return expires_at, blob
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._path(key).unlink(missing_ok=True)
+
+    def put(self, key: str, blob: bytes, expires_at: float) -> None:
+        """Store an entry, then evict old entries above the size limit."""
+        size = _EXPIRY_HEADER.size + len(blob)
+        if size > self.max_bytes:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_EXPIRY_HEADER.pack(expires_at))
+                f.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in self._entries())
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        return (p for p in self.root.glob("*/*") if not p.name.startswith(".tmp-"))
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until within the size limit."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+
+@dataclass
+class ResultCache:
+    """Result cache and single-flight coordinator of one @remote function.
+
+    Attributes:
+        policy: Caching settings
+        hits: Calls answered from memory, disk or an identical in-flight call
+        misses: Calls executed remotely
+    """
+
+    policy: CachePolicy
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _memory: "OrderedDict[str, Tuple[float, bytes]]" = field(
+        default_factory=OrderedDict, init=False
+    )
+    _memory_bytes: int = field(default=0, init=False)
+    _inflight: Dict[str, asyncio.Task] = field(default_factory=dict, init=False)
+    _store: Optional[DiskResultStore] = field(default=None, init=False)
+    _metrics: Optional[ResultCacheMetrics] = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        if self.policy.persist:
+            root = self.policy.directory or DEFAULT_CACHE_DIR
+            self._store = DiskResultStore(Path(root), self.policy.max_disk_bytes)
+
+    @staticmethod
+    def key(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> str:
+        """Cache key of a call: source hash plus serialized argument digest."""
+        _, source_hash = get_function_source(func)
+        digest = hashlib.sha256(source_hash.encode("utf-8"))
+        digest.update(cloudpickle.dumps((args, sorted(kwargs.items()))))
+        return digest.hexdigest()
+
+    async def call(
+        self,
+        func: Callable[..., Any],
+        run: Callable[[], Awaitable[Any]],
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Answer a call from the cache, or run it and cache the result.
+
+        Args:
+            func: Decorated function, for its source hash and name
+            run: Async callable executing the call remotely
+            args: Positional arguments of the call
+            kwargs: Keyword arguments of the call
+
+        Returns:
+            The call's result; each caller receives its own copy
+        """
+        key = self.key(func, args, kwargs)
+        name = func.__name__
+
+        blob = self._memory_get(key)
+        if blob is not None:
+            self._hit(name, "memory")
+            return cloudpickle.loads(blob)
+
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self._hit(name, "shared")
+        else:
+            task = asyncio.ensure_future(self._load_or_run(key, name, run))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Shielded: one caller going away does not fail the others
+        return cloudpickle.loads(await asyncio.shield(task))
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the on-disk store is kept)."""
+        self._memory.clear()
+        self._memory_bytes = 0
+
+    async def _load_or_run(
+        self, key: str, name: str, run: Callable[[], Awaitable[Any]]
+    ) -> bytes:
+        if self._store is not None:
+            entry = await asyncio.to_thread(self._store.get, key)
+            if entry is not None and self._loadable(entry[1]):
+                self._hit(name, "disk")
+                self._memory_set(key, entry[1], entry[0])
+                return entry[1]
+            if entry is not None:
+                log.warning(f"Discarding corrupt cached result of {name}")
+                await asyncio.to_thread(self._store.delete, key)
+
+        self.misses += 1
+        self._get_metrics().cache_miss(name)
+        blob = cloudpickle.dumps(await run())
+        expires_at = time.time() + self.policy.ttl if self.policy.ttl else 0.0
+        self._memory_set(key, blob, expires_at)
+        if self._store is not None:
+            try:
+                await asyncio.to_thread(self._store.put, key, blob, expires_at)
+            except OSError as e:
+                log.warning(f"Failed to persist cached result of {name}: {e}")
+        return blob
+
+    @staticmethod
+    def _loadable(blob: bytes) -> bool:
+        try:
+            cloudpickle.loads(blob)
+        except Exception:
+            return False
+        return True
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, blob = entry
+        if _expired(expires_at):
+            del self._memory[key]
+            self._memory_bytes -= len(blob)
+            return None
+        self._memory.move_to_end(key)
+        return blob
+
+    def _memory_set(self, key: str, blob: bytes, expires_at: float) -> None:
+        if len(blob) > self.policy.max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous[1])
+        self._memory[key] = (expires_at, blob)
+        self._memory_bytes += len(blob)
+        while self._memory_bytes > self.policy.max_bytes:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _hit(self, name: str, tier: str) -> None:
+        self.hits += 1
+        self._get_metrics().cache_hit(name, tier)
+
+    def _get_metrics(self) -> ResultCacheMetrics:
+        if self._metrics is None:
+            self._metrics = ResultCacheMetrics()
+        return self._metrics
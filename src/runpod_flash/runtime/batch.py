@@ -0,0 +1,113 @@
+"""Batched function calls: several inputs packed into a single request.
+
+A batched request carries the usual function fields plus ``batch``, a list of
+``{"args": [...], "kwargs": {...}}`` items encoded like top-level arguments
+(base64 cloudpickle strings). Workers execute the items in order and answer
+with ``results``, one entry per item:
+
+    {"success": true, "result": base64_encoded_result}
+    {"success": false, "error": "error message"}
+
+so one failing input does not fail the rest of the batch.
+"""
+
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .blob_store import BlobDeduplicator
+from .compression import CompressionPolicy
+from .config import MAX_PAYLOAD_SIZE
+from .exceptions import RemoteExecutionError, SerializationError
+from .serialization import (
+    deserialize_arg,
+    deserialize_args,
+    deserialize_kwargs,
+    serialize_arg_bytes,
+    spill_oversized,
+)
+
+# One call's positional and keyword arguments
+BatchInput = Tuple[tuple, Dict[str, Any]]
+
+
+def serialize_batch(
+    inputs: Sequence[BatchInput],
+    compression: Optional[CompressionPolicy] = None,
+    dedup: Optional[BlobDeduplicator] = None,
+    max_size: Optional[int] = MAX_PAYLOAD_SIZE,
+    type_codecs: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Serialize the inputs of a batch within a payload limit.
+
+    The limit applies to the batch as a whole: the largest values across all
+    items are spilled to the blob store when the batch exceeds max_size.
+
+    Args:
+        inputs: (args, kwargs) per call.
+        compression: Optional compression policy applied per value.
+        dedup: Optional blob store de-duplication for large values.
+        max_size: Payload limit in bytes (None disables spilling).
+        type_codecs: Optional type codec names the receiver can decode.
+
+    Returns:
+        List of {"args": [...], "kwargs": {...}} items with base64 values.
+
+    Raises:
+        SerializationError: If serialization fails.
+    """
+    try:
+        blobs = [
+            serialize_arg_bytes(value, compression, dedup, type_codecs)
+            for args, kwargs in inputs
+            for value in (*args, *kwargs.values())
+        ]
+        encoded = iter(
+            [
+                base64.b64encode(blob).decode("utf-8")
+                for blob in spill_oversized(blobs, max_size)
+            ]
+        )
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize batch: {e}") from e
+
+    return [
+        {
+            "args": [next(encoded) for _ in args],
+            "kwargs": {key: next(encoded) for key in kwargs},
+        }
+        for args, kwargs in inputs
+    ]
+
+
+def deserialize_batch_item(item: Dict[str, Any]) -> Tuple[List[Any], Dict[str, Any]]:
+    """Deserialize the arguments of one batch item.
+
+    Raises:
+        SerializationError: If deserialization fails.
+    """
+    return deserialize_args(item.get("args", [])), deserialize_kwargs(
+        item.get("kwargs", {})
+    )
+
+
+def decode_batch_results(results: List[Dict[str, Any]]) -> List[Any]:
+    """Decode per-item batch results.
+
+    Returns:
+        One entry per item: the deserialized result, or a RemoteExecutionError
+        (SerializationError if the result could not be decoded) for items
+        that failed. Exceptions are returned, not raised.
+    """
+    outcomes: List[Any] = []
+    for entry in results:
+        if not entry.get("success"):
+            error = entry.get("error", "Unknown error")
+            outcomes.append(RemoteExecutionError(f"Remote execution failed: {error}"))
+            continue
+        try:
+            outcomes.append(deserialize_arg(entry["result"]))
+        except Exception as e:
+            outcomes.append(SerializationError(f"Failed to deserialize result: {e}"))
+    return outcomes
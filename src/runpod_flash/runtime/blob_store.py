@@ -0,0 +1,278 @@
+"""Content-addressed blob store for large arguments and results.
+
+Large serialized blobs are uploaded once under their SHA-256 digest and
+replaced in the payload by a small reference blob:
+
+    MAGIC (3 bytes) | digest (32 bytes)
+
+MAGIC never starts a pickle (see serialization._loads_blob). Workers resolve
+references through the same store and keep an LRU of deserialized objects
+keyed by digest, so repeated calls with the same argument skip both the
+transfer and unpickling.
+
+The store serves two purposes: de-duplicating repeated arguments
+(BlobDeduplicator) and spilling payloads above MAX_PAYLOAD_SIZE
+(serialization.spill_oversized).
+
+Objects served from the worker cache are shared between calls and must be
+treated as read-only by remote functions.
+
+The store must be reachable by both sides, e.g. a network volume mounted by
+every endpoint of a Flash app (FLASH_BLOB_STORE_PATH). Other backends plug in
+by implementing BlobStore and calling set_blob_store().
+"""
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional, Union
+
+from ..core.utils.lru_cache import LRUCache
+from .exceptions import SerializationError
+
+log = logging.getLogger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Serialized arguments at least this large are stored by digest
+DEFAULT_DEDUP_MIN_SIZE = 1024 * 1024
+# Deserialized blobs kept per worker process
+DEFAULT_BLOB_CACHE_SIZE = 32
+
+_REF_MAGIC = b"\xffFR"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_REF_SIZE = len(_REF_MAGIC) + _DIGEST_SIZE
+
+
+class BlobStore(ABC):
+    """Storage backend for content-addressed blobs."""
+
+    @abstractmethod
+    def put(self, digest: str, data: BytesLike) -> None:
+        """Store data under its hex digest (idempotent)."""
+
+    @abstractmethod
+    def get(self, digest: str) -> bytes:
+        """Load the data stored under a hex digest.
+
+        Raises:
+            KeyError: If the digest is not stored.
+        """
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        """Check whether a digest is stored."""
+
+    def open(self, digest: str) -> BinaryIO:
+        """Open the data stored under a hex digest as a seekable binary file.
+
+        Backends that can stream should override this; the default loads the
+        whole blob.
+
+        Raises:
+            KeyError: If the digest is not stored.
+        """
+        return io.BytesIO(self.get(digest))
+
+
+class LocalBlobStore(BlobStore):
+    """Blob store on a local filesystem or mounted network volume.
+
+    Blobs are written atomically (temp file + rename) under a two-level
+    fan-out, so concurrent writers of the same digest are safe.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, digest: str, data: BytesLike) -> None:
+        path = self._path(digest)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def get(self, digest: str) -> bytes:
+        try:
+            return self._path(digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+    def exists(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def open(self, digest: str) -> BinaryIO:
+        try:
+            return open(self._path(digest), "rb")
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+
+_store: Optional[BlobStore] = None
+_store_configured = False
+_store_lock = threading.Lock()
+
+
+def set_blob_store(store: Optional[BlobStore]) -> None:
+    """Install the process-wide blob store (None disables de-duplication)."""
+    global _store, _store_configured
+    with _store_lock:
+        _store = store
+        _store_configured = True
+
+
+def get_blob_store() -> Optional[BlobStore]:
+    """Get the process-wide blob store.
+
+    Defaults to a LocalBlobStore at FLASH_BLOB_STORE_PATH when set.
+    """
+    global _store, _store_configured
+    with _store_lock:
+        if not _store_configured:
+            path = os.getenv("FLASH_BLOB_STORE_PATH")
+            _store = LocalBlobStore(path) if path else None
+            _store_configured = True
+        return _store
+
+
+def is_blob_ref(data: BytesLike) -> bool:
+    """Check whether a blob is a reference to the blob store."""
+    view = memoryview(data)
+    return view.nbytes == _REF_SIZE and bytes(view[:3]) == _REF_MAGIC
+
+
+def make_blob_ref(digest: str) -> bytes:
+    """Build the reference blob for a hex digest."""
+    return _REF_MAGIC + bytes.fromhex(digest)
+
+
+def blob_ref_digest(data: BytesLike) -> str:
+    """Extract the hex digest from a reference blob."""
+    return bytes(memoryview(data)[len(_REF_MAGIC) :]).hex()
+
+
+def store_blob(data: BytesLike, store: BlobStore) -> bytes:
+    """Upload a blob unless already stored and return its reference.
+
+    Raises:
+        Exception: Whatever the store raises on upload failure.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    if not store.exists(digest):
+        store.put(digest, data)
+        log.debug(f"Uploaded blob {digest[:12]} ({memoryview(data).nbytes} bytes)")
+    return make_blob_ref(digest)
+
+
+class BlobDeduplicator:
+    """Client side: replaces large serialized blobs with store references.
+
+    Remembers which digests it has uploaded so each distinct payload is
+    written to the store once per process.
+    """
+
+    def __init__(
+        self,
+        store: BlobStore,
+        min_size: int = DEFAULT_DEDUP_MIN_SIZE,
+        max_known: int = 10_000,
+    ):
+        self.store = store
+        self.min_size = min_size
+        self._known = LRUCache(max_size=max_known)
+
+    @classmethod
+    def from_env(cls) -> Optional["BlobDeduplicator"]:
+        """Create a deduplicator for the configured store.
+
+        Environment variables:
+        - FLASH_BLOB_STORE_PATH: Shared directory for blobs (default: disabled)
+        - FLASH_BLOB_DEDUP_MIN_SIZE: Minimum blob size in bytes (default: 1 MiB)
+
+        Returns:
+            BlobDeduplicator, or None when no blob store is configured.
+        """
+        store = get_blob_store()
+        if store is None:
+            return None
+        return cls(
+            store,
+            min_size=int(
+                os.getenv("FLASH_BLOB_DEDUP_MIN_SIZE", str(DEFAULT_DEDUP_MIN_SIZE))
+            ),
+        )
+
+    def encode(self, data: BytesLike) -> BytesLike:
+        """Return a reference for large blobs, uploading them if needed."""
+        if memoryview(data).nbytes < self.min_size:
+            return data
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self._known:
+            try:
+                store_blob(data, self.store)
+            except Exception as e:
+                # Store unavailable: send the payload inline instead
+                log.warning(f"Blob store upload failed, sending inline: {e}")
+                return data
+            self._known[digest] = True
+        return make_blob_ref(digest)
+
+
+_RESOLVED_BLOBS = LRUCache(
+    max_size=int(os.getenv("FLASH_BLOB_CACHE_SIZE", str(DEFAULT_BLOB_CACHE_SIZE)))
+)
+
+
+def resolve_blob_ref(data: BytesLike, load: Callable[[BinaryIO], Any]) -> Any:
+    """Load the object a reference points to, using the LRU.
+
+    The stored blob is streamed from the store's file rather than read into
+    memory first.
+
+    Args:
+        data: Reference blob.
+        load: Deserializer reading the stored blob from a binary file.
+
+    Returns:
+        Deserialized object (shared with other calls using the same blob).
+
+    Raises:
+        SerializationError: If no store is configured or the blob is missing.
+    """
+    digest = blob_ref_digest(data)
+    if digest in _RESOLVED_BLOBS:
+        return _RESOLVED_BLOBS[digest]
+
+    store = get_blob_store()
+    if store is None:
+        raise SerializationError(
+            f"Argument references blob {digest[:12]} but no blob store is "
+            "configured (set FLASH_BLOB_STORE_PATH)"
+        )
+    try:
+        stored = store.open(digest)
+    except KeyError:
+        raise SerializationError(
+            f"Blob {digest[:12]} not found in blob store"
+        ) from None
+
+    with stored:
+        value = load(stored)
+    _RESOLVED_BLOBS[digest] = value
+    return value
@@ -0,0 +1,309 @@
+"""Optional compression for serialized argument and result blobs.
+
+Compressed blobs are self-describing so any decoder can recognize them:
+
+    MAGIC (3 bytes) | codec id (u8) | raw size (u64) | compressed payload
+
+MAGIC never starts a pickle (see serialization._loads_blob). Raw out-of-band
+buffers that happen to start with MAGIC are escaped with the ``none`` codec.
+
+Clients opt in via CompressionPolicy (FLASH_COMPRESSION). A client that
+compresses also lists the codecs it can decode in the request's
+``compression`` field; workers compress results only for such clients.
+
+zstd and lz4 require the optional ``zstandard`` and ``lz4`` packages
+(``pip install runpod-flash[compression]``; zstd is built in on Python 3.14+).
+zlib is always available.
+"""
+
+import logging
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import SerializationError
+
+log = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    # Python 3.14+ ships zstd in the standard library
+    from compression import zstd as stdlib_zstd
+except ImportError:
+    stdlib_zstd = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+CODEC_LZ4 = "lz4"
+
+# Preference order when negotiating with a peer
+CODEC_PREFERENCE = (CODEC_ZSTD, CODEC_LZ4, CODEC_ZLIB)
+
+DEFAULT_COMPRESSION_MIN_SIZE = 64 * 1024
+DEFAULT_COMPRESSION_SAMPLE_SIZE = 64 * 1024
+# Compress only if the sample shrinks to at most this fraction of its size
+DEFAULT_COMPRESSION_MIN_RATIO = 0.9
+
+_MAGIC = b"\xffFZ"
+_HEADER = struct.Struct("!3sBQ")
+
+_DEFAULT_LEVELS = {CODEC_ZLIB: 6, CODEC_ZSTD: 3, CODEC_LZ4: 0}
+
+
+def _zstd_compress(data: BytesLike, level: int) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return stdlib_zstd.compress(data, level=level)
+
+
+def _zstd_decompress(data: BytesLike, size: int) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data, max_output_size=size)
+    return stdlib_zstd.decompress(data)
+
+
+def _lz4_compress(data: BytesLike, level: int) -> bytes:
+    return lz4_frame.compress(data, compression_level=level)
+
+
+def _lz4_decompress(data: BytesLike, size: int) -> bytes:
+    return lz4_frame.decompress(data)
+
+
+def _zlib_compress(data: BytesLike, level: int) -> bytes:
+    return zlib.compress(data, level)
+
+
+def _zlib_decompress(data: BytesLike, size: int) -> bytes:
+    return zlib.decompress(data, bufsize=max(size, 1))
+
+
+# codec name -> (wire id, compress, decompress)
+_CODECS: Dict[str, Tuple[int, Callable, Callable]] = {
+    CODEC_ZLIB: (1, _zlib_compress, _zlib_decompress),
+}
+if zstandard is not None or stdlib_zstd is not None:
+    _CODECS[CODEC_ZSTD] = (2, _zstd_compress, _zstd_decompress)
+if lz4_frame is not None:
+    _CODECS[CODEC_LZ4] = (3, _lz4_compress, _lz4_decompress)
+
+_CODEC_NAMES = {0: CODEC_NONE, 1: CODEC_ZLIB, 2: CODEC_ZSTD, 3: CODEC_LZ4}
+
+
+def available_codecs() -> List[str]:
+    """Codecs usable in this process, in preference order."""
+    return [codec for codec in CODEC_PREFERENCE if codec in _CODECS]
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """How blobs are compressed before they are sent.
+
+    Attributes:
+        codec: Codec name (zstd, lz4 or zlib).
+        level: Codec compression level (None for the codec default).
+        min_size: Blobs smaller than this many bytes are sent as-is.
+        adaptive: Compress a sample first and skip compression when it does
+            not reach ``min_ratio`` (already-compressed images, weights).
+        sample_size: Bytes compressed to estimate the ratio.
+        min_ratio: Maximum compressed/raw ratio worth paying for.
+    """
+
+    codec: str = CODEC_ZSTD
+    level: Optional[int] = None
+    min_size: int = DEFAULT_COMPRESSION_MIN_SIZE
+    adaptive: bool = True
+    sample_size: int = DEFAULT_COMPRESSION_SAMPLE_SIZE
+    min_ratio: float = DEFAULT_COMPRESSION_MIN_RATIO
+
+    def __post_init__(self):
+        if self.codec not in _CODECS:
+            fallback = available_codecs()[0]
+            log.warning(
+                f"Compression codec '{self.codec}' is not available, "
+                f"using '{fallback}' (install runpod-flash[compression])"
+            )
+            object.__setattr__(self, "codec", fallback)
+
+    @classmethod
+    def from_env(cls) -> Optional["CompressionPolicy"]:
+        """Load the client policy from environment variables.
+
+        Environment variables:
+        - FLASH_COMPRESSION: Codec to use: zstd, lz4, zlib (default: off)
+        - FLASH_COMPRESSION_LEVEL: Codec compression level (default: codec default)
+        - FLASH_COMPRESSION_MIN_SIZE: Minimum blob size in bytes (default: 65536)
+        - FLASH_COMPRESSION_ADAPTIVE: Skip incompressible blobs (default: true)
+
+        Returns:
+            CompressionPolicy, or None when compression is disabled.
+        """
+        codec = os.getenv("FLASH_COMPRESSION", "").strip().lower()
+        if codec in ("", "off", "none", "false", "0"):
+            return None
+
+        level = os.getenv("FLASH_COMPRESSION_LEVEL")
+        return cls(
+            codec=codec,
+            level=int(level) if level else None,
+            min_size=int(
+                os.getenv(
+                    "FLASH_COMPRESSION_MIN_SIZE", str(DEFAULT_COMPRESSION_MIN_SIZE)
+                )
+            ),
+            adaptive=os.getenv("FLASH_COMPRESSION_ADAPTIVE", "true").lower() == "true",
+        )
+
+    @classmethod
+    def for_peer(
+        cls, accepted: Optional[Sequence[str]]
+    ) -> Optional["CompressionPolicy"]:
+        """Policy for replying to a peer that listed the codecs it can decode.
+
+        Picks the peer's most preferred codec available locally; thresholds
+        come from this process's environment when set.
+
+        Args:
+            accepted: Codec names from the request's ``compression`` field.
+
+        Returns:
+            CompressionPolicy, or None if nothing suitable is shared.
+        """
+        if not accepted:
+            return None
+        codec = next((c for c in accepted if c in _CODECS), None)
+        if codec is None:
+            return None
+
+        local = cls.from_env()
+        if local is None:
+            return cls(codec=codec)
+        return cls(
+            codec=codec,
+            level=local.level if local.codec == codec else None,
+            min_size=local.min_size,
+            adaptive=local.adaptive,
+            sample_size=local.sample_size,
+            min_ratio=local.min_ratio,
+        )
+
+    @property
+    def resolved_level(self) -> int:
+        return self.level if self.level is not None else _DEFAULT_LEVELS[self.codec]
+
+    def worth_compressing(self, data: BytesLike) -> bool:
+        """Check the size threshold and, in adaptive mode, a sample's ratio."""
+        view = memoryview(data).cast("B")
+        if view.nbytes < self.min_size:
+            return False
+        if not self.adaptive or view.nbytes <= self.sample_size:
+            return True
+
+        # Sample the middle of the blob; headers are often more compressible
+        start = (view.nbytes - self.sample_size) // 2
+        sample = view[start : start + self.sample_size]
+        _, compress, _ = _CODECS[self.codec]
+        compressed = compress(sample, self.resolved_level)
+        return len(compressed) <= self.sample_size * self.min_ratio
+
+
+def is_compressed(data: BytesLike) -> bool:
+    """Check whether a blob carries the compression header."""
+    return bytes(memoryview(data)[:3]) == _MAGIC
+
+
+def _tag(codec_id: int, raw_size: int, payload: BytesLike) -> bytes:
+    return b"".join((_HEADER.pack(_MAGIC, codec_id, raw_size), payload))
+
+
+def compress_blob(
+    data: BytesLike, policy: Optional[CompressionPolicy] = None
+) -> BytesLike:
+    """Compress a blob according to policy.
+
+    Returns ``data`` itself when compression is disabled, below threshold or
+    not worthwhile, except that data starting with the compression header is
+    escaped so decoders never misread it.
+
+    Args:
+        data: Serialized blob (pickle stream or raw buffer).
+        policy: Compression policy, or None to only apply escaping.
+
+    Returns:
+        The blob to send.
+
+    Raises:
+        SerializationError: If compression fails.
+    """
+    view = memoryview(data).cast("B")
+    if policy is not None and policy.worth_compressing(view):
+        codec_id, compress, _ = _CODECS[policy.codec]
+        try:
+            compressed = compress(view, policy.resolved_level)
+        except Exception as e:
+            raise SerializationError(
+                f"Failed to compress blob with {policy.codec}: {e}"
+            ) from e
+        if len(compressed) + _HEADER.size < view.nbytes:
+            return _tag(codec_id, view.nbytes, compressed)
+
+    if is_compressed(view):
+        return _tag(0, view.nbytes, view)
+    return data
+
+
+def decompress_blob(data: BytesLike) -> BytesLike:
+    """Undo compress_blob; blobs without the header are returned unchanged.
+
+    Args:
+        data: Received blob.
+
+    Returns:
+        Original blob (decompressed payloads are bytes).
+
+    Raises:
+        SerializationError: If the codec is unknown/unavailable or the
+            payload is corrupt.
+    """
+    if not is_compressed(data):
+        return data
+
+    view = memoryview(data).cast("B")
+    try:
+        _, codec_id, raw_size = _HEADER.unpack_from(view)
+    except struct.error as e:
+        raise SerializationError(f"Truncated compression header: {e}") from e
+    payload = view[_HEADER.size :]
+
+    if codec_id == 0:
+        return payload
+
+    codec = _CODEC_NAMES.get(codec_id)
+    if codec not in _CODECS:
+        raise SerializationError(
+            f"Cannot decompress blob: codec '{codec or codec_id}' is not available"
+        )
+    _, _, decompress = _CODECS[codec]
+    try:
+        raw = decompress(payload, raw_size)
+    except Exception as e:
+        raise SerializationError(f"Failed to decompress {codec} blob: {e}") from e
+    if len(raw) != raw_size:
+        raise SerializationError(
+            f"Decompressed {codec} blob has {len(raw)} bytes, expected {raw_size}"
+        )
+    return raw
@@ -19,6 +19,19 @@ class SerializationError(FlashRuntimeError):
     pass
 
 
+class UnknownInstanceError(FlashRuntimeError):
+    """Raised when a call requires a class instance the worker does not have.
+
+    The instance was evicted, or the call reached a different worker; the
+    caller re-establishes it by sending the class code and constructor
+    arguments again.
+    """
+
+    def __init__(self, instance_id: str):
+        super().__init__(f"Instance '{instance_id}' is not live on this worker")
+        self.instance_id = instance_id
+
+
 class GraphQLError(FlashRuntimeError):
     """Base exception for GraphQL-related errors."""
 
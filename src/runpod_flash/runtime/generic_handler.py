@@ -4,8 +4,15 @@ import json
 import logging
 import traceback
 from pathlib import Path
-from typing import Any, Callable, Dict
-
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .batch import deserialize_batch_item
+from .compression import CompressionPolicy
+from .config import MAX_PAYLOAD_SIZE
+from .exceptions import UnknownInstanceError
+from .instance_pool import current_worker_id, get_instance_pool
+from .pipeline import is_returned_step, resolve_step_arguments
+from .type_codecs import accepted_type_codecs
 from .serialization import deserialize_args, deserialize_kwargs, serialize_arg
 
 logger = logging.getLogger(__name__)
@@ -68,16 +75,27 @@ def deserialize_arguments(job_input: Dict[str, Any]) -> tuple[list, dict]:
     return args, kwargs
 
 
-def serialize_result(result: Any) -> str:
+def serialize_result(
+    result: Any,
+    compression: Optional[CompressionPolicy] = None,
+    max_size: Optional[int] = None,
+    type_codecs: Optional[List[str]] = None,
+) -> str:
     """Serialize function result for response.
 
     Args:
         result: Return value from function
+        compression: Optional compression policy for the result blob
+        max_size: Optional size limit above which the result is spilled to
+            the blob store
+        type_codecs: Optional type codec names the caller can decode
 
     Returns:
         Base64-encoded cloudpickle of result
     """
-    return serialize_arg(result)
+    return serialize_arg(
+        result, compression, max_size=max_size, type_codecs=type_codecs
+    )
 
 
 def execute_function(
@@ -103,24 +121,180 @@ def execute_function(
         Exception: If execution fails
     """
     if execution_type == "class":
-        # Instantiate class with constructor args
-        instance = func_or_class(*args, **kwargs)
-        method_name = job_input.get("method_name", "__call__")
-
-        # Call method on instance
-        method = getattr(instance, method_name)
-        method_args, method_kwargs = deserialize_arguments(
-            {
-                "args": job_input.get("method_args", []),
-                "kwargs": job_input.get("method_kwargs", {}),
-            }
-        )
-        return method(*method_args, **method_kwargs)
+        result, _ = execute_class_method(func_or_class, args, kwargs, job_input)
+        return result
     else:
         # Direct function call
         return func_or_class(*args, **kwargs)
 
 
+def get_class_instance(
+    cls: Callable,
+    args: list,
+    kwargs: dict,
+    job_input: Dict[str, Any],
+) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """Get the class instance a class job runs on.
+
+    Jobs carrying an instance_id reuse the live instance kept in the worker's
+    instance pool (see runtime.instance_pool) and construct it only on the
+    first call or when create_new_instance is set. Jobs with require_instance
+    carry no constructor arguments and only run on a live instance. Jobs
+    without an instance_id construct a throwaway instance.
+
+    Args:
+        cls: Class to instantiate
+        args: Constructor positional arguments
+        kwargs: Constructor keyword arguments
+        job_input: Full job input with instance fields
+
+    Returns:
+        Tuple of (instance, instance_info or None without instance_id)
+
+    Raises:
+        UnknownInstanceError: If require_instance is set and the instance is
+            not live on this worker
+    """
+    instance_id = job_input.get("instance_id")
+    if instance_id:
+        instance, instance_info = get_instance_pool().acquire(
+            instance_id,
+            None if job_input.get("require_instance") else lambda: cls(*args, **kwargs),
+            create_new=bool(job_input.get("create_new_instance", False)),
+        )
+    else:
+        instance, instance_info = cls(*args, **kwargs), None
+    return instance, instance_info
+
+
+def execute_class_method(
+    cls: Callable,
+    args: list,
+    kwargs: dict,
+    job_input: Dict[str, Any],
+) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """Call a method on a class instance (see get_class_instance).
+
+    Args:
+        cls: Class to instantiate
+        args: Constructor positional arguments
+        kwargs: Constructor keyword arguments
+        job_input: Full job input with method name and arguments
+
+    Returns:
+        Tuple of (method result, instance_info or None without instance_id)
+
+    Raises:
+        UnknownInstanceError: If require_instance is set and the instance is
+            not live on this worker
+    """
+    instance, instance_info = get_class_instance(cls, args, kwargs, job_input)
+    method = getattr(instance, job_input.get("method_name", "__call__"))
+    method_args, method_kwargs = deserialize_arguments(
+        {
+            "args": job_input.get("method_args", []),
+            "kwargs": job_input.get("method_kwargs", {}),
+        }
+    )
+    return method(*method_args, **method_kwargs), instance_info
+
+
+def execute_batch(
+    func: Callable,
+    batch: List[Dict[str, Any]],
+    compression: Optional[CompressionPolicy] = None,
+    max_size: Optional[int] = None,
+    type_codecs: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Execute a function once per batch item (see runtime.batch).
+
+    Items run in order; a failing item is reported in its own result entry
+    and does not stop the rest of the batch.
+
+    Args:
+        func: Function to execute
+        batch: List of {"args": [...], "kwargs": {...}} items
+        compression: Optional compression policy for the results
+        max_size: Optional size limit above which a result is spilled to
+            the blob store
+        type_codecs: Optional type codec names the caller can decode
+
+    Returns:
+        One {"success": ..., "result"/"error": ...} entry per item
+    """
+    results = []
+    for item in batch:
+        try:
+            args, kwargs = deserialize_batch_item(item)
+            result = func(*args, **kwargs)
+            results.append(
+                {
+                    "success": True,
+                    "result": serialize_result(
+                        result, compression, max_size, type_codecs
+                    ),
+                }
+            )
+        except Exception as e:
+            results.append({"success": False, "error": str(e)})
+    return results
+
+
+def execute_pipeline(
+    instance: Any,
+    steps: List[Dict[str, Any]],
+    compression: Optional[CompressionPolicy] = None,
+    max_size: Optional[int] = None,
+    type_codecs: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Run pipelined method calls on one instance (see runtime.pipeline).
+
+    Steps run in order and may take earlier step results as arguments. Only
+    the results of returned steps are serialized; the others stay on the
+    worker. A failing step stops the pipeline, and the returned steps from
+    it on report the failure.
+
+    Args:
+        instance: Class instance the steps are called on
+        steps: List of {"method_name": ..., "args": [...], "kwargs": {...}}
+        compression: Optional compression policy for the results
+        max_size: Optional size limit above which a result is spilled to
+            the blob store
+        type_codecs: Optional type codec names the caller can decode
+
+    Returns:
+        One {"success": ..., "result"/"error": ...} entry per returned step
+    """
+    values: List[Any] = []
+    results: List[Dict[str, Any]] = []
+    failure: Optional[str] = None
+    for index, step in enumerate(steps):
+        returned = is_returned_step(steps, index)
+        if failure is not None:
+            if returned:
+                results.append({"success": False, "error": failure})
+            continue
+        try:
+            args, kwargs = resolve_step_arguments(step, values)
+            method = getattr(instance, step.get("method_name", "__call__"))
+            value = method(*args, **kwargs)
+            values.append(value)
+            if returned:
+                results.append(
+                    {
+                        "success": True,
+                        "result": serialize_result(
+                            value, compression, max_size, type_codecs
+                        ),
+                    }
+                )
+        except Exception as e:
+            if returned:
+                results.append({"success": False, "error": str(e)})
+            failure = f"Skipped: step {index} failed: {e}"
+    return results
+
+
 def create_handler(function_registry: Dict[str, Callable]) -> Callable:
     """Create a RunPod serverless handler with given function registry.
 
@@ -131,6 +305,13 @@ def create_handler(function_registry: Dict[str, Callable]) -> Callable:
     4. Serializes result back to cloudpickle + base64
     5. Returns RunPod-compatible response dict
 
+    Function jobs carrying a "batch" list run the function once per item and
+    return per-item "results" (see runtime.batch). Class jobs carrying an
+    "instance_id" reuse a pooled instance and report its "instance_info" and
+    "instance_pooled" (see runtime.instance_pool). Class jobs carrying a "pipeline" list run
+    several methods on the instance and return the returned steps' "results"
+    with a "pipeline" marker (see runtime.pipeline).
+
     Args:
         function_registry: Dict mapping function names to function/class objects
 
@@ -177,25 +358,78 @@ def create_handler(function_registry: Dict[str, Callable]) -> Callable:
             }
 
         try:
-            # Deserialize arguments
-            args, kwargs = deserialize_arguments(job_input)
-
             # Get function/class from registry
             func_or_class = function_registry[function_name]
 
-            # Execute function or class
-            result = execute_function(
-                func_or_class, args, kwargs, execution_type, job_input
-            )
+            # Serialize results with the compression and type codecs the caller
+            # can decode, spilled to the blob store if the caller shares one
+            compression = CompressionPolicy.for_peer(job_input.get("compression"))
+            max_size = MAX_PAYLOAD_SIZE if job_input.get("blob_store") else None
+            type_codecs = accepted_type_codecs(job_input.get("type_codecs"))
+
+            batch = job_input.get("batch")
+            if batch is not None and execution_type == "function":
+                return {
+                    "success": True,
+                    "results": execute_batch(
+                        func_or_class, batch, compression, max_size, type_codecs
+                    ),
+                }
 
-            # Serialize result
-            serialized_result = serialize_result(result)
+            # Deserialize arguments
+            args, kwargs = deserialize_arguments(job_input)
 
+            # Execute function or class
+            instance_info = None
+            pipeline = job_input.get("pipeline")
+            if pipeline is not None and execution_type == "class":
+                instance, instance_info = get_class_instance(
+                    func_or_class, args, kwargs, job_input
+                )
+                response = {
+                    "success": True,
+                    "pipeline": True,
+                    "results": execute_pipeline(
+                        instance, pipeline, compression, max_size, type_codecs
+                    ),
+                }
+            else:
+                if execution_type == "class":
+                    result, instance_info = execute_class_method(
+                        func_or_class, args, kwargs, job_input
+                    )
+                else:
+                    result = execute_function(
+                        func_or_class, args, kwargs, execution_type, job_input
+                    )
+
+                serialized_result = serialize_result(
+                    result, compression, max_size, type_codecs
+                )
+
+                response = {
+                    "success": True,
+                    "result": serialized_result,
+                }
+            if instance_info is not None:
+                response["instance_id"] = instance_info["instance_id"]
+                response["instance_info"] = instance_info
+                # Tells the caller it may send lean calls for this instance
+                response["instance_pooled"] = (
+                    instance_info["instance_id"] in get_instance_pool()
+                )
+                response["worker_id"] = current_worker_id()
+            return response
+
+        except UnknownInstanceError as e:
+            # The caller re-establishes the instance with a full request
             return {
-                "success": True,
-                "result": serialized_result,
+                "success": False,
+                "error": str(e),
+                "instance_id": e.instance_id,
+                "instance_missing": True,
+                "worker_id": current_worker_id(),
             }
-
         except Exception as e:
             return {
                 "success": False,
@@ -0,0 +1,262 @@
+"""Worker-side pool of live remote class instances.
+
+Class jobs carry an instance_id naming the RemoteClassWrapper they come from.
+Instead of constructing the class for every method call, the handler keeps
+the instance alive in this pool, so an expensive __init__ (model weights,
+tokenizers, connections) runs once per instance and worker:
+
+    instance, info = get_instance_pool().acquire(instance_id, lambda: cls(*a))
+
+Instances are evicted least recently used first when the pool holds more than
+FLASH_INSTANCE_POOL_SIZE instances or more than FLASH_INSTANCE_POOL_MAX_BYTES
+of memory, and when they have been idle for FLASH_INSTANCE_IDLE_TTL seconds.
+An instance's memory is the growth of the process's resident set size while
+it was constructed; memory held outside the process heap (e.g. GPU memory) is
+not counted.
+
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .exceptions import UnknownInstanceError
+
+log = logging.getLogger(__name__)
+
+DEFAULT_INSTANCE_POOL_SIZE = 8
+DEFAULT_INSTANCE_IDLE_TTL = 1800.0  # seconds
+# 0 disables the memory budget
+DEFAULT_INSTANCE_POOL_MAX_BYTES = 0
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_worker_id() -> Optional[str]:
+    """ID of the worker running this process (the RunPod pod ID)."""
+    return os.getenv("RUNPOD_POD_ID")
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size of this process, None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class PooledInstance:
+    """A live class instance and its usage statistics.
+
+    Attributes:
+        instance: The constructed object
+        created_at: Creation time (epoch seconds)
+        last_used: Time of the latest acquire (epoch seconds)
+        call_count: Method calls served, including the creating one
+        memory_bytes: Resident memory growth while constructing
+    """
+
+    instance: Any
+    created_at: float
+    last_used: float
+    call_count: int = 0
+    memory_bytes: int = 0
+
+
+@dataclass
+class InstancePool:
+    """LRU pool of class instances keyed by instance_id.
+
+    Attributes:
+        max_instances: Maximum number of live instances
+        idle_ttl: Seconds an unused instance is kept
+        max_bytes: Memory budget of all instances (0 for none)
+        hits: Acquires served by a live instance
+        misses: Acquires that constructed a new instance
+    """
+
+    max_instances: int = DEFAULT_INSTANCE_POOL_SIZE
+    idle_ttl: float = DEFAULT_INSTANCE_IDLE_TTL
+    max_bytes: int = DEFAULT_INSTANCE_POOL_MAX_BYTES
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: "OrderedDict[str, PooledInstance]" = field(
+        default_factory=OrderedDict, init=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __post_init__(self) -> None:
+        if self.max_instances < 1:
+            raise ValueError(f"max_instances must be >= 1. Got: {self.max_instances}")
+        if self.idle_ttl <= 0:
+            raise ValueError(f"idle_ttl must be positive. Got: {self.idle_ttl}")
+        if self.max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0. Got: {self.max_bytes}")
+
+    @classmethod
+    def from_env(cls) -> "InstancePool":
+        """Pool sized by FLASH_INSTANCE_POOL_SIZE, FLASH_INSTANCE_IDLE_TTL and
+        FLASH_INSTANCE_POOL_MAX_BYTES."""
+        return cls(
+            max_instances=int(
+                os.getenv("FLASH_INSTANCE_POOL_SIZE", str(DEFAULT_INSTANCE_POOL_SIZE))
+            ),
+            idle_ttl=float(
+                os.getenv("FLASH_INSTANCE_IDLE_TTL", str(DEFAULT_INSTANCE_IDLE_TTL))
+            ),
+            max_bytes=int(
+                os.getenv(
+                    "FLASH_INSTANCE_POOL_MAX_BYTES",
+                    str(DEFAULT_INSTANCE_POOL_MAX_BYTES),
+                )
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, instance_id: str) -> bool:
+        return instance_id in self._entries
+
+    def acquire(
+        self,
+        instance_id: str,
+        factory: Optional[Callable[[], Any]],
+        create_new: bool = False,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get the live instance for instance_id, constructing it if needed.
+
+        Args:
+            instance_id: ID of the remote class instance
+            factory: Constructs the instance on a miss; None when the call
+                carries no constructor payload
+            create_new: Replace a live instance with a freshly constructed one
+
+        Returns:
+            Tuple of (instance, instance_info) for the FunctionResponse
+
+        Raises:
+            UnknownInstanceError: If the instance is not live and there is
+                no factory
+        """
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            entry = None if create_new else self._entries.get(instance_id)
+            if entry is not None:
+                self._entries.move_to_end(instance_id)
+                self.hits += 1
+                return self._use(instance_id, entry, now, hit=True)
+            if factory is None:
+                raise UnknownInstanceError(instance_id)
+            self.misses += 1
+
+        # Constructed outside the lock: __init__ may take minutes
+        rss_before = _rss_bytes()
+        instance = factory()
+        rss_after = _rss_bytes()
+        memory = (
+            max(0, rss_after - rss_before)
+            if rss_before is not None and rss_after is not None
+            else 0
+        )
+        log.debug(f"Created instance {instance_id} ({memory} bytes)")
+
+        with self._lock:
+            now = time.time()
+            entry = PooledInstance(instance, now, now, memory_bytes=memory)
+            self._entries.pop(instance_id, None)
+            self._entries[instance_id] = entry
+            self._evict(keep=instance_id)
+            return self._use(instance_id, entry, now, hit=False)
+
+    def info(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """Current instance_info of a live instance, None if not pooled."""
+        entry = self._entries.get(instance_id)
+        if entry is None:
+            return None
+        return self._info(instance_id, entry)
+
+    def discard(self, instance_id: str) -> bool:
+        """Drop an instance; True if it was pooled."""
+        with self._lock:
+            return self._entries.pop(instance_id, None) is not None
+
+    def clear(self) -> None:
+        """Drop every instance."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def memory_bytes(self) -> int:
+        """Memory attributed to the pooled instances."""
+        return sum(entry.memory_bytes for entry in self._entries.values())
+
+    def _use(
+        self, instance_id: str, entry: PooledInstance, now: float, hit: bool
+    ) -> Tuple[Any, Dict[str, Any]]:
+        entry.last_used = now
+        entry.call_count += 1
+        info = self._info(instance_id, entry)
+        info["hit"] = hit
+        return entry.instance, info
+
+    def _info(self, instance_id: str, entry: PooledInstance) -> Dict[str, Any]:
+        return {
+            "instance_id": instance_id,
+            "created_at": entry.created_at,
+            "last_used": entry.last_used,
+            "call_count": entry.call_count,
+            "memory_bytes": entry.memory_bytes,
+            "pool_size": len(self._entries),
+            "pool_hits": self.hits,
+            "pool_misses": self.misses,
+        }
+
+    def _expire(self, now: float) -> None:
+        """Drop instances idle for longer than idle_ttl."""
+        for instance_id in [
+            instance_id
+            for instance_id, entry in self._entries.items()
+            if now - entry.last_used > self.idle_ttl
+        ]:
+            del self._entries[instance_id]
+            log.debug(f"Evicted idle instance {instance_id}")
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used instances above the count and memory limits."""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_instances
+            or (self.max_bytes and self.memory_bytes > self.max_bytes)
+        ):
+            instance_id = next(iter(self._entries))
+            if instance_id == keep:
+                break
+            del self._entries[instance_id]
+            log.debug(f"Evicted instance {instance_id}")
+
+
+_pool: Optional[InstancePool] = None
+_pool_lock = threading.Lock()
+
+
+def set_instance_pool(pool: Optional[InstancePool]) -> None:
+    """Install the process-wide instance pool (None resets to the default)."""
+    global _pool
+    with _pool_lock:
+        _pool = pool
+
+
+def get_instance_pool() -> InstancePool:
+    """Get the process-wide instance pool, configured from the environment."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = InstancePool.from_env()
+        return _pool
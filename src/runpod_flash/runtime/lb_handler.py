@@ -16,20 +16,63 @@ Security Model:
     Users should NOT expose the /execute endpoint to untrusted clients.
 """
 
+import hashlib
 import inspect
 import logging
+import os
+from types import CodeType
 from typing import Any, Callable, Dict
 
 from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 
+from ..core.utils.lru_cache import LRUCache
+from .batch import deserialize_batch_item
+from .compression import CompressionPolicy
+from .config import MAX_PAYLOAD_SIZE
+from .type_codecs import accepted_type_codecs
 from .serialization import (
-    deserialize_args,
-    deserialize_kwargs,
+    deserialize_arg,
+    deserialize_arg_frames,
     serialize_arg,
+    serialize_arg_frames,
+)
+from .wire import (
+    FRAMES_CONTENT_TYPE,
+    accepts_frames,
+    encode_message,
+    encoded_size,
+    is_frames_content_type,
+    iter_chunks,
+    read_body,
+    unpack_message,
 )
 
 logger = logging.getLogger(__name__)
 
+# Compiled /execute function code keyed by SHA-256 of the source
+DEFAULT_CODE_CACHE_SIZE = 128
+_COMPILED_CODE = LRUCache(
+    max_size=int(os.getenv("FLASH_CODE_CACHE_SIZE", str(DEFAULT_CODE_CACHE_SIZE)))
+)
+
+
+def _compile_function_code(function_code: str) -> tuple[str, CodeType]:
+    """Compile function source once per distinct source.
+
+    Returns:
+        Tuple of (source hash, code object).
+
+    Raises:
+        SyntaxError: If the source does not compile.
+    """
+    code_hash = hashlib.sha256(function_code.encode("utf-8")).hexdigest()
+    compiled = _COMPILED_CODE.get(code_hash)
+    if compiled is None:
+        compiled = compile(function_code, "<string>", "exec")
+        _COMPILED_CODE[code_hash] = compiled
+    return code_hash, compiled
+
 
 def create_lb_handler(
     route_registry: Dict[tuple[str, str], Callable],
@@ -55,7 +98,7 @@ def create_lb_handler(
     if include_execute:
 
         @app.post("/execute")
-        async def execute_remote_function(request: Request) -> Dict[str, Any]:
+        async def execute_remote_function(request: Request) -> Any:
             """Framework endpoint for @remote decorator execution.
 
             WARNING: This endpoint is INTERNAL to the Flash framework. It should only be
@@ -70,74 +113,192 @@ def create_lb_handler(
                     "function_name": "process_data",
                     "function_code": "def process_data(x, y): return x + y",
                     "args": [base64_encoded_arg1, base64_encoded_arg2],
-                    "kwargs": {"key": base64_encoded_value}
+                    "kwargs": {"key": base64_encoded_value},
+                    "compression": ["zstd", "zlib"],  # optional, see runtime.compression
+                    "blob_store": true,  # optional, see runtime.blob_store
+                    "type_codecs": ["npy", "json"],  # optional, see runtime.type_codecs
+                    "function_hash": "sha256 of function_code",  # optional
+                    "batch": [{"args": [...], "kwargs": {...}}]  # optional
                 }
 
+            Batched calls:
+                Requests with "batch" run the function once per item (see
+                runtime.batch) and answer with per-item "results" instead of
+                "result". Batch values are base64 strings in both encodings.
+
+            Function code cache:
+                Compiled code is cached by the SHA-256 of its source, and
+                successful responses echo that hash as "function_hash". Clients
+                may then send only "function_hash"; if the worker no longer has
+                it, the response carries "function_code_required": true and
+                the client resends the source.
+
             Returns:
                 {
                     "success": true,
-                    "result": base64_encoded_result
+                    "result": base64_encoded_result,
+                    "function_hash": "sha256 of function_code"
                 }
                 or
                 {
                     "success": false,
                     "error": "error message"
                 }
+
+            Binary transport:
+                Requests with Content-Type application/x-flash-frames carry the
+                same fields in a frames envelope (see runtime.wire) with raw
+                cloudpickle args/kwargs, large buffers travelling out-of-band
+                (pickle protocol 5). Responses use the envelope whenever the
+                Accept header allows it, which also advertises support to clients.
             """
+            binary_request = is_frames_content_type(
+                request.headers.get("content-type", "")
+            )
+            binary_response = accepts_frames(request.headers.get("accept", ""))
+            loads = deserialize_arg_frames if binary_request else deserialize_arg
+
+            def respond(payload: Dict[str, Any]) -> Any:
+                if binary_response:
+                    # Stream parts so out-of-band result buffers are not copied
+                    parts = encode_message(payload)
+                    return StreamingResponse(
+                        iter_chunks(parts),
+                        media_type=FRAMES_CONTENT_TYPE,
+                        headers={"Content-Length": str(encoded_size(parts))},
+                    )
+                return payload
+
             try:
-                body = await request.json()
+                if binary_request:
+                    # Writable buffer: arrays rebuilt from it stay writable
+                    size = int(request.headers.get("content-length") or 0)
+                    body = unpack_message(await read_body(request.stream(), size))
+                else:
+                    body = await request.json()
             except Exception as e:
                 logger.error(f"Failed to parse request body: {e}")
-                return {"success": False, "error": f"Invalid request body: {e}"}
+                return respond(
+                    {"success": False, "error": f"Invalid request body: {e}"}
+                )
 
             try:
                 # Extract function metadata
                 function_name = body.get("function_name")
                 function_code = body.get("function_code")
+                function_hash = body.get("function_hash")
+
+                if not function_name or not (function_code or function_hash):
+                    return respond(
+                        {
+                            "success": False,
+                            "error": "Missing function_name or function_code in request",
+                        }
+                    )
 
-                if not function_name or not function_code:
-                    return {
-                        "success": False,
-                        "error": "Missing function_name or function_code in request",
-                    }
+                # Compress the result only for clients that can decode it
+                compression = CompressionPolicy.for_peer(body.get("compression"))
+                # Spill oversized JSON results only for clients sharing the store
+                max_size = MAX_PAYLOAD_SIZE if body.get("blob_store") else None
+                type_codecs = accepted_type_codecs(body.get("type_codecs"))
 
                 # Deserialize arguments
                 try:
-                    args = deserialize_args(body.get("args", []))
-                    kwargs = deserialize_kwargs(body.get("kwargs", {}))
+                    args = [loads(arg) for arg in body.get("args", [])]
+                    kwargs = {k: loads(v) for k, v in body.get("kwargs", {}).items()}
                 except Exception as e:
                     logger.error(f"Failed to deserialize arguments: {e}")
-                    return {
-                        "success": False,
-                        "error": f"Failed to deserialize arguments: {e}",
-                    }
+                    return respond(
+                        {
+                            "success": False,
+                            "error": f"Failed to deserialize arguments: {e}",
+                        }
+                    )
+
+                # Reuse compiled code; source is only sent until we acknowledge it
+                if function_code:
+                    try:
+                        function_hash, compiled = _compile_function_code(function_code)
+                    except SyntaxError as e:
+                        logger.error(f"Syntax error in function code: {e}")
+                        return respond(
+                            {
+                                "success": False,
+                                "error": f"Syntax error in function code: {e}",
+                            }
+                        )
+                else:
+                    compiled = _COMPILED_CODE.get(function_hash)
+                    if compiled is None:
+                        return respond(
+                            {
+                                "success": False,
+                                "error": f"Function code {function_hash[:12]} "
+                                "not cached on worker",
+                                "function_code_required": True,
+                            }
+                        )
 
                 # Execute function in isolated namespace
                 namespace: Dict[str, Any] = {}
                 try:
-                    exec(function_code, namespace)
+                    exec(compiled, namespace)
                 except SyntaxError as e:
                     logger.error(f"Syntax error in function code: {e}")
-                    return {
-                        "success": False,
-                        "error": f"Syntax error in function code: {e}",
-                    }
+                    return respond(
+                        {
+                            "success": False,
+                            "error": f"Syntax error in function code: {e}",
+                        }
+                    )
                 except Exception as e:
                     logger.error(f"Error executing function code: {e}")
-                    return {
-                        "success": False,
-                        "error": f"Error executing function code: {e}",
-                    }
+                    return respond(
+                        {
+                            "success": False,
+                            "error": f"Error executing function code: {e}",
+                        }
+                    )
 
                 # Get function from namespace
                 if function_name not in namespace:
-                    return {
-                        "success": False,
-                        "error": f"Function '{function_name}' not found in executed code",
-                    }
+                    return respond(
+                        {
+                            "success": False,
+                            "error": f"Function '{function_name}' not found in executed code",
+                        }
+                    )
 
                 func = namespace[function_name]
 
+                # Batched call: run once per item, results reported per item
+                batch = body.get("batch")
+                if batch is not None:
+                    results = []
+                    for item in batch:
+                        try:
+                            item_args, item_kwargs = deserialize_batch_item(item)
+                            result = func(*item_args, **item_kwargs)
+                            if inspect.iscoroutine(result):
+                                result = await result
+                            encoded = serialize_arg(
+                                result,
+                                compression,
+                                max_size=max_size,
+                                type_codecs=type_codecs,
+                            )
+                            results.append({"success": True, "result": encoded})
+                        except Exception as e:
+                            logger.error(f"Batch item execution failed: {e}")
+                            results.append({"success": False, "error": str(e)})
+                    return respond(
+                        {
+                            "success": True,
+                            "results": results,
+                            "function_hash": function_hash,
+                        }
+                    )
+
                 # Execute function
                 try:
                     result = func(*args, **kwargs)
@@ -147,25 +308,45 @@ def create_lb_handler(
                         result = await result
                 except Exception as e:
                     logger.error(f"Function execution failed: {e}")
-                    return {
-                        "success": False,
-                        "error": f"Function execution failed: {e}",
-                    }
+                    return respond(
+                        {
+                            "success": False,
+                            "error": f"Function execution failed: {e}",
+                        }
+                    )
 
                 # Serialize result
                 try:
-                    result_b64 = serialize_arg(result)
-                    return {"success": True, "result": result_b64}
+                    if binary_response:
+                        encoded = serialize_arg_frames(
+                            result, compression, type_codecs=type_codecs
+                        )
+                    else:
+                        encoded = serialize_arg(
+                            result,
+                            compression,
+                            max_size=max_size,
+                            type_codecs=type_codecs,
+                        )
+                    return respond(
+                        {
+                            "success": True,
+                            "result": encoded,
+                            "function_hash": function_hash,
+                        }
+                    )
                 except Exception as e:
                     logger.error(f"Failed to serialize result: {e}")
-                    return {
-                        "success": False,
-                        "error": f"Failed to serialize result: {e}",
-                    }
+                    return respond(
+                        {
+                            "success": False,
+                            "error": f"Failed to serialize result: {e}",
+                        }
+                    )
 
             except Exception as e:
                 logger.error(f"Unexpected error in /execute endpoint: {e}")
-                return {"success": False, "error": f"Unexpected error: {e}"}
+                return respond({"success": False, "error": f"Unexpected error: {e}"})
 
     # Register user-defined routes from registry
     for (method, path), handler in route_registry.items():
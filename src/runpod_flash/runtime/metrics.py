@@ -323,3 +323,41 @@ class LoadBalancerMetrics:
                 "candidates": str(total_candidates),
             },
         )
+
+
+class ResultCacheMetrics:
+    """Helper for emitting client-side result cache metrics."""
+
+    def __init__(self, collector: Optional[MetricsCollector] = None):
+        """Initialize result cache metrics helper.
+
+        Args:
+            collector: Optional MetricsCollector instance (uses global if not provided)
+        """
+        self.collector = collector or get_metrics_collector()
+
+    def cache_hit(self, function_name: str, tier: str) -> None:
+        """Emit metric for a call served from the result cache.
+
+        Args:
+            function_name: Name of the cached function
+            tier: Cache tier that served the result ("memory", "disk" or
+                "shared" for a call joining an identical in-flight call)
+        """
+        self.collector.counter(
+            "result_cache_hits",
+            value=1.0,
+            labels={"function_name": function_name, "tier": tier},
+        )
+
+    def cache_miss(self, function_name: str) -> None:
+        """Emit metric for a call executed remotely on a cache miss.
+
+        Args:
+            function_name: Name of the cached function
+        """
+        self.collector.counter(
+            "result_cache_misses",
+            value=1.0,
+            labels={"function_name": function_name},
+        )
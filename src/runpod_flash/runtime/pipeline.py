@@ -0,0 +1,83 @@
+"""Pipelined class method calls: several invocations in a single request.
+
+A pipelined class request carries the usual class fields plus ``pipeline``,
+an ordered list of method invocations on the request's instance:
+
+    {"method_name": "step_a", "args": [...], "kwargs": {...}, "returned": true}
+
+Arguments are encoded like top-level arguments (base64 cloudpickle strings),
+except that an argument may instead be a reference to the result of an
+earlier step, ``{"ref": step_index}``, which the worker substitutes without
+sending the value back and forth. References are only resolved as whole
+top-level arguments, not inside containers.
+
+Workers run the steps in order and answer with ``"pipeline": true`` and
+``results`` in the batch format (see runtime.batch), one entry per returned
+step: the steps flagged ``returned`` and the last step. Other step results
+stay on the worker. Steps after a failed step are skipped and reported as
+failed, since they may depend on it.
+
+The request's own method_name/args/kwargs repeat the first step, so workers
+without pipeline support run just that step and answer without the
+``pipeline`` marker; callers then run the remaining steps one by one.
+"""
+
+from typing import Any, Dict, List, Tuple, Union
+
+from .exceptions import SerializationError
+from .serialization import deserialize_arg, serialize_arg
+
+# Key of a step-result reference in a pipeline step's arguments
+STEP_REF_KEY = "ref"
+
+EncodedArg = Union[str, Dict[str, int]]
+
+
+class PipelineResults(list):
+    """Decoded results of the returned steps of a pipelined request.
+
+    Distinguishes a pipeline response from the single result of a worker
+    that ran only the first step.
+    """
+
+
+def is_returned_step(steps: List[Dict[str, Any]], index: int) -> bool:
+    """Whether a step's result is sent back: flagged steps and the last step."""
+    return bool(steps[index].get("returned")) or index == len(steps) - 1
+
+
+def encode_step_arg(value: Any, step_ref: Any = None) -> EncodedArg:
+    """Encode one step argument; step_ref is the index of a referenced step."""
+    if step_ref is not None:
+        return {STEP_REF_KEY: step_ref}
+    return serialize_arg(value)
+
+
+def _resolve(arg: EncodedArg, values: List[Any]) -> Any:
+    if isinstance(arg, dict):
+        index = arg.get(STEP_REF_KEY)
+        if not isinstance(index, int) or not 0 <= index < len(values):
+            raise SerializationError(
+                f"Invalid pipeline step reference {arg}: "
+                f"only the {len(values)} earlier step(s) can be referenced"
+            )
+        return values[index]
+    return deserialize_arg(arg)
+
+
+def resolve_step_arguments(
+    step: Dict[str, Any], values: List[Any]
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """Deserialize a step's arguments, substituting earlier step results.
+
+    Args:
+        step: Pipeline step with "args" and "kwargs"
+        values: Results of the steps before this one
+
+    Raises:
+        SerializationError: If an argument cannot be decoded or references
+            a step that did not run before this one
+    """
+    args = [_resolve(arg, values) for arg in step.get("args", [])]
+    kwargs = {key: _resolve(arg, values) for key, arg in step.get("kwargs", {}).items()}
+    return args, kwargs
@@ -1,12 +1,17 @@
 """Production wrapper for cross-endpoint function routing."""
 
+import asyncio
 import logging
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from runpod_flash.core.resources.serverless import ServerlessResource
 
+from .batch import BatchInput, decode_batch_results, serialize_batch
+from .blob_store import BlobDeduplicator, get_blob_store
+from .compression import CompressionPolicy, available_codecs
 from .exceptions import RemoteExecutionError
-from .serialization import serialize_args, serialize_kwargs
+from .serialization import serialize_call_args
+from .type_codecs import type_codec_names, type_codecs_from_env
 from .service_registry import ServiceRegistry
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,10 @@ class ProductionWrapper:
             service_registry: Service registry for routing decisions.
         """
         self.service_registry = service_registry
+        self.compression = CompressionPolicy.from_env()
+        # Endpoints of one app share the blob store via a network volume
+        self.dedup = BlobDeduplicator.from_env()
+        self.type_codecs = type_codecs_from_env()
 
     async def wrap_function_execution(
         self,
@@ -100,6 +109,93 @@ class ProductionWrapper:
             execution_type="function",
         )
 
+    async def wrap_batch_execution(
+        self,
+        original_stub_func: Callable,
+        func: Callable,
+        dependencies: Optional[list],
+        system_dependencies: Optional[list],
+        accelerate_downloads: bool,
+        inputs: Sequence[BatchInput],
+    ) -> List[Any]:
+        """Route a batch of calls to local or remote endpoint.
+
+        Remote endpoints receive the whole batch as one job (see
+        runtime.batch); local functions are called once per input.
+
+        Args:
+            original_stub_func: The original stubbed_resource function.
+            func: The decorated function being called.
+            dependencies: Pip dependencies (for local execution).
+            system_dependencies: System dependencies (for local execution).
+            accelerate_downloads: Download acceleration flag (for local).
+            inputs: (args, kwargs) per call.
+
+        Returns:
+            One entry per input: the result, or the exception it raised.
+
+        Raises:
+            RemoteExecutionError: If the remote job fails as a whole.
+        """
+        function_name = func.__name__
+
+        # Ensure manifest is loaded
+        await self.service_registry._ensure_manifest_loaded()
+
+        try:
+            resource = await self.service_registry.get_resource_for_function(
+                function_name
+            )
+        except ValueError as e:
+            logger.debug(
+                f"Function {function_name} not in manifest: {e}, executing locally"
+            )
+            resource = None
+
+        if resource is None:
+            return await asyncio.gather(
+                *(
+                    original_stub_func(
+                        func,
+                        dependencies,
+                        system_dependencies,
+                        accelerate_downloads,
+                        *args,
+                        **kwargs,
+                    )
+                    for args, kwargs in inputs
+                ),
+                return_exceptions=True,
+            )
+
+        logger.debug(
+            f"Routing batch of {len(inputs)} {function_name} calls to remote endpoint"
+        )
+        payload = {
+            "input": {
+                "function_name": function_name,
+                "execution_type": "function",
+                "batch": serialize_batch(
+                    inputs, self.compression, self.dedup, type_codecs=self.type_codecs
+                ),
+                **self._negotiation_fields(),
+            }
+        }
+
+        result = await resource.run_sync(payload)
+
+        if result.error:
+            raise RemoteExecutionError(
+                f"Remote execution of {function_name} failed: {result.error}"
+            )
+        output = result.output or {}
+        if "results" not in output:
+            raise RemoteExecutionError(
+                f"Remote execution of {function_name} failed: "
+                f"{output.get('error', 'endpoint does not support batches')}"
+            )
+        return decode_batch_results(output["results"])
+
     async def wrap_class_method_execution(
         self,
         original_method_func: Callable,
@@ -175,9 +271,10 @@ class ProductionWrapper:
         Raises:
             RemoteExecutionError: If remote execution fails.
         """
-        # Serialize arguments
-        serialized_args = serialize_args(args)
-        serialized_kwargs = serialize_kwargs(kwargs)
+        # Serialize arguments, spilling to the blob store above MAX_PAYLOAD_SIZE
+        serialized_args, serialized_kwargs = serialize_call_args(
+            args, kwargs, self.compression, self.dedup, type_codecs=self.type_codecs
+        )
 
         # Build payload matching RunPod format
         payload = {
@@ -186,6 +283,7 @@ class ProductionWrapper:
                 "execution_type": execution_type,
                 "args": serialized_args,
                 "kwargs": serialized_kwargs,
+                **self._negotiation_fields(),
             }
         }
 
@@ -200,6 +298,18 @@ class ProductionWrapper:
 
         return result.output
 
+    def _negotiation_fields(self) -> Dict[str, Any]:
+        """Payload fields telling the endpoint how results may be encoded."""
+        fields: Dict[str, Any] = {}
+        if self.compression is not None:
+            fields["compression"] = available_codecs()
+        if self.type_codecs is not None:
+            fields["type_codecs"] = type_codec_names()
+        if get_blob_store() is not None:
+            # Oversized results may come back as blob store references
+            fields["blob_store"] = True
+        return fields
+
     def _build_class_payload(self, request: Any) -> Dict[str, Any]:
         """Build payload from FunctionRequest for class execution.
 
@@ -1,18 +1,258 @@
 """Shared serialization utilities for cloudpickle + base64 encoding."""
 
 import base64
-from typing import Any, Dict, List
+import logging
+import pickle
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
 
 import cloudpickle
 
+from .blob_store import (
+    BlobDeduplicator,
+    get_blob_store,
+    is_blob_ref,
+    resolve_blob_ref,
+    store_blob,
+)
+from .compression import (
+    CompressionPolicy,
+    compress_blob,
+    decompress_blob,
+    is_compressed,
+)
+from .config import MAX_PAYLOAD_SIZE
 from .exceptions import SerializationError
+from .type_codecs import decode_typed, encode_typed, is_typed
 
+log = logging.getLogger(__name__)
 
-def serialize_arg(arg: Any) -> str:
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Contiguous buffers at least this large are pickled out-of-band (protocol 5)
+OUT_OF_BAND_THRESHOLD = 64 * 1024
+
+
+class _OutOfBandBytes:
+    """Wrapper that pickles a bytes-like value through a PickleBuffer.
+
+    Pickle serializes bytes and bytearray in-band regardless of protocol, and
+    memoryview not at all; wrapping a top-level argument lets it travel as an
+    out-of-band buffer. It is rebuilt as bytes (bytearray stays bytearray).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: BytesLike):
+        self.value = value
+
+    def __reduce_ex__(self, protocol: int):
+        rebuild = bytearray if isinstance(self.value, bytearray) else bytes
+        return rebuild, (pickle.PickleBuffer(self.value),)
+
+
+def _encode_blob(
+    data: BytesLike,
+    compression: Optional[CompressionPolicy],
+    dedup: Optional[BlobDeduplicator],
+) -> BytesLike:
+    """Apply blob store de-duplication, then compression, to a pickle stream."""
+    if dedup is not None:
+        ref = dedup.encode(data)
+        if ref is not data:
+            return ref
+    return compress_blob(data, compression)
+
+
+def _dumps(arg: Any, type_codecs: Optional[Sequence[str]]) -> BytesLike:
+    """Encode an argument with its type codec if allowed, else cloudpickle."""
+    data = encode_typed(arg, type_codecs)
+    return data if data is not None else cloudpickle.dumps(arg)
+
+
+def _loads_blob(data: BytesLike) -> Any:
+    """Load a blob, resolving compression, blob references and type codecs.
+
+    Compressed blobs, blob references and type-coded blobs each start with
+    their own 3-byte magic header beginning with 0xFF. Cloudpickle streams
+    always start with the PROTO opcode (0x80), so the header alone tells the
+    formats apart without trial decoding.
+    """
+    data = decompress_blob(data)
+    if is_blob_ref(data):
+        return resolve_blob_ref(data, _load_stored_blob)
+    if is_typed(data):
+        return decode_typed(data)
+    return cloudpickle.loads(data)
+
+
+def _load_stored_blob(stored: BinaryIO) -> Any:
+    """Load a blob from the blob store, streaming plain pickles from the file."""
+    head = stored.read(3)
+    stored.seek(0)
+    if is_compressed(head) or is_typed(head):
+        return _loads_blob(stored.read())
+    return cloudpickle.load(stored)
+
+
+def _b64_size(size: int) -> int:
+    return 4 * ((size + 2) // 3)
+
+
+def spill_oversized(
+    blobs: List[BytesLike], max_size: Optional[int] = MAX_PAYLOAD_SIZE
+) -> List[BytesLike]:
+    """Move the largest blobs to the blob store until the payload fits.
+
+    Sizes are measured base64-encoded, as the blobs travel in JSON job
+    payloads. Without a configured blob store the payload is sent as-is.
+
+    Args:
+        blobs: Serialized blobs making up one payload.
+        max_size: Payload limit in bytes (None disables the check).
+
+    Returns:
+        Blobs with the spilled ones replaced by blob store references.
+
+    Raises:
+        SerializationError: If uploading to the blob store fails.
+    """
+    sizes = [_b64_size(memoryview(blob).nbytes) for blob in blobs]
+    total = sum(sizes)
+    if max_size is None or total <= max_size:
+        return blobs
+
+    store = get_blob_store()
+    if store is None:
+        log.warning(
+            f"Serialized payload is {total} bytes, above the {max_size} byte "
+            "limit; set FLASH_BLOB_STORE_PATH to spill large values"
+        )
+        return blobs
+
+    spilled = list(blobs)
+    for i in sorted(range(len(blobs)), key=sizes.__getitem__, reverse=True):
+        if total <= max_size:
+            break
+        if is_blob_ref(blobs[i]):
+            continue
+        try:
+            spilled[i] = store_blob(blobs[i], store)
+        except Exception as e:
+            raise SerializationError(f"Failed to spill blob to store: {e}") from e
+        total -= sizes[i] - _b64_size(len(spilled[i]))
+    return spilled
+
+
+def serialize_arg_bytes(
+    arg: Any,
+    compression: Optional[CompressionPolicy] = None,
+    dedup: Optional[BlobDeduplicator] = None,
+    type_codecs: Optional[Sequence[str]] = None,
+) -> BytesLike:
+    """Serialize single argument with cloudpickle, without base64 encoding.
+
+    Used by binary transports (see runtime.wire) that carry raw blobs.
+
+    Args:
+        arg: Argument to serialize.
+        compression: Optional compression policy for the pickle stream.
+        dedup: Optional blob store de-duplication for large arguments.
+        type_codecs: Optional type codec names the receiver can decode.
+
+    Returns:
+        Cloudpickle serialized bytes.
+
+    Raises:
+        SerializationError: If serialization fails.
+    """
+    try:
+        data = _dumps(arg, type_codecs)
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize argument: {e}") from e
+    return _encode_blob(data, compression, dedup)
+
+
+def serialize_arg_frames(
+    arg: Any,
+    compression: Optional[CompressionPolicy] = None,
+    dedup: Optional[BlobDeduplicator] = None,
+    type_codecs: Optional[Sequence[str]] = None,
+) -> List[BytesLike]:
+    """Serialize single argument into a pickle frame plus out-of-band buffers.
+
+    Uses pickle protocol 5 so large contiguous buffers (NumPy arrays, Arrow
+    buffers, top-level bytes/bytearray/memoryview arguments, ...) are not
+    copied into the pickle stream.
+    They are returned as memoryviews over the original object's memory and
+    must be kept alive until the frames have been sent.
+
+    Args:
+        arg: Argument to serialize.
+        compression: Optional compression policy applied to every frame.
+            Compressed buffers are no longer zero-copy.
+        dedup: Optional blob store de-duplication. Arguments above its
+            threshold are pickled in-band, stored, and sent as one
+            reference frame.
+        type_codecs: Optional type codec names the receiver can decode.
+            Codecs for array-like types are skipped in favor of
+            out-of-band buffers.
+
+    Returns:
+        List of frames: the pickle stream followed by its out-of-band buffers.
+
+    Raises:
+        SerializationError: If serialization fails.
+    """
+    typed = encode_typed(arg, type_codecs, frames=True)
+    if typed is not None:
+        return [_encode_blob(typed, compression, dedup)]
+
+    buffers: List[memoryview] = []
+
+    def collect(buffer: pickle.PickleBuffer) -> bool:
+        view = buffer.raw()
+        if view.nbytes < OUT_OF_BAND_THRESHOLD:
+            # Truthy return keeps small buffers in-band
+            return True
+        buffers.append(view)
+        return False
+
+    value = arg
+    if isinstance(arg, (bytes, bytearray, memoryview)):
+        view = memoryview(arg)
+        if view.contiguous and view.nbytes >= OUT_OF_BAND_THRESHOLD:
+            value = _OutOfBandBytes(arg)
+
+    try:
+        data = cloudpickle.dumps(value, protocol=5, buffer_callback=collect)
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize argument: {e}") from e
+
+    frames = [data, *buffers]
+    if dedup is not None:
+        size = sum(memoryview(frame).nbytes for frame in frames)
+        if size >= dedup.min_size:
+            # The store holds single blobs; pickle in-band for the reference
+            return [serialize_arg_bytes(arg, compression, dedup, type_codecs)]
+    return [compress_blob(frame, compression) for frame in frames]
+
+
+def serialize_arg(
+    arg: Any,
+    compression: Optional[CompressionPolicy] = None,
+    dedup: Optional[BlobDeduplicator] = None,
+    max_size: Optional[int] = None,
+    type_codecs: Optional[Sequence[str]] = None,
+) -> str:
     """Serialize single argument with cloudpickle + base64.
 
     Args:
         arg: Argument to serialize.
+        compression: Optional compression policy for the pickle stream.
+        dedup: Optional blob store de-duplication for large arguments.
+        max_size: Optional encoded size limit; larger values are spilled to
+            the blob store.
+        type_codecs: Optional type codec names the receiver can decode.
 
     Returns:
         Base64-encoded cloudpickle serialized string.
@@ -21,16 +261,29 @@ def serialize_arg(arg: Any) -> str:
         SerializationError: If serialization fails.
     """
     try:
-        return base64.b64encode(cloudpickle.dumps(arg)).decode("utf-8")
+        data = _encode_blob(_dumps(arg, type_codecs), compression, dedup)
+        if max_size is not None:
+            (data,) = spill_oversized([data], max_size)
+        return base64.b64encode(data).decode("utf-8")
+    except SerializationError:
+        raise
     except Exception as e:
         raise SerializationError(f"Failed to serialize argument: {e}") from e
 
 
-def serialize_args(args: tuple) -> List[str]:
+def serialize_args(
+    args: tuple,
+    compression: Optional[CompressionPolicy] = None,
+    dedup: Optional[BlobDeduplicator] = None,
+    type_codecs: Optional[Sequence[str]] = None,
+) -> List[str]:
     """Serialize positional arguments.
 
     Args:
         args: Tuple of arguments to serialize.
+        compression: Optional compression policy applied per argument.
+        dedup: Optional blob store de-duplication for large arguments.
+        type_codecs: Optional type codec names the receiver can decode.
 
     Returns:
         List of base64-encoded serialized arguments.
@@ -39,18 +292,29 @@ def serialize_args(args: tuple) -> List[str]:
         SerializationError: If serialization fails.
     """
     try:
-        return [serialize_arg(arg) for arg in args]
+        return [
+            serialize_arg(arg, compression, dedup, type_codecs=type_codecs)
+            for arg in args
+        ]
     except SerializationError:
         raise
     except Exception as e:
         raise SerializationError(f"Failed to serialize args: {e}") from e
 
 
-def serialize_kwargs(kwargs: dict) -> Dict[str, str]:
+def serialize_kwargs(
+    kwargs: dict,
+    compression: Optional[CompressionPolicy] = None,
+    dedup: Optional[BlobDeduplicator] = None,
+    type_codecs: Optional[Sequence[str]] = None,
+) -> Dict[str, str]:
     """Serialize keyword arguments.
 
     Args:
         kwargs: Dictionary of keyword arguments.
+        compression: Optional compression policy applied per value.
+        dedup: Optional blob store de-duplication for large values.
+        type_codecs: Optional type codec names the receiver can decode.
 
     Returns:
         Dictionary with base64-encoded serialized values.
@@ -59,13 +323,114 @@ def serialize_kwargs(kwargs: dict) -> Dict[str, str]:
         SerializationError: If serialization fails.
     """
     try:
-        return {k: serialize_arg(v) for k, v in kwargs.items()}
+        return {
+            k: serialize_arg(v, compression, dedup, type_codecs=type_codecs)
+            for k, v in kwargs.items()
+        }
     except SerializationError:
         raise
     except Exception as e:
         raise SerializationError(f"Failed to serialize kwargs: {e}") from e
 
 
+def serialize_call_args(
+    args: tuple,
+    kwargs: dict,
+    compression: Optional[CompressionPolicy] = None,
+    dedup: Optional[BlobDeduplicator] = None,
+    max_size: Optional[int] = MAX_PAYLOAD_SIZE,
+    type_codecs: Optional[Sequence[str]] = None,
+) -> Tuple[List[str], Dict[str, str]]:
+    """Serialize positional and keyword arguments within a payload limit.
+
+    The largest values are spilled to the blob store when the encoded
+    arguments together exceed max_size.
+
+    Args:
+        args: Tuple of arguments to serialize.
+        kwargs: Dictionary of keyword arguments.
+        compression: Optional compression policy applied per value.
+        dedup: Optional blob store de-duplication for large values.
+        max_size: Payload limit in bytes (None disables spilling).
+        type_codecs: Optional type codec names the receiver can decode.
+
+    Returns:
+        Tuple of (base64-encoded args, base64-encoded kwargs).
+
+    Raises:
+        SerializationError: If serialization fails.
+    """
+    try:
+        values = [*args, *kwargs.values()]
+        blobs = [
+            serialize_arg_bytes(v, compression, dedup, type_codecs) for v in values
+        ]
+        encoded = [
+            base64.b64encode(blob).decode("utf-8")
+            for blob in spill_oversized(blobs, max_size)
+        ]
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize arguments: {e}") from e
+    return encoded[: len(args)], dict(zip(kwargs, encoded[len(args) :]))
+
+
+def deserialize_arg_bytes(data: BytesLike) -> Any:
+    """Deserialize single raw cloudpickle argument.
+
+    Args:
+        data: Cloudpickle serialized bytes (any bytes-like object), possibly
+            compressed or a blob store reference.
+
+    Returns:
+        Deserialized argument.
+
+    Raises:
+        SerializationError: If deserialization fails.
+    """
+    try:
+        return _loads_blob(data)
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to deserialize argument: {e}") from e
+
+
+def deserialize_arg_frames(frames: Union[BytesLike, Sequence[BytesLike]]) -> Any:
+    """Deserialize an argument produced by serialize_arg_frames.
+
+    Out-of-band buffers are handed to pickle as-is, so objects such as NumPy
+    arrays are rebuilt on top of the received memory without copying. Pass
+    writable buffers (e.g. views into a bytearray) to get writable arrays.
+
+    Args:
+        frames: Pickle stream followed by its out-of-band buffers, or a single
+            bytes-like pickle stream.
+
+    Returns:
+        Deserialized argument.
+
+    Raises:
+        SerializationError: If deserialization fails.
+    """
+    if isinstance(frames, (bytes, bytearray, memoryview)):
+        return deserialize_arg_bytes(frames)
+    if len(frames) == 1:
+        return deserialize_arg_bytes(frames[0])
+
+    data = decompress_blob(frames[0])
+    buffers = []
+    for frame in frames[1:]:
+        raw = decompress_blob(frame)
+        # Decompressed bytes are read-only; keep rebuilt arrays writable
+        buffers.append(bytearray(raw) if isinstance(raw, bytes) else raw)
+    try:
+        return cloudpickle.loads(data, buffers=buffers)
+    except Exception as e:
+        raise SerializationError(f"Failed to deserialize argument: {e}") from e
+
+
 def deserialize_arg(arg_b64: str) -> Any:
     """Deserialize single base64-encoded cloudpickle argument.
 
@@ -79,7 +444,9 @@ def deserialize_arg(arg_b64: str) -> Any:
         SerializationError: If deserialization fails.
     """
     try:
-        return cloudpickle.loads(base64.b64decode(arg_b64))
+        return _loads_blob(base64.b64decode(arg_b64))
+    except SerializationError:
+        raise
     except Exception as e:
         raise SerializationError(f"Failed to deserialize argument: {e}") from e
 
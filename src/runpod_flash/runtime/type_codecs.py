@@ -0,0 +1,339 @@
+"""Per-type codecs that replace cloudpickle for common data types.
+
+A codec encodes values of specific types into a tagged blob:
+
+    MAGIC (3 bytes) | name length (u8) | codec name | payload
+
+MAGIC never starts a pickle (see serialization._loads_blob); tagged blobs
+are dispatched by codec name.
+
+Built-in codecs (each used only when its packages are installed):
+
+- ``npy``: NumPy arrays as raw ``.npy`` (no object dtypes)
+- ``arrow``: pandas DataFrames and pyarrow Tables as Arrow IPC streams
+- ``tensor``: CPU torch tensors as a safetensors-style header plus raw data
+- ``json``: plain dicts/lists of JSON scalars via orjson. Checking that a
+  value round-trips exactly costs a Python-level walk, which makes it slower
+  than pickle for large containers, so ``all`` leaves it out; enable it by
+  name where payload size or interoperability matters.
+
+An encoder returns None to decline a value (object arrays, GPU tensors,
+dicts with non-string keys, ...), which then falls back to cloudpickle.
+Codecs are matched on the exact type, so subclasses also fall back.
+
+Senders opt in via FLASH_TYPE_CODECS and list the codecs they can decode in
+the request's ``type_codecs`` field; workers encode results only with codecs
+the client listed.
+"""
+
+import importlib.util
+import io
+import json
+import logging
+import math
+import os
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import SerializationError
+
+log = logging.getLogger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_MAGIC = b"\xffFC"
+_NAME_LEN = struct.Struct("!B")
+# safetensors-style header length prefix
+_TENSOR_HEADER_LEN = struct.Struct("<Q")
+# orjson rejects deeper nesting
+_MAX_JSON_DEPTH = 250
+
+
+@dataclass(frozen=True)
+class TypeCodec:
+    """Specialized encoder/decoder for a set of types.
+
+    Attributes:
+        name: Codec name used as the wire tag (at most 255 ASCII bytes).
+        types: Fully qualified type names handled, e.g. ``numpy.ndarray``.
+            Matching is on the exact type, so importing the package is not
+            needed until a value is encoded.
+        encode: Returns the payload, or None to fall back to cloudpickle.
+        decode: Rebuilds the value from the payload.
+        requires: Modules needed to decode; the codec is only advertised
+            when they are installed.
+        frames: Whether to use the codec for the binary frames transport.
+            Disable for array-like types that pickle protocol 5 already
+            ships out-of-band without copies.
+        default_enabled: Whether FLASH_TYPE_CODECS=all enables the codec.
+    """
+
+    name: str
+    types: Tuple[str, ...]
+    encode: Callable[[Any], Optional[BytesLike]]
+    decode: Callable[[memoryview], Any]
+    requires: Tuple[str, ...] = ()
+    frames: bool = True
+    default_enabled: bool = True
+
+
+_CODECS: Dict[str, TypeCodec] = {}
+_CODECS_BY_TYPE: Dict[str, TypeCodec] = {}
+
+
+def register_type_codec(codec: TypeCodec) -> None:
+    """Register a codec, replacing any codec with the same name or types."""
+    if len(codec.name.encode("ascii")) > 255:
+        raise ValueError(f"Codec name too long: {codec.name}")
+    previous = _CODECS.pop(codec.name, None)
+    if previous is not None:
+        for type_name in previous.types:
+            _CODECS_BY_TYPE.pop(type_name, None)
+    _CODECS[codec.name] = codec
+    for type_name in codec.types:
+        _CODECS_BY_TYPE[type_name] = codec
+
+
+@lru_cache(maxsize=None)
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def type_codec_names() -> List[str]:
+    """Names of registered codecs whose required modules are installed."""
+    return [
+        name
+        for name, codec in _CODECS.items()
+        if all(_installed(module) for module in codec.requires)
+    ]
+
+
+def type_codecs_from_env() -> Optional[List[str]]:
+    """Codecs a sender should use, from the environment.
+
+    Environment variables:
+    - FLASH_TYPE_CODECS: "all", or comma-separated codec names (default: off)
+
+    Returns:
+        Codec names, or None when type codecs are disabled.
+    """
+    value = os.getenv("FLASH_TYPE_CODECS", "").strip().lower()
+    if value in ("", "off", "none", "false", "0"):
+        return None
+    available = type_codec_names()
+    if value in ("all", "true", "1"):
+        return [name for name in available if _CODECS[name].default_enabled]
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unavailable = [name for name in names if name not in available]
+    if unavailable:
+        log.warning(f"Ignoring unavailable type codecs: {', '.join(unavailable)}")
+    return [name for name in names if name in available] or None
+
+
+def accepted_type_codecs(names: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """Codecs usable for replying to a peer that listed the ones it decodes."""
+    if not names:
+        return None
+    available = type_codec_names()
+    return [name for name in names if name in available] or None
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def encode_typed(
+    value: Any, allowed: Optional[Sequence[str]], frames: bool = False
+) -> Optional[bytes]:
+    """Encode a value with its registered codec.
+
+    Args:
+        value: Value to encode.
+        allowed: Codec names the receiver can decode (None disables codecs).
+        frames: Whether the blob is for the binary frames transport.
+
+    Returns:
+        Tagged blob, or None to fall back to cloudpickle.
+    """
+    if not allowed:
+        return None
+    codec = _CODECS_BY_TYPE.get(_qualified_name(type(value)))
+    if codec is None or codec.name not in allowed or (frames and not codec.frames):
+        return None
+
+    try:
+        payload = codec.encode(value)
+    except ImportError:
+        return None
+    except Exception as e:
+        log.debug(f"Codec {codec.name} declined {type(value).__name__}: {e}")
+        return None
+    if payload is None:
+        return None
+
+    name = codec.name.encode("ascii")
+    return b"".join((_MAGIC, _NAME_LEN.pack(len(name)), name, payload))
+
+
+def is_typed(data: BytesLike) -> bool:
+    """Check whether a blob was produced by a type codec."""
+    return bytes(memoryview(data)[:3]) == _MAGIC
+
+
+def decode_typed(data: BytesLike) -> Any:
+    """Decode a tagged blob with the codec named in its header.
+
+    Raises:
+        SerializationError: If the codec is unknown or decoding fails.
+    """
+    view = memoryview(data).cast("B")
+    (name_len,) = _NAME_LEN.unpack_from(view, len(_MAGIC))
+    start = len(_MAGIC) + _NAME_LEN.size
+    name = bytes(view[start : start + name_len]).decode("ascii")
+    codec = _CODECS.get(name)
+    if codec is None:
+        raise SerializationError(f"Cannot decode value: type codec '{name}' unknown")
+    try:
+        return codec.decode(view[start + name_len :])
+    except Exception as e:
+        raise SerializationError(f"Failed to decode {name} value: {e}") from e
+
+
+def _encode_npy(value: Any) -> Optional[bytes]:
+    import numpy as np
+
+    if value.dtype.hasobject:
+        return None
+    buf = io.BytesIO()
+    np.lib.format.write_array(buf, value, allow_pickle=False)
+    return buf.getvalue()
+
+
+def _decode_npy(payload: memoryview) -> Any:
+    import numpy as np
+
+    return np.load(io.BytesIO(payload), allow_pickle=False)
+
+
+def _encode_arrow(value: Any) -> Optional[bytes]:
+    import pyarrow as pa
+
+    if isinstance(value, pa.Table):
+        kind, table = b"T", value
+    else:
+        kind, table = b"D", pa.Table.from_pandas(value)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return kind + sink.getvalue().to_pybytes()
+
+
+def _decode_arrow(payload: memoryview) -> Any:
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(pa.py_buffer(payload[1:])).read_all()
+    return table.to_pandas() if payload[:1] == b"D" else table
+
+
+def _encode_tensor(value: Any) -> Optional[bytes]:
+    import torch
+
+    if value.device.type != "cpu" or value.requires_grad:
+        return None
+    header = json.dumps(
+        {"dtype": str(value.dtype).removeprefix("torch."), "shape": list(value.shape)}
+    ).encode("utf-8")
+    data = value.contiguous().reshape(-1).view(torch.uint8).numpy()
+    return b"".join((_TENSOR_HEADER_LEN.pack(len(header)), header, data.tobytes()))
+
+
+def _decode_tensor(payload: memoryview) -> Any:
+    import torch
+
+    (header_len,) = _TENSOR_HEADER_LEN.unpack_from(payload)
+    start = _TENSOR_HEADER_LEN.size
+    header = json.loads(bytes(payload[start : start + header_len]))
+    dtype = getattr(torch, header["dtype"])
+    data = payload[start + header_len :]
+    if not data.nbytes:
+        return torch.empty(header["shape"], dtype=dtype)
+    flat = torch.frombuffer(bytearray(data), dtype=torch.uint8)
+    return flat.view(dtype).reshape(header["shape"])
+
+
+def _is_plain_json(value: Any, depth: int = 0) -> bool:
+    """Check that JSON round-trips value exactly (no tuples, NaN, int keys)."""
+    kind = type(value)
+    if value is None or kind is str or kind is bool:
+        return True
+    if kind is int:
+        return -(2**63) <= value < 2**64
+    if kind is float:
+        return math.isfinite(value)
+    if depth >= _MAX_JSON_DEPTH:
+        return False
+    if kind is list:
+        return all(_is_plain_json(item, depth + 1) for item in value)
+    if kind is dict:
+        return all(
+            type(key) is str and _is_plain_json(item, depth + 1)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _encode_json(value: Any) -> Optional[bytes]:
+    import orjson
+
+    if not _is_plain_json(value):
+        return None
+    return orjson.dumps(value)
+
+
+def _decode_json(payload: memoryview) -> Any:
+    import orjson
+
+    return orjson.loads(payload)
+
+
+register_type_codec(
+    TypeCodec(
+        "npy",
+        ("numpy.ndarray",),
+        _encode_npy,
+        _decode_npy,
+        requires=("numpy",),
+        frames=False,
+    )
+)
+register_type_codec(
+    TypeCodec(
+        "arrow",
+        ("pandas.core.frame.DataFrame", "pyarrow.lib.Table"),
+        _encode_arrow,
+        _decode_arrow,
+        requires=("pyarrow",),
+    )
+)
+register_type_codec(
+    TypeCodec(
+        "tensor",
+        ("torch.Tensor",),
+        _encode_tensor,
+        _decode_tensor,
+        requires=("torch",),
+        frames=False,
+    )
+)
+register_type_codec(
+    TypeCodec(
+        "json",
+        ("builtins.dict", "builtins.list"),
+        _encode_json,
+        _decode_json,
+        requires=("orjson",),
+        default_enabled=False,
+    )
+)
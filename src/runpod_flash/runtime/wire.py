@@ -0,0 +1,261 @@
+"""Binary wire envelope for /execute requests and responses.
+
+The JSON protocol carries every cloudpickle blob as a base64 string, which
+inflates payloads by ~33% and costs extra copies on both ends. The frames
+envelope keeps the same message shape but moves blob fields into raw,
+length-prefixed frames:
+
+    MAGIC (4 bytes) | header length (u32) | header (UTF-8 JSON)
+    | frame count (u32) | frame lengths (u64 each) | frame bytes...
+
+Blob fields are ``args`` (list), ``kwargs`` (dict) and ``result`` (single
+value). In the header they are replaced by their frame layout; every other
+field travels in the JSON header unchanged. A blob may span several frames
+(a pickle protocol 5 stream followed by its out-of-band buffers); the header
+then lists the frame count of every blob under ``segments``.
+
+Content negotiation (opt-in on the client via FLASH_BINARY_WIRE):
+    Clients that support frames send ``Accept: application/x-flash-frames``.
+    Workers that understand it reply with a frames body, which tells the
+    client it may send frames requests from then on. Workers that predate the
+    envelope ignore the header and keep replying with JSON.
+"""
+
+import json
+import os
+import struct
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Union
+
+from .exceptions import SerializationError
+
+FRAMES_CONTENT_TYPE = "application/x-flash-frames"
+JSON_CONTENT_TYPE = "application/json"
+
+# Accept header advertising frames support with JSON as fallback
+FRAMES_ACCEPT = f"{FRAMES_CONTENT_TYPE}, {JSON_CONTENT_TYPE};q=0.5"
+
+_MAGIC = b"FLF1"
+_U32 = struct.Struct("!I")
+_U64 = struct.Struct("!Q")
+
+# Body chunk size used when streaming an envelope
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+BytesLike = Union[bytes, bytearray, memoryview]
+# A blob is one frame or a list of segments (pickle + out-of-band buffers)
+Blob = Union[BytesLike, List[BytesLike]]
+
+
+def binary_wire_enabled() -> bool:
+    """Check whether clients should negotiate the frames envelope.
+
+    Controlled by FLASH_BINARY_WIRE (default: false).
+    """
+    return os.getenv("FLASH_BINARY_WIRE", "false").lower() in ("1", "true", "yes")
+
+
+def is_frames_content_type(content_type: str) -> bool:
+    """Check whether a Content-Type header denotes the frames envelope."""
+    return content_type.split(";", 1)[0].strip().lower() == FRAMES_CONTENT_TYPE
+
+
+def accepts_frames(accept: str) -> bool:
+    """Check whether an Accept header allows a frames response."""
+    return any(
+        is_frames_content_type(part) for part in accept.split(",") if part.strip()
+    )
+
+
+def encode_message(message: Dict[str, Any]) -> List[BytesLike]:
+    """Encode a message into envelope parts without concatenating them.
+
+    Frames are referenced, not copied, so large out-of-band buffers can be
+    streamed straight from the caller's memory (see iter_chunks).
+
+    Args:
+        message: Message dict. ``args`` is a list and ``kwargs`` a dict of
+            blobs, ``result`` a blob or None. A blob is either a bytes-like
+            value or a list of bytes-like segments (pickle stream followed by
+            out-of-band buffers). Other fields must be JSON-serializable.
+
+    Returns:
+        Envelope parts in wire order.
+
+    Raises:
+        SerializationError: If the message cannot be encoded.
+    """
+    header = dict(message)
+
+    args = header.pop("args", None) or []
+    kwargs = header.pop("kwargs", None) or {}
+    result = header.pop("result", None)
+
+    blobs: List[Blob] = list(args) + list(kwargs.values())
+    header["args"] = len(args)
+    header["kwargs"] = list(kwargs.keys())
+    if result is not None:
+        header["result"] = True
+        blobs.append(result)
+
+    frames: List[BytesLike] = []
+    segments: List[int] = []
+    for blob in blobs:
+        if isinstance(blob, (bytes, bytearray, memoryview)):
+            frames.append(blob)
+            segments.append(1)
+        else:
+            frames.extend(blob)
+            segments.append(len(blob))
+    if any(count != 1 for count in segments):
+        header["segments"] = segments
+
+    try:
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise SerializationError(f"Failed to encode frames header: {e}") from e
+
+    parts: List[BytesLike] = [
+        _MAGIC,
+        _U32.pack(len(header_bytes)),
+        header_bytes,
+        _U32.pack(len(frames)),
+    ]
+    parts.extend(_U64.pack(memoryview(frame).nbytes) for frame in frames)
+    parts.extend(frames)
+    return parts
+
+
+def pack_message(message: Dict[str, Any]) -> bytes:
+    """Encode a message into a single frames envelope.
+
+    See encode_message for the accepted message shape.
+    """
+    return b"".join(encode_message(message))
+
+
+def encoded_size(parts: List[BytesLike]) -> int:
+    """Total size in bytes of envelope parts (the Content-Length)."""
+    return sum(memoryview(part).nbytes for part in parts)
+
+
+async def iter_chunks(
+    parts: List[BytesLike], chunk_size: int = STREAM_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Stream envelope parts as bounded chunks for an HTTP body.
+
+    Only one chunk is materialized at a time, so sending never holds a second
+    full copy of the payload.
+    """
+    pending: List[memoryview] = []
+    pending_size = 0
+    for part in parts:
+        view = memoryview(part).cast("B")
+        while view.nbytes:
+            piece = view[: chunk_size - pending_size]
+            view = view[piece.nbytes :]
+            pending.append(piece)
+            pending_size += piece.nbytes
+            if pending_size == chunk_size:
+                yield b"".join(pending)
+                pending, pending_size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+async def read_body(
+    chunks: AsyncIterable[bytes], size: Optional[int] = None
+) -> bytearray:
+    """Read a streamed body into one writable buffer.
+
+    Decoding frames from a bytearray yields writable memoryviews, so objects
+    rebuilt from out-of-band buffers (e.g. NumPy arrays) are writable and
+    share the body's memory instead of copying it.
+
+    Args:
+        chunks: Body chunks (Starlette ``request.stream()``, httpx
+            ``response.aiter_bytes()``).
+        size: Content-Length when known, used to preallocate the buffer.
+
+    Returns:
+        The complete body.
+    """
+    body = bytearray(size or 0)
+    offset = 0
+    async for chunk in chunks:
+        end = offset + len(chunk)
+        if end <= len(body):
+            body[offset:end] = chunk
+        else:
+            # Unknown or understated Content-Length; grow the buffer
+            body[offset:] = chunk
+        offset = end
+    del body[offset:]
+    return body
+
+
+def unpack_message(data: BytesLike) -> Dict[str, Any]:
+    """Decode a frames envelope back into a message dict.
+
+    Blob fields are returned as memoryviews into ``data`` so no payload bytes
+    are copied; pickle accepts them directly. If any blob was sent as several
+    segments, every blob comes back as a list of memoryviews (see
+    deserialize_arg_frames).
+
+    Args:
+        data: Encoded envelope.
+
+    Returns:
+        Message dict with ``args`` as a list and ``kwargs`` as a dict of
+        blobs, and ``result`` as a blob when present.
+
+    Raises:
+        SerializationError: If the envelope is malformed.
+    """
+    view = memoryview(data)
+    try:
+        if bytes(view[:4]) != _MAGIC:
+            raise ValueError("bad magic")
+        offset = 4
+
+        (header_len,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        header = json.loads(bytes(view[offset : offset + header_len]))
+        offset += header_len
+
+        (frame_count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        lengths = [
+            _U64.unpack_from(view, offset + i * _U64.size)[0]
+            for i in range(frame_count)
+        ]
+        offset += frame_count * _U64.size
+
+        frames = []
+        for length in lengths:
+            if offset + length > view.nbytes:
+                raise ValueError("truncated frame")
+            frames.append(view[offset : offset + length])
+            offset += length
+
+        segments = header.pop("segments", None)
+        if segments is None:
+            blobs: List[Blob] = frames
+        else:
+            if sum(segments) != len(frames):
+                raise ValueError("segment counts do not match frames")
+            blobs, start = [], 0
+            for count in segments:
+                blobs.append(frames[start : start + count])
+                start += count
+
+        arg_count = header.get("args", 0)
+        kwarg_names = header.get("kwargs", [])
+        header["args"] = blobs[:arg_count]
+        header["kwargs"] = dict(
+            zip(kwarg_names, blobs[arg_count : arg_count + len(kwarg_names)])
+        )
+        if header.pop("result", False):
+            header["result"] = blobs[arg_count + len(kwarg_names)]
+        return header
+    except (ValueError, IndexError, TypeError, struct.error, UnicodeDecodeError) as e:
+        raise SerializationError(f"Malformed frames envelope: {e}") from e
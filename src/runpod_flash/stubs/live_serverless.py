@@ -5,28 +5,73 @@ import textwrap
 import hashlib
 import traceback
 import threading
+import weakref
 import cloudpickle
 import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from ..core.resources import LiveServerless
+from ..core.resources.health_monitor import is_endpoint_failure
+from ..core.utils.lru_cache import LRUCache
 from ..protos.remote_execution import (
     FunctionRequest,
     FunctionResponse,
     RemoteExecutorStub,
 )
+from ..runtime.batch import decode_batch_results
+from ..runtime.exceptions import UnknownInstanceError
+from ..runtime.pipeline import PipelineResults
 from ..runtime.serialization import serialize_args, serialize_kwargs
 
+if TYPE_CHECKING:
+    from ..jobs import JobHandle
+
 log = logging.getLogger(__name__)
 
 
 # Global in-memory cache with thread safety
-_SERIALIZED_FUNCTION_CACHE = {}
+_SERIALIZED_FUNCTION_CACHE = LRUCache(max_size=1000)
 _function_cache_lock = threading.RLock()
 
+# Extracted (code object, source, hash) per function object; entries go away
+# with the function and are refreshed when its __code__ is replaced
+_FUNCTION_SOURCE_MEMO: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
 
 def get_function_source(func):
-    """Extract the function source code without the decorator."""
+    """Extract the function source code without the decorator.
+
+    The result is memoized per function object, so source lookup, parsing and
+    hashing happen once per function rather than on every call. The memo is
+    invalidated when the function's code object changes (e.g. hot reload).
+    """
     # Unwrap any decorators to get the original function
     func = inspect.unwrap(func)
+    # Bound methods are recreated on every attribute access; key on the function
+    target = getattr(func, "__func__", func)
+    code = getattr(target, "__code__", None)
+
+    with _function_cache_lock:
+        try:
+            memo = _FUNCTION_SOURCE_MEMO.get(target)
+        except TypeError:
+            # Not weak-referenceable; extract without memoizing
+            memo = None
+    if memo is not None and code is not None and memo[0] is code:
+        return memo[1], memo[2]
+
+    function_source, source_hash = _extract_function_source(func)
+
+    if code is not None:
+        with _function_cache_lock:
+            try:
+                _FUNCTION_SOURCE_MEMO[target] = (code, function_source, source_hash)
+            except TypeError:
+                pass
+    return function_source, source_hash
+
+
+def _extract_function_source(func):
+    """Parse the source of an unwrapped function and hash it."""
 
     # Get the source code of the decorated function
     source = inspect.getsource(func)
@@ -66,11 +111,70 @@ def get_function_source(func):
     return function_source, source_hash
 
 
+def function_response_from_job(
+    output: Any, error: Optional[str], worker_id: Optional[str] = None
+) -> FunctionResponse:
+    """Build the FunctionResponse of a finished job from its output and error.
+
+    worker_id (from the job status) fills in the executing worker when the
+    output does not report it.
+    """
+    if error:
+        stdout = output.get("stdout", "") if isinstance(output, dict) else ""
+        return FunctionResponse(
+            success=False, error=error, stdout=stdout, worker_id=worker_id
+        )
+    response = FunctionResponse(**output)
+    if response.worker_id is None:
+        response.worker_id = worker_id
+    return response
+
+
+def decode_function_response(response: FunctionResponse) -> Any:
+    """Print a response's captured stdout and return its deserialized result.
+
+    Batched responses return one entry per item (see
+    runtime.batch.decode_batch_results), and pipelined responses one entry
+    per returned step, as runtime.pipeline.PipelineResults.
+
+    Raises:
+        ValueError: If the response is malformed
+        UnknownInstanceError: If the request required a class instance the
+            worker does not have
+        Exception: If the remote execution failed
+    """
+    if response.instance_missing:
+        raise UnknownInstanceError(response.instance_id or "")
+    if not (response.success or response.error):
+        raise ValueError("Invalid response from server")
+
+    if response.stdout:
+        for line in response.stdout.splitlines():
+            print(line)
+
+    if response.success:
+        if response.pipeline:
+            return PipelineResults(decode_batch_results(response.results or []))
+        if response.results is not None:
+            return decode_batch_results(response.results)
+        if response.result is None:
+            raise ValueError("Response result is None")
+        return cloudpickle.loads(base64.b64decode(response.result))
+    else:
+        raise Exception(f"Remote execution failed: {response.error}")
+
+
 class LiveServerlessStub(RemoteExecutorStub):
     """Adapter class to make Runpod endpoints look like gRPC stubs."""
 
     def __init__(self, server: LiveServerless):
         self.server = server
+        # Class instances the worker reported keeping alive with
+        # instance_pooled (see runtime.instance_pool); later calls on them
+        # omit the class code and constructor arguments
+        self.pooled_instances: set = set()
+        # Worker that last served each class instance, for affinity mode
+        self.instance_workers: Dict[str, str] = {}
 
     def prepare_request(
         self,
@@ -108,44 +212,78 @@ class LiveServerlessStub(RemoteExecutorStub):
         return FunctionRequest(**request)
 
     def handle_response(self, response: FunctionResponse):
-        if not (response.success or response.error):
-            raise ValueError("Invalid response from server")
-
-        if response.stdout:
-            for line in response.stdout.splitlines():
-                print(line)
-
-        if response.success:
-            if response.result is None:
-                raise ValueError("Response result is None")
-            return cloudpickle.loads(base64.b64decode(response.result))
-        else:
-            raise Exception(f"Remote execution failed: {response.error}")
+        if response.success and response.instance_id:
+            # Workers without an instance pool echo instance_id too; only the
+            # explicit flag allows lean calls
+            if response.instance_pooled:
+                self.pooled_instances.add(response.instance_id)
+            else:
+                self.pooled_instances.discard(response.instance_id)
+            if response.worker_id:
+                self.instance_workers[response.instance_id] = response.worker_id
+        return decode_function_response(response)
 
     async def ExecuteFunction(
-        self, request: FunctionRequest, sync: bool = False
+        self, request: FunctionRequest, sync: Optional[bool] = None
     ) -> FunctionResponse:
+        """Execute a request on the endpoint.
+
+        Args:
+            request: Function or class execution request
+            sync: True for /runsync only, False for /run with polling. The
+                default (None) tries /runsync with a short wait and polls
+                jobs that run longer (see ServerlessResource.run_hybrid).
+
+        Raises:
+            Exception: Endpoint failures (transport errors, timeouts, HTTP
+                5xx; see is_endpoint_failure), so callers can re-probe the
+                endpoint. Other errors are returned as failed responses.
+        """
         try:
             # Convert the gRPC request to Runpod format
             payload = request.model_dump(exclude_none=True)
 
-            if sync:
+            if sync is None:
+                job = await self.server.run_hybrid(payload)
+            elif sync:
                 job = await self.server.run_sync(payload)
             else:
                 job = await self.server.run(payload)
 
-            if job.error:
-                return FunctionResponse(
-                    success=False,
-                    error=job.error,
-                    stdout=job.output.get("stdout", ""),
-                )
-
-            return FunctionResponse(**job.output)
+            return function_response_from_job(job.output, job.error, job.workerId)
 
         except Exception as e:
+            if is_endpoint_failure(e):
+                raise
             error_traceback = traceback.format_exc()
             return FunctionResponse(
                 success=False,
                 error=f"{str(e)}\n{error_traceback}",
             )
+
+    async def submit(self, request: FunctionRequest) -> "JobHandle":
+        """Queue a request as a job without waiting for its result.
+
+        Args:
+            request: Function execution request
+
+        Returns:
+            Handle to await, persist, poll or cancel the job
+
+        Raises:
+            ValueError: If the endpoint is not deployed
+        """
+        from ..jobs import JobHandle
+
+        if not self.server.id:
+            raise ValueError("Serverless is not deployed")
+
+        client = self.server.endpoint_client
+        job = await client.run(request.model_dump(exclude_none=True))
+        log.debug(f"{self.server} | Submitted Job:{job['id']}")
+        return JobHandle(
+            job_id=job["id"],
+            endpoint_id=client.endpoint_id,
+            base_url=client.base_url,
+            function_name=request.function_name,
+        )
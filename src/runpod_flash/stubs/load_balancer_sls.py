@@ -4,23 +4,66 @@ Enables @remote decorator to work with LoadBalancerSlsResource endpoints
 via direct HTTP calls instead of queue-based job submission.
 """
 
+import asyncio
+import base64
 import inspect
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
 
 import httpx
 
-from runpod_flash.core.utils.http import get_authenticated_httpx_client
+from runpod_flash.core.utils.http import get_shared_httpx_client
+from runpod_flash.hedging import Hedger, HedgePolicy
+from runpod_flash.runtime.batch import (
+    BatchInput,
+    decode_batch_results,
+    serialize_batch,
+)
+from runpod_flash.runtime.blob_store import BlobDeduplicator, get_blob_store
+from runpod_flash.runtime.compression import CompressionPolicy, available_codecs
 from runpod_flash.runtime.serialization import (
     deserialize_arg,
-    serialize_args,
-    serialize_kwargs,
+    deserialize_arg_frames,
+    serialize_arg,
+    serialize_arg_frames,
+    serialize_call_args,
+)
+from runpod_flash.runtime.type_codecs import type_codec_names, type_codecs_from_env
+from runpod_flash.runtime.wire import (
+    FRAMES_ACCEPT,
+    FRAMES_CONTENT_TYPE,
+    Blob,
+    binary_wire_enabled,
+    encode_message,
+    encoded_size,
+    is_frames_content_type,
+    iter_chunks,
+    read_body,
+    unpack_message,
 )
 from .live_serverless import get_function_source
 
 log = logging.getLogger(__name__)
 
 
+def _blob_to_b64(blob: Blob) -> str:
+    """Re-encode a frames blob as a base64 in-band cloudpickle string."""
+    if isinstance(blob, (bytes, bytearray, memoryview)):
+        return base64.b64encode(blob).decode("utf-8")
+    # Out-of-band buffers cannot travel in JSON; pickle the value in-band
+    return serialize_arg(deserialize_arg_frames(blob))
+
+
+def _frames_to_json(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw-blob request into its base64 JSON equivalent."""
+    converted = dict(request)
+    if "args" in request:
+        converted["args"] = [_blob_to_b64(arg) for arg in request["args"]]
+    if "kwargs" in request:
+        converted["kwargs"] = {k: _blob_to_b64(v) for k, v in request["kwargs"].items()}
+    return converted
+
+
 class LoadBalancerSlsStub:
     """HTTP-based stub for load-balanced serverless endpoint execution.
 
@@ -33,6 +76,47 @@ class LoadBalancerSlsStub:
     - Same function serialization pattern (cloudpickle + base64)
     - Lower latency but no automatic retries
 
+    Binary wire (opt-in via binary_wire or FLASH_BINARY_WIRE):
+        The stub advertises the frames envelope (runtime.wire) in its Accept
+        header. Once a worker answers with a frames body, later requests to it
+        are sent as frames with raw cloudpickle blobs instead of base64 JSON,
+        and large buffers (NumPy arrays, bytes, ...) travel out-of-band via
+        pickle protocol 5 without being copied into the pickle stream.
+        Workers without frames support keep receiving JSON.
+
+    Compression (opt-in via compression or FLASH_COMPRESSION):
+        Argument blobs above the policy threshold are compressed, and the
+        request lists the codecs this client can decode so the worker
+        compresses the result the same way.
+
+    Argument de-duplication (opt-in via dedup or FLASH_BLOB_STORE_PATH):
+        Large arguments are written once to a content-addressed blob store
+        shared with the workers and sent as digest references.
+
+    Type codecs (opt-in via type_codecs or FLASH_TYPE_CODECS):
+        Arrays, DataFrames, tensors and plain JSON data are encoded with
+        specialized codecs instead of cloudpickle (see runtime.type_codecs),
+        and the worker encodes the result with the codecs this client lists.
+
+    Function code by hash:
+        Every request carries the SHA-256 of the function source. Once the
+        worker echoes the hash back (it cached the compiled code), later
+        requests omit the source; on a worker cache miss the stub resends it.
+
+    Batched calls:
+        execute_batch() packs several inputs into one /execute request
+        (see runtime.batch); it backs .map() on @remote functions.
+
+    Hedged requests (opt-in via hedge, for idempotent functions):
+        A call without a response after a percentile of recent latencies is
+        sent again and the first successful response is used (see hedging).
+
+    Payload limit:
+        JSON requests whose arguments exceed MAX_PAYLOAD_SIZE spill the
+        largest ones to the blob store; with a store configured, the worker
+        spills oversized results the same way. Frames bodies are streamed and
+        not limited.
+
     Architecture:
         1. User calls @remote decorated function
         2. Decorator dispatches to this stub via singledispatch
@@ -48,15 +132,51 @@ class LoadBalancerSlsStub:
 
     DEFAULT_TIMEOUT = 30.0  # Default timeout in seconds
 
-    def __init__(self, server: Any, timeout: Optional[float] = None) -> None:
+    def __init__(
+        self,
+        server: Any,
+        timeout: Optional[float] = None,
+        binary_wire: Optional[bool] = None,
+        compression: Optional[CompressionPolicy] = None,
+        dedup: Optional[BlobDeduplicator] = None,
+        type_codecs: Optional[Sequence[str]] = None,
+        hedge: Optional[HedgePolicy] = None,
+    ) -> None:
         """Initialize stub with LoadBalancerSlsResource server.
 
         Args:
             server: LoadBalancerSlsResource instance with endpoint_url configured
             timeout: Request timeout in seconds (default: 30.0)
+            binary_wire: Negotiate the binary frames envelope for /execute
+                (default: FLASH_BINARY_WIRE environment variable)
+            compression: Compression policy for arguments and results
+                (default: FLASH_COMPRESSION environment variable, off if unset)
+            dedup: Blob store de-duplication for large arguments
+                (default: FLASH_BLOB_STORE_PATH environment variable, off if unset)
+            type_codecs: Type codec names to encode arguments with
+                (default: FLASH_TYPE_CODECS environment variable, off if unset)
+            hedge: Hedging policy for single calls; only set it for
+                idempotent functions (default: no hedging)
         """
         self.server = server
         self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self.binary_wire = (
+            binary_wire if binary_wire is not None else binary_wire_enabled()
+        )
+        self.compression = (
+            compression if compression is not None else CompressionPolicy.from_env()
+        )
+        self.dedup = dedup if dedup is not None else BlobDeduplicator.from_env()
+        self.type_codecs = (
+            type_codecs if type_codecs is not None else type_codecs_from_env()
+        )
+        # None until the worker's first response reveals frames support
+        self._peer_accepts_frames: Optional[bool] = None
+        # Source hashes of functions whose compiled code the worker has cached
+        self._worker_code: Set[str] = set()
+        # Routing decision per function; stubs are reused across calls via call plans
+        self._route_decisions: Dict[Callable[..., Any], bool] = {}
+        self.hedger = Hedger(hedge) if hedge is not None else None
 
     def _should_use_execute_endpoint(self, func: Callable[..., Any]) -> bool:
         """Determine if /execute endpoint should be used for this function.
@@ -130,8 +250,38 @@ class LoadBalancerSlsStub:
         Raises:
             Exception: If endpoint returns error or HTTP call fails
         """
+        if self.hedger is not None:
+            return await self.hedger.run(
+                lambda: self._call(
+                    func,
+                    dependencies,
+                    system_dependencies,
+                    accelerate_downloads,
+                    *args,
+                    **kwargs,
+                )
+            )
+        return await self._call(
+            func,
+            dependencies,
+            system_dependencies,
+            accelerate_downloads,
+            *args,
+            **kwargs,
+        )
+
+    async def _call(
+        self,
+        func: Callable[..., Any],
+        dependencies: Optional[List[str]],
+        system_dependencies: Optional[List[str]],
+        accelerate_downloads: bool,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Make one request for a call and return its result."""
         # Determine execution path based on resource type and routing metadata
-        if self._should_use_execute_endpoint(func):
+        if self._uses_execute_endpoint(func):
             # Local development or backward compatibility: use /execute endpoint
             request = self._prepare_request(
                 func,
@@ -141,7 +291,7 @@ class LoadBalancerSlsStub:
                 *args,
                 **kwargs,
             )
-            response = await self._execute_function(request)
+            response = await self._execute_function(request, func)
             return self._handle_response(response)
         else:
             # Deployed endpoint: use user-defined route
@@ -154,6 +304,84 @@ class LoadBalancerSlsStub:
                 **kwargs,
             )
 
+    def _uses_execute_endpoint(self, func: Callable[..., Any]) -> bool:
+        """Cached _should_use_execute_endpoint decision for a function."""
+        use_execute = self._route_decisions.get(func)
+        if use_execute is None:
+            use_execute = self._should_use_execute_endpoint(func)
+            self._route_decisions[func] = use_execute
+        return use_execute
+
+    async def execute_batch(
+        self,
+        func: Callable[..., Any],
+        dependencies: Optional[List[str]],
+        system_dependencies: Optional[List[str]],
+        accelerate_downloads: bool,
+        inputs: Sequence[BatchInput],
+    ) -> List[Any]:
+        """Execute a function once per input with a single /execute request.
+
+        The inputs travel as a "batch" list (see runtime.batch). User routes
+        and workers that predate batching get one request per input instead.
+
+        Args:
+            func: Function to execute
+            dependencies: Pip dependencies required
+            system_dependencies: System dependencies required
+            accelerate_downloads: Whether to accelerate downloads
+            inputs: (args, kwargs) per call
+
+        Returns:
+            One entry per input: the result, or the exception it raised.
+            Exceptions are returned, not raised.
+
+        Raises:
+            Exception: If the whole request fails
+        """
+        if not self._uses_execute_endpoint(func):
+            routing_config = func.__remote_config__
+            return await asyncio.gather(
+                *(
+                    self._execute_via_user_route(
+                        func,
+                        routing_config["method"],
+                        routing_config["path"],
+                        *args,
+                        **kwargs,
+                    )
+                    for args, kwargs in inputs
+                ),
+                return_exceptions=True,
+            )
+
+        request = self._prepare_request(
+            func, dependencies, system_dependencies, accelerate_downloads
+        )
+        request["batch"] = serialize_batch(
+            inputs, self.compression, self.dedup, type_codecs=self.type_codecs
+        )
+        response = await self._execute_function(request, func)
+
+        if "results" not in response:
+            # Worker ignored the batch; call it once per input instead
+            log.debug(f"{self.server.name} does not support batches, unpacking")
+            return await asyncio.gather(
+                *(
+                    self(
+                        func,
+                        dependencies,
+                        system_dependencies,
+                        accelerate_downloads,
+                        *args,
+                        **kwargs,
+                    )
+                    for args, kwargs in inputs
+                ),
+                return_exceptions=True,
+            )
+        return decode_batch_results(response["results"])
+
     def _prepare_request(
         self,
         func: Callable[..., Any],
@@ -176,35 +404,121 @@ class LoadBalancerSlsStub:
             **kwargs: Function keyword arguments
 
         Returns:
-            Request dictionary with serialized function and arguments
+            Request dictionary with serialized function and arguments. Args and
+            kwargs are raw bytes when the worker accepts the frames envelope.
         """
-        source, _ = get_function_source(func)
+        source, source_hash = get_function_source(func)
         log.debug(f"Extracted source for {func.__name__} ({len(source)} bytes)")
 
         request = {
             "function_name": func.__name__,
-            "function_code": source,
+            "function_hash": source_hash,
             "dependencies": dependencies or [],
             "system_dependencies": system_dependencies or [],
             "accelerate_downloads": accelerate_downloads,
         }
+        if source_hash not in self._worker_code:
+            request["function_code"] = source
+
+        if self.compression is not None:
+            # Codecs we can decode, so the worker compresses the result too
+            request["compression"] = available_codecs()
+        if get_blob_store() is not None:
+            # Oversized results may come back as blob store references
+            request["blob_store"] = True
+        if self.type_codecs:
+            # Codecs we can decode, so the worker encodes the result with them
+            request["type_codecs"] = type_codec_names()
+
+        # Serialize arguments using cloudpickle (+ base64 unless sending frames)
+        send_frames = self._send_frames()
+        compression, dedup, type_codecs = self.compression, self.dedup, self.type_codecs
+        if send_frames:
+            serialized_args = [
+                serialize_arg_frames(arg, compression, dedup, type_codecs)
+                for arg in args
+            ]
+            serialized_kwargs = {
+                k: serialize_arg_frames(v, compression, dedup, type_codecs)
+                for k, v in kwargs.items()
+            }
+        else:
+            # Spills the largest arguments to the blob store above MAX_PAYLOAD_SIZE
+            serialized_args, serialized_kwargs = serialize_call_args(
+                args, kwargs, compression, dedup, type_codecs=type_codecs
+            )
 
-        # Serialize arguments using cloudpickle + base64
         if args:
-            request["args"] = serialize_args(args)
+            request["args"] = serialized_args
             log.debug(f"Serialized {len(args)} positional args for {func.__name__}")
 
         if kwargs:
-            request["kwargs"] = serialize_kwargs(kwargs)
+            request["kwargs"] = serialized_kwargs
             log.debug(f"Serialized {len(kwargs)} keyword args for {func.__name__}")
 
         return request
 
-    async def _execute_function(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def _send_frames(self) -> bool:
+        """Whether requests should use the binary frames envelope."""
+        return self.binary_wire and bool(self._peer_accepts_frames)
+
+    def _is_frames_request(self, request: Dict[str, Any]) -> bool:
+        """Whether a prepared request carries raw blobs for the frames envelope."""
+        blobs = list(request.get("args", [])) + list(request.get("kwargs", {}).values())
+        if blobs:
+            return isinstance(blobs[0], (bytes, bytearray, memoryview, list))
+        return self._send_frames()
+
+    async def _execute_function(
+        self,
+        request: Dict[str, Any],
+        func: Optional[Callable[..., Any]] = None,
+    ) -> Dict[str, Any]:
         """Execute function via direct HTTP POST to endpoint.
 
         Posts serialized function and arguments to /execute endpoint.
         No job ID polling - waits for synchronous HTTP response.
+        Requests without function_code are resent with func's source if the
+        worker no longer has the compiled code cached.
+
+        Args:
+            request: Request dictionary with function_code and/or
+                function_hash, args, kwargs
+            func: Function the request calls, for resending its source
+
+        Returns:
+            Response dictionary with success flag and result (or per-item
+            results for batched requests)
+
+        Raises:
+            httpx.HTTPError: If HTTP request fails
+            ValueError: If endpoint_url not available
+        """
+        code_hash = request.get("function_hash")
+        response = await self._post_execute(request)
+
+        if (
+            response.get("function_code_required")
+            and "function_code" not in request
+            and func is not None
+        ):
+            # Concurrent calls may all miss; each resends the source itself
+            self._worker_code.discard(code_hash)
+            log.debug(f"{self.server.name} evicted {code_hash[:12]}, resending")
+            source, _ = get_function_source(func)
+            request = {**request, "function_code": source}
+            response = await self._post_execute(request)
+
+        if (
+            code_hash
+            and "function_code" in request
+            and response.get("function_hash") == code_hash
+        ):
+            self._worker_code.add(code_hash)
+        return response
+
+    async def _post_execute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a prepared request to the /execute endpoint.
 
         Args:
             request: Request dictionary with function_code, args, kwargs
@@ -224,10 +538,27 @@ class LoadBalancerSlsStub:
         execute_url = f"{self.server.endpoint_url}/execute"
 
         try:
-            async with get_authenticated_httpx_client(timeout=self.timeout) as client:
-                response = await client.post(execute_url, json=request)
+            # Pooled keep-alive client shared with every stub of this host
+            client = get_shared_httpx_client(self.server.endpoint_url)
+            if not self.binary_wire:
+                response = await client.post(
+                    execute_url, json=request, timeout=self.timeout
+                )
                 response.raise_for_status()
                 return response.json()
+
+            sent_frames = self._is_frames_request(request)
+            response = await self._post_negotiated(
+                client, execute_url, request, sent_frames
+            )
+            if sent_frames and not self._peer_accepts_frames:
+                # Worker no longer understands frames (e.g. redeployed with an
+                # older image); resend once as base64 JSON
+                log.debug(f"{self.server.name} rejected frames, resending JSON")
+                response = await self._post_negotiated(
+                    client, execute_url, _frames_to_json(request), False
+                )
+            return response
         except httpx.TimeoutException as e:
             raise TimeoutError(
                 f"Execution timeout on {self.server.name} after {self.timeout}s: {e}"
@@ -246,6 +577,50 @@ class LoadBalancerSlsStub:
                 f"Failed to connect to endpoint {self.server.name} ({execute_url}): {e}"
             ) from e
 
+    async def _post_negotiated(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        request: Dict[str, Any],
+        as_frames: bool,
+    ) -> Dict[str, Any]:
+        """POST a request advertising frames support and decode either body type.
+
+        Records whether the worker answered with the frames envelope, which
+        decides the encoding of subsequent requests.
+        """
+        headers = {"Accept": FRAMES_ACCEPT}
+        if as_frames:
+            # Stream the envelope so out-of-band buffers are never joined
+            parts = encode_message(request)
+            headers["Content-Type"] = FRAMES_CONTENT_TYPE
+            headers["Content-Length"] = str(encoded_size(parts))
+            stream = client.stream(
+                "POST",
+                url,
+                content=iter_chunks(parts),
+                headers=headers,
+                timeout=self.timeout,
+            )
+        else:
+            stream = client.stream(
+                "POST", url, json=request, headers=headers, timeout=self.timeout
+            )
+
+        async with stream as response:
+            if response.is_error:
+                # Error handling reads response.text
+                await response.aread()
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            self._peer_accepts_frames = is_frames_content_type(content_type)
+            if self._peer_accepts_frames:
+                size = int(response.headers.get("content-length") or 0)
+                return unpack_message(await read_body(response.aiter_bytes(), size))
+            await response.aread()
+            return response.json()
+
     async def _execute_via_user_route(
         self,
         func: Callable[..., Any],
@@ -296,14 +671,14 @@ class LoadBalancerSlsStub:
         log.debug(f"Executing via user route: {method} {url}")
 
         try:
-            async with get_authenticated_httpx_client(timeout=self.timeout) as client:
-                response = await client.request(method, url, json=body)
-                response.raise_for_status()
-                result = response.json()
-                log.debug(
-                    f"User route execution successful (type={type(result).__name__})"
-                )
-                return result
+            client = get_shared_httpx_client(self.server.endpoint_url)
+            response = await client.request(
+                method, url, json=body, timeout=self.timeout
+            )
+            response.raise_for_status()
+            result = response.json()
+            log.debug(f"User route execution successful (type={type(result).__name__})")
+            return result
         except httpx.TimeoutException as e:
             raise TimeoutError(
                 f"Execution timeout on {self.server.name} after {self.timeout}s: {e}"
@@ -339,12 +714,15 @@ class LoadBalancerSlsStub:
             raise ValueError(f"Invalid response type: {type(response)}")
 
         if response.get("success"):
-            result_b64 = response.get("result")
-            if result_b64 is None:
+            result_data = response.get("result")
+            if result_data is None:
                 raise ValueError("Response marked success but result is None")
 
             try:
-                result = deserialize_arg(result_b64)
+                if isinstance(result_data, (bytes, bytearray, memoryview, list)):
+                    result = deserialize_arg_frames(result_data)
+                else:
+                    result = deserialize_arg(result_data)
                 log.debug(
                     f"Successfully deserialized response result (type={type(result).__name__})"
                 )
@@ -57,6 +57,25 @@ def _create_live_serverless_stub(resource, **extra):
         response = await stub.ExecuteFunction(request)
         return stub.handle_response(response)
 
+    # Queue without waiting; the handle is awaited or polled later
+    async def submit(
+        func,
+        dependencies,
+        system_dependencies,
+        accelerate_downloads,
+        *args,
+        **kwargs,
+    ):
+        request = stub.prepare_request(
+            func,
+            dependencies,
+            system_dependencies,
+            accelerate_downloads,
+            *args,
+            **kwargs,
+        )
+        return await stub.submit(request)
+
     # Inject ProductionWrapper if in production mode
     if os.getenv("RUNPOD_ENDPOINT_ID"):
         try:
@@ -89,7 +108,25 @@ def _create_live_serverless_stub(resource, **extra):
                     original_class_method, request
                 )
 
+            # Batches for other endpoints go out as one job (see runtime.batch)
+            async def execute_batch(
+                func,
+                dependencies,
+                system_dependencies,
+                accelerate_downloads,
+                inputs,
+            ):
+                return await wrapper.wrap_batch_execution(
+                    original_stubbed,
+                    func,
+                    dependencies,
+                    system_dependencies,
+                    accelerate_downloads,
+                    inputs,
+                )
+
             stubbed_resource = wrapped_stubbed
+            stubbed_resource.execute_batch = execute_batch
             execute_class_method = wrapped_class_method
 
         except ImportError:
@@ -97,8 +134,11 @@ def _create_live_serverless_stub(resource, **extra):
                 "ProductionWrapper not available, cross-endpoint routing disabled"
             )
 
-    # Attach the method to the function
+    # Attach the methods to the function
     stubbed_resource.execute_class_method = execute_class_method
+    stubbed_resource.pooled_instances = stub.pooled_instances
+    stubbed_resource.instance_workers = stub.instance_workers
+    stubbed_resource.submit = submit
 
     return stubbed_resource
 
@@ -134,6 +174,18 @@ def _(resource, **extra):
         response = await stub.execute(payload, sync=extra.get("sync", False))
         return stub.handle_response(response)
 
+    async def submit(
+        func,
+        dependencies,
+        system_dependencies,
+        accelerate_downloads,
+        *args,
+        **kwargs,
+    ):
+        stub = ServerlessEndpointStub(resource)
+        return await stub.submit(stub.prepare_payload(func, *args, **kwargs))
+
+    stubbed_resource.submit = submit
     return stubbed_resource
 
 
@@ -158,13 +210,25 @@ def _(resource, **extra):
         response = await stub.execute(payload, sync=extra.get("sync", False))
         return stub.handle_response(response)
 
+    async def submit(
+        func,
+        dependencies,
+        system_dependencies,
+        accelerate_downloads,
+        *args,
+        **kwargs,
+    ):
+        stub = ServerlessEndpointStub(resource)
+        return await stub.submit(stub.prepare_payload(func, *args, **kwargs))
+
+    stubbed_resource.submit = submit
     return stubbed_resource
 
 
 @stub_resource.register(LoadBalancerSlsResource)
 def _(resource, **extra):
     """Create stub for LoadBalancerSlsResource (HTTP-based execution)."""
-    stub = LoadBalancerSlsStub(resource)
+    stub = LoadBalancerSlsStub(resource, hedge=extra.get("hedge"))
 
     async def stubbed_resource(
         func,
@@ -183,13 +247,14 @@ def _(resource, **extra):
             **kwargs,
         )
 
+    stubbed_resource.execute_batch = stub.execute_batch
     return stubbed_resource
 
 
 @stub_resource.register(LiveLoadBalancer)
 def _(resource, **extra):
     """Create stub for LiveLoadBalancer (HTTP-based execution, local testing)."""
-    stub = LoadBalancerSlsStub(resource)
+    stub = LoadBalancerSlsStub(resource, hedge=extra.get("hedge"))
 
     async def stubbed_resource(
         func,
@@ -208,4 +273,5 @@ def _(resource, **extra):
             **kwargs,
         )
 
+    stubbed_resource.execute_batch = stub.execute_batch
     return stubbed_resource
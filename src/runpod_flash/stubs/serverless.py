@@ -1,5 +1,10 @@
+from typing import TYPE_CHECKING
+
 from ..core.resources import ServerlessEndpoint, JobOutput
 
+if TYPE_CHECKING:
+    from ..jobs import JobHandle
+
 
 class ServerlessEndpointStub:
     """Adapter class to make Runpod endpoints requests."""
@@ -28,3 +33,22 @@ class ServerlessEndpointStub:
             raise Exception(f"Remote execution failed: {response.error}")
 
         raise ValueError("Invalid response from server")
+
+    async def submit(self, payload: dict) -> "JobHandle":
+        """
+        Queues a serverless endpoint request without waiting for its output.
+        Returns a JobHandle resolving to the raw job output.
+        """
+        from ..jobs import DECODE_OUTPUT, JobHandle
+
+        if not self.server.id:
+            raise ValueError("Serverless is not deployed")
+
+        client = self.server.endpoint_client
+        job = await client.run(payload)
+        return JobHandle(
+            job_id=job["id"],
+            endpoint_id=client.endpoint_id,
+            base_url=client.base_url,
+            decode=DECODE_OUTPUT,
+        )
@@ -344,6 +344,7 @@ def reset_singletons():
     # Also reset ResourceManager class variables to ensure clean state
     ResourceManager._resources = {}
     ResourceManager._resource_configs = {}
+    ResourceManager._resource_generations = {}
     ResourceManager._deployment_locks = {}
     ResourceManager._global_lock = None
     ResourceManager._lock_initialized = False
@@ -372,6 +373,7 @@ def reset_singletons():
 
     ResourceManager._resources = {}
     ResourceManager._resource_configs = {}
+    ResourceManager._resource_generations = {}
     ResourceManager._deployment_locks = {}
     ResourceManager._global_lock = None
     ResourceManager._lock_initialized = False
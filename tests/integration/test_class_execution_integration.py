@@ -251,10 +251,8 @@ class TestMultipleMethodCallsOnSameInstance:
                 "All calls should use same instance_id"
             )
 
-            # Verify create_new_instance is False after first call
-            assert (
-                calls[0][0][0].create_new_instance is False
-            )  # First call after initialization
+            # Verify create_new_instance is only set on the first call
+            assert calls[0][0][0].create_new_instance is True
             assert calls[1][0][0].create_new_instance is False
             assert calls[2][0][0].create_new_instance is False
 
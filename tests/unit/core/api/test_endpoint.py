@@ -0,0 +1,79 @@
+"""Tests for the async serverless endpoint job API client."""
+
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from runpod_flash.core.api.endpoint import EndpointClient
+
+
+@pytest.fixture
+def requests_seen():
+    return []
+
+
+@pytest.fixture
+def client(requests_seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        body = json.loads(request.content) if request.content else None
+        return httpx.Response(200, json={"path": request.url.path, "body": body})
+
+    shared = httpx.AsyncClient(
+        base_url="https://api.example/v2", transport=httpx.MockTransport(handler)
+    )
+    with patch(
+        "runpod_flash.core.api.endpoint.get_shared_httpx_client", return_value=shared
+    ):
+        yield EndpointClient("ep-1", "https://api.example/v2/")
+
+
+class TestEndpointClient:
+    """Test request routing of EndpointClient."""
+
+    async def test_run_wraps_input(self, client):
+        response = await client.run({"function_name": "f"})
+
+        assert response["path"] == "/v2/ep-1/run"
+        assert response["body"] == {"input": {"function_name": "f"}}
+
+    async def test_run_keeps_existing_input(self, client):
+        response = await client.run({"input": {"x": 1}})
+
+        assert response["body"] == {"input": {"x": 1}}
+
+    async def test_run_sync(self, client):
+        response = await client.run_sync({"input": {"x": 1}})
+
+        assert response["path"] == "/v2/ep-1/runsync"
+
+    async def test_run_sync_wait(self, client, requests_seen):
+        response = await client.run_sync({"x": 1}, wait=2.5)
+
+        assert response["body"] == {"input": {"x": 1}}
+        assert requests_seen[0].url.params["wait"] == "2500"
+
+    async def test_status_cancel_health(self, client, requests_seen):
+        await client.status("job-1")
+        await client.cancel("job-1")
+        await client.health()
+
+        assert [(r.method, r.url.path) for r in requests_seen] == [
+            ("GET", "/v2/ep-1/status/job-1"),
+            ("POST", "/v2/ep-1/cancel/job-1"),
+            ("GET", "/v2/ep-1/health"),
+        ]
+
+    async def test_error_status_raises(self):
+        shared = httpx.AsyncClient(
+            base_url="https://api.example/v2",
+            transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+        )
+        with patch(
+            "runpod_flash.core.api.endpoint.get_shared_httpx_client",
+            return_value=shared,
+        ):
+            with pytest.raises(httpx.HTTPStatusError):
+                await EndpointClient("ep-1").health()
@@ -1,9 +1,14 @@
 """Tests for HTTP utilities for RunPod API communication."""
 
 import requests
+from runpod_flash.core.utils import http as http_module
 from runpod_flash.core.utils.http import (
+    close_shared_httpx_clients,
     get_authenticated_httpx_client,
     get_authenticated_requests_session,
+    get_shared_httpx_client,
+    shared_client_http2,
+    shared_client_limits,
 )
 
 
@@ -123,3 +128,57 @@ class TestGetAuthenticatedRequestsSession:
 
         assert isinstance(session, requests.Session)
         session.close()
+
+
+class TestGetSharedHttpxClient:
+    """Test the pooled get_shared_httpx_client utility function."""
+
+    async def test_client_reused_per_host(self, monkeypatch):
+        """Test the same client is returned for a host on one event loop."""
+        monkeypatch.setattr(http_module.runpod, "api_key", None)
+        monkeypatch.setenv("RUNPOD_API_KEY", "test-key")
+
+        first = get_shared_httpx_client("https://api.example/v2")
+        second = get_shared_httpx_client("https://api.example/v2")
+        other = get_shared_httpx_client("https://other.example")
+
+        assert first is second
+        assert first is not other
+        assert first.headers["Authorization"] == "Bearer test-key"
+
+        await close_shared_httpx_clients()
+        assert first.is_closed
+        assert get_shared_httpx_client("https://api.example/v2") is not first
+        await close_shared_httpx_clients()
+
+    async def test_runpod_api_key_takes_precedence(self, monkeypatch):
+        """Test runpod.api_key is used before RUNPOD_API_KEY."""
+        monkeypatch.setattr(http_module.runpod, "api_key", "sdk-key")
+        monkeypatch.setenv("RUNPOD_API_KEY", "env-key")
+
+        client = get_shared_httpx_client("https://api.example/v2")
+
+        assert client.headers["Authorization"] == "Bearer sdk-key"
+        await close_shared_httpx_clients()
+
+    def test_limits_from_env(self, monkeypatch):
+        """Test pool limits are read from FLASH_HTTP_* variables."""
+        monkeypatch.setenv("FLASH_HTTP_MAX_CONNECTIONS", "8")
+        monkeypatch.setenv("FLASH_HTTP_MAX_KEEPALIVE", "4")
+        monkeypatch.setenv("FLASH_HTTP_KEEPALIVE_EXPIRY", "2.5")
+
+        limits = shared_client_limits()
+
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 4
+        assert limits.keepalive_expiry == 2.5
+
+    def test_http2_requires_h2_and_can_be_disabled(self, monkeypatch):
+        """Test HTTP/2 follows h2 availability and FLASH_HTTP2."""
+        monkeypatch.setattr(http_module, "h2", None)
+        assert shared_client_http2() is False
+
+        monkeypatch.setattr(http_module, "h2", object())
+        assert shared_client_http2() is True
+        monkeypatch.setenv("FLASH_HTTP2", "false")
+        assert shared_client_http2() is False
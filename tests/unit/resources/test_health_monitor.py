@@ -0,0 +1,200 @@
+"""Unit tests for ResourceHealthMonitor and its ResourceManager integration."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from runpod_flash.core.resources.health_monitor import (
+    HealthState,
+    ResourceHealthMonitor,
+    is_endpoint_failure,
+)
+from runpod_flash.core.resources.resource_manager import ResourceManager
+from runpod_flash.core.resources.serverless import ServerlessResource
+
+
+@pytest.fixture
+def monitor():
+    monitor = ResourceHealthMonitor()
+    yield monitor
+    monitor._records.clear()
+
+
+def _resource(healthy=True):
+    resource = MagicMock()
+    resource.is_deployed.return_value = healthy
+    return resource
+
+
+class TestResourceHealthMonitor:
+    """Test cached verdicts, staleness and scheduling."""
+
+    def test_unknown_key(self, monitor):
+        assert monitor.get_state("missing") is HealthState.UNKNOWN
+
+    async def test_check_now_caches_verdict(self, monitor):
+        resource = _resource(healthy=True)
+
+        assert await monitor.check_now("key", resource) is True
+        assert monitor.get_state("key") is HealthState.HEALTHY
+        resource.is_deployed.assert_called_once()
+
+    async def test_stale_verdict_is_unknown(self, monitor):
+        resource = _resource(healthy=True)
+        await monitor.check_now("key", resource)
+
+        monitor._records["key"].checked_at = (
+            time.monotonic() - monitor.staleness_budget - 1
+        )
+
+        assert monitor.get_state("key") is HealthState.UNKNOWN
+
+    async def test_mark_failed_clears_verdict(self, monitor):
+        await monitor.check_now("key", _resource(healthy=True))
+
+        monitor.mark_failed("key")
+
+        assert monitor.get_state("key") is HealthState.UNKNOWN
+
+    async def test_probe_exception_is_unhealthy(self, monitor):
+        resource = MagicMock()
+        resource.is_deployed.side_effect = RuntimeError("boom")
+
+        assert await monitor.check_now("key", resource) is False
+        assert monitor.get_state("key") is HealthState.UNHEALTHY
+
+    async def test_unhealthy_backs_off(self, monitor):
+        monitor.watch("key", _resource(healthy=False))
+
+        delays = []
+        for _ in range(4):
+            before = time.monotonic()
+            monitor.record("key", False)
+            delays.append(monitor._records["key"].next_check_at - before)
+
+        assert delays[-1] > delays[0]
+        assert all(d <= monitor.check_interval * (1 + monitor.jitter) for d in delays)
+
+    async def test_watch_replaced_resource_resets_state(self, monitor):
+        await monitor.check_now("key", _resource(healthy=True))
+
+        monitor.watch("key", _resource(healthy=True))
+
+        assert monitor.get_state("key") is HealthState.UNKNOWN
+
+    async def test_background_task_refreshes_due_resources(self, monitor):
+        resource = _resource(healthy=False)
+        monitor.watch("key", resource)
+        monitor._records["key"].next_check_at = 0.0
+
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if resource.is_deployed.called:
+                break
+
+        await monitor.stop()
+        resource.is_deployed.assert_called()
+        assert monitor.get_state("key") is HealthState.UNHEALTHY
+
+
+def _status_error(status_code):
+    request = httpx.Request("POST", "https://api.example/run")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+def _wrapped(cause):
+    try:
+        raise RuntimeError("HTTP error from endpoint") from cause
+    except RuntimeError as e:
+        return e
+
+
+class TestIsEndpointFailure:
+    """Test which call failures clear the cached verdict."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.ConnectError("refused"),
+            httpx.ReadTimeout("slow"),
+            ConnectionError("gone"),
+            TimeoutError("timeout"),
+            _status_error(503),
+            _wrapped(_status_error(500)),
+        ],
+    )
+    def test_endpoint_failures(self, error):
+        assert is_endpoint_failure(error) is True
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            Exception("Remote execution failed: ValueError: bad input"),
+            ValueError("bad input"),
+            _status_error(404),
+            _wrapped(_status_error(422)),
+        ],
+    )
+    def test_other_failures(self, error):
+        assert is_endpoint_failure(error) is False
+
+
+class TestResourceManagerHealth:
+    """Test that get_or_deploy_resource uses cached verdicts."""
+
+    async def test_healthy_verdict_skips_probe(self):
+        manager = ResourceManager()
+        resource = ServerlessResource(name="health-test", flashboot=False)
+        resource.id = "endpoint-health"
+        manager._add_resource(resource.get_resource_key(), resource)
+
+        with patch.object(
+            ServerlessResource, "is_deployed", return_value=True
+        ) as mock_probe:
+            for _ in range(5):
+                assert await manager.get_or_deploy_resource(resource) is resource
+
+        mock_probe.assert_called_once()
+
+    async def test_failed_call_forces_probe(self):
+        manager = ResourceManager()
+        resource = ServerlessResource(name="health-fail", flashboot=False)
+        resource.id = "endpoint-health-fail"
+        key = resource.get_resource_key()
+        manager._add_resource(key, resource)
+
+        with patch.object(
+            ServerlessResource, "is_deployed", return_value=True
+        ) as mock_probe:
+            await manager.get_or_deploy_resource(resource)
+            ResourceHealthMonitor().mark_failed(key)
+            await manager.get_or_deploy_resource(resource)
+
+        assert mock_probe.call_count == 2
+
+    async def test_unhealthy_verdict_invalidates_call_plan(self):
+        from runpod_flash.call_plan import CallPlanner
+
+        resource = ServerlessResource(name="health-plan", flashboot=False)
+        planner = CallPlanner(resource)
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=resource),
+            ) as mock_deploy,
+            patch("runpod_flash.call_plan.stub_resource"),
+        ):
+            plan = await planner.get()
+            monitor = ResourceHealthMonitor()
+            monitor.watch(plan.resource_key, resource)
+            monitor.record(plan.resource_key, False)
+            await planner.get()
+
+        assert mock_deploy.await_count == 2
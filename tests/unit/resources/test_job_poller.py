@@ -0,0 +1,117 @@
+"""Tests for the multiplexed job status poller."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from runpod_flash.core.resources.job_poller import JobPoller, get_job_poller
+
+
+def _client(responses):
+    """Client whose status() walks each job through its listed statuses."""
+    client = MagicMock()
+    remaining = {job_id: list(statuses) for job_id, statuses in responses.items()}
+
+    async def status(job_id):
+        status = remaining[job_id].pop(0)
+        if isinstance(status, Exception):
+            raise status
+        response = {"id": job_id, "status": status}
+        if status == "COMPLETED":
+            response.update(delayTime=100, executionTime=200, output=job_id)
+        return response
+
+    client.status = AsyncMock(side_effect=status)
+    return client
+
+
+class TestJobPoller:
+    """Test JobPoller scheduling and resolution."""
+
+    async def test_resolves_many_jobs(self):
+        client = _client(
+            {f"job-{i}": ["IN_QUEUE", "IN_PROGRESS", "COMPLETED"] for i in range(20)}
+        )
+        poller = JobPoller(client, min_interval=0.001, max_interval=0.01, max_qps=1000)
+
+        results = await asyncio.gather(*(poller.wait(f"job-{i}") for i in range(20)))
+
+        assert [r["output"] for r in results] == [f"job-{i}" for i in range(20)]
+        assert client.status.await_count == 60
+        assert poller.outstanding == 0
+
+    async def test_status_error_fails_waiter(self):
+        client = _client({"job-1": [ConnectionError("api down")]})
+        poller = JobPoller(client, min_interval=0.001)
+
+        with pytest.raises(ConnectionError, match="api down"):
+            await poller.wait("job-1")
+        assert poller.outstanding == 0
+
+    async def test_learns_expected_runtime(self):
+        client = _client({"job-1": ["COMPLETED"]})
+        poller = JobPoller(client, min_interval=0.001)
+
+        await poller.wait("job-1")
+
+        assert poller.expected_runtime == pytest.approx(0.3)
+
+    async def test_rate_limits_status_requests(self):
+        client = _client({f"job-{i}": ["COMPLETED"] for i in range(5)})
+        poller = JobPoller(client, min_interval=0.001, max_qps=50)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(poller.wait(f"job-{i}") for i in range(5)))
+
+        # Five requests at 50 QPS take at least four 20 ms slots
+        assert loop.time() - started >= 0.08
+
+    async def test_track_shares_polling_across_waiters(self):
+        client = _client({"job-1": ["IN_QUEUE", "COMPLETED"]})
+        poller = JobPoller(client, min_interval=0.001)
+
+        first = poller.track("job-1")
+        second = poller.track("job-1")
+
+        assert first is not second
+        assert (await first)["output"] == "job-1"
+        assert (await second)["output"] == "job-1"
+        assert client.status.await_count == 2
+
+    async def test_cancelled_waiter_leaves_others_waiting(self):
+        client = _client({"job-1": ["IN_QUEUE", "IN_QUEUE", "COMPLETED"]})
+        poller = JobPoller(client, min_interval=0.01)
+
+        cancelled = asyncio.ensure_future(poller.wait("job-1"))
+        waiter = asyncio.ensure_future(poller.wait("job-1"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert (await waiter)["output"] == "job-1"
+        assert cancelled.cancelled()
+
+    async def test_cancelled_waiter_drops_job(self):
+        client = _client({"job-1": ["IN_QUEUE"] * 100})
+        poller = JobPoller(client, min_interval=0.01)
+
+        waiter = asyncio.ensure_future(poller.wait("job-1"))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+
+        assert poller.outstanding == 0
+
+
+class TestGetJobPoller:
+    """Test per-endpoint poller sharing."""
+
+    async def test_shared_per_endpoint(self):
+        first, second, other = MagicMock(), MagicMock(), MagicMock()
+        first.base_url = second.base_url = other.base_url = "https://api.example/v2"
+        first.endpoint_id = second.endpoint_id = "ep-1"
+        other.endpoint_id = "ep-2"
+
+        assert get_job_poller(first) is get_job_poller(second)
+        assert get_job_poller(first) is not get_job_poller(other)
@@ -2,7 +2,9 @@
 Unit tests for ServerlessResource and related classes.
 """
 
+import asyncio
 import os
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Any, Dict
@@ -584,31 +586,31 @@ class TestServerlessResourceDeployment:
         serverless = ServerlessResource(name="test")
         serverless.id = "endpoint-123"
 
-        mock_endpoint = MagicMock()
-        mock_endpoint.rp_client.post.return_value = {
-            "id": "job-123",
-            "workerId": "worker-456",
-            "status": "COMPLETED",
-            "delayTime": 1000,
-            "executionTime": 2000,
-            "output": {"result": "success"},
-        }
+        mock_client = MagicMock()
+        mock_client.run_sync = AsyncMock(
+            return_value={
+                "id": "job-123",
+                "workerId": "worker-456",
+                "status": "COMPLETED",
+                "delayTime": 1000,
+                "executionTime": 2000,
+                "output": {"result": "success"},
+            }
+        )
 
         payload = {"input": "test data"}
 
         with patch.object(
             type(serverless),
-            "endpoint",
-            new_callable=lambda: property(lambda self: mock_endpoint),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
         ):
             result = await serverless.run_sync(payload)
 
         assert isinstance(result, JobOutput)
         assert result.id == "job-123"
         assert result.status == "COMPLETED"
-        mock_endpoint.rp_client.post.assert_called_once_with(
-            "endpoint-123/runsync", payload, timeout=60
-        )
+        mock_client.run_sync.assert_awaited_once_with(payload)
 
     @pytest.mark.asyncio
     async def test_run_sync_no_id_raises_error(self):
@@ -618,16 +620,124 @@ class TestServerlessResourceDeployment:
         with pytest.raises(ValueError, match="Serverless is not deployed"):
             await serverless.run_sync({"input": "test"})
 
+    @pytest.mark.asyncio
+    async def test_run_hybrid_returns_fast_job(self):
+        """Test run_hybrid returns /runsync results without polling."""
+        serverless = ServerlessResource(name="test")
+        serverless.id = "endpoint-123"
+
+        mock_client = MagicMock()
+        mock_client.run_sync = AsyncMock(
+            return_value={
+                "id": "job-123",
+                "workerId": "worker-456",
+                "status": "COMPLETED",
+                "delayTime": 10,
+                "executionTime": 200,
+                "output": {"result": "fast"},
+            }
+        )
+        mock_client.status = AsyncMock()
+
+        with patch.object(
+            type(serverless),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
+        ):
+            result = await serverless.run_hybrid({"input": "x"}, wait=2.0)
+
+        assert result.output == {"result": "fast"}
+        assert mock_client.run_sync.await_args.kwargs["wait"] == 2.0
+        assert mock_client.run_sync.await_args.kwargs["timeout"] > 2.0
+        mock_client.status.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_hybrid_polls_long_job(self):
+        """Test run_hybrid keeps polling a job that outlives the wait."""
+        serverless = ServerlessResource(name="test")
+        serverless.id = "endpoint-123"
+
+        mock_client = MagicMock()
+        mock_client.run_sync = AsyncMock(
+            return_value={"id": "job-123", "status": "IN_PROGRESS"}
+        )
+        mock_client.status = AsyncMock(
+            return_value={
+                "id": "job-123",
+                "workerId": "worker-456",
+                "status": "COMPLETED",
+                "delayTime": 10,
+                "executionTime": 90000,
+                "output": {"result": "slow"},
+            }
+        )
+        mock_client.run = AsyncMock()
+
+        with patch.object(
+            type(serverless),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
+        ):
+            result = await serverless.run_hybrid({"input": "x"})
+
+        assert result.output == {"result": "slow"}
+        mock_client.status.assert_awaited_once_with("job-123")
+        mock_client.run.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_hybrid_client_timeout_raises(self):
+        """Test a /runsync request timing out on the client is an error."""
+        serverless = ServerlessResource(name="test")
+        serverless.id = "endpoint-123"
+
+        mock_client = MagicMock()
+        mock_client.run_sync = AsyncMock(side_effect=httpx.ReadTimeout("timed out"))
+        mock_client.cancel = AsyncMock()
+
+        with patch.object(
+            type(serverless),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
+        ):
+            with pytest.raises(TimeoutError, match="may still be running"):
+                await serverless.run_hybrid({"input": "x"})
+
+        # /runsync had not reported a job ID to cancel
+        mock_client.cancel.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_hybrid_cancels_job_when_caller_times_out(self):
+        """Test a caller's timeout while polling cancels the job."""
+        serverless = ServerlessResource(name="test")
+        serverless.id = "endpoint-123"
+
+        async def never_finishes(job_id):
+            return {"id": job_id, "status": "IN_PROGRESS"}
+
+        mock_client = MagicMock()
+        mock_client.run_sync = AsyncMock(
+            return_value={"id": "job-123", "status": "IN_QUEUE"}
+        )
+        mock_client.status = AsyncMock(side_effect=never_finishes)
+        mock_client.cancel = AsyncMock(side_effect=Exception("cancel failed"))
+
+        with patch.object(
+            type(serverless),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
+        ):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(serverless.run_hybrid({"input": "x"}), 0.2)
+
+        mock_client.cancel.assert_awaited_once_with("job-123")
+
     @pytest.mark.asyncio
     async def test_run_async_success(self):
         """Test run async execution success."""
         serverless = ServerlessResource(name="test")
         serverless.id = "endpoint-123"
 
-        mock_job = MagicMock()
-        mock_job.job_id = "job-123"
-        mock_job.status.side_effect = ["IN_QUEUE", "IN_PROGRESS", "COMPLETED"]
-        mock_job._fetch_job.return_value = {
+        completed = {
             "id": "job-123",
             "workerId": "worker-456",
             "status": "COMPLETED",
@@ -635,16 +745,24 @@ class TestServerlessResourceDeployment:
             "executionTime": 2000,
             "output": {"result": "success"},
         }
-
-        mock_endpoint = MagicMock()
-        mock_endpoint.run.return_value = mock_job
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(
+            return_value={"id": "job-123", "status": "IN_QUEUE"}
+        )
+        mock_client.status = AsyncMock(
+            side_effect=[
+                {"id": "job-123", "status": "IN_QUEUE"},
+                {"id": "job-123", "status": "IN_PROGRESS"},
+                completed,
+            ]
+        )
 
         payload = {"input": "test data"}
 
         with patch.object(
             type(serverless),
-            "endpoint",
-            new_callable=lambda: property(lambda self: mock_endpoint),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
         ):
             with patch("asyncio.sleep"):  # Mock sleep to speed up test
                 result = await serverless.run(payload)
@@ -652,6 +770,8 @@ class TestServerlessResourceDeployment:
         assert isinstance(result, JobOutput)
         assert result.id == "job-123"
         assert result.status == "COMPLETED"
+        assert mock_client.status.await_count == 3
+        mock_client.status.assert_awaited_with("job-123")
 
     @pytest.mark.asyncio
     async def test_run_async_failure_cancels_job(self):
@@ -659,23 +779,22 @@ class TestServerlessResourceDeployment:
         serverless = ServerlessResource(name="test")
         serverless.id = "endpoint-123"
 
-        mock_job = MagicMock()
-        mock_job.job_id = "job-123"
-        mock_job.status.side_effect = Exception("Job failed")
-        mock_job.cancel.return_value = None
-
-        mock_endpoint = MagicMock()
-        mock_endpoint.run.return_value = mock_job
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(
+            return_value={"id": "job-123", "status": "IN_QUEUE"}
+        )
+        mock_client.status = AsyncMock(side_effect=Exception("Job failed"))
+        mock_client.cancel = AsyncMock(return_value={})
 
         with patch.object(
             type(serverless),
-            "endpoint",
-            new_callable=lambda: property(lambda self: mock_endpoint),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
         ):
             with pytest.raises(Exception, match="Job failed"):
                 await serverless.run({"input": "test"})
 
-        mock_job.cancel.assert_called_once()
+        mock_client.cancel.assert_awaited_once_with("job-123")
 
 
 class TestServerlessEndpoint:
@@ -828,34 +947,38 @@ class TestServerlessResourceEdgeCases:
         serverless = ServerlessResource(name="test")
         serverless.id = "endpoint-123"
 
-        mock_endpoint = MagicMock()
-        mock_endpoint.rp_client.post.side_effect = Exception("Request failed")
-        mock_endpoint.health.return_value = {
-            "workers": {
-                "idle": 0,
-                "initializing": 0,
-                "ready": 0,
-                "running": 0,
-                "throttled": 1,
-                "unhealthy": 0,
-            },
-            "jobs": {
-                "completed": 0,
-                "failed": 0,
-                "inProgress": 0,
-                "inQueue": 0,
-                "retried": 0,
-            },
-        }
+        mock_client = MagicMock()
+        mock_client.run_sync = AsyncMock(side_effect=Exception("Request failed"))
+        mock_client.health = AsyncMock(
+            return_value={
+                "workers": {
+                    "idle": 0,
+                    "initializing": 0,
+                    "ready": 0,
+                    "running": 0,
+                    "throttled": 1,
+                    "unhealthy": 0,
+                },
+                "jobs": {
+                    "completed": 0,
+                    "failed": 0,
+                    "inProgress": 0,
+                    "inQueue": 0,
+                    "retried": 0,
+                },
+            }
+        )
 
         with patch.object(
             type(serverless),
-            "endpoint",
-            new_callable=lambda: property(lambda self: mock_endpoint),
+            "endpoint_client",
+            new_callable=lambda: property(lambda self: mock_client),
         ):
             with pytest.raises(Exception, match="Request failed"):
                 await serverless.run_sync({"input": "test"})
 
+        mock_client.health.assert_awaited_once()
+
 
 class TestLivePrefixNaming:
     """Test live- prefix naming for auto-provisioned resources."""
@@ -0,0 +1,43 @@
+"""Tests for batched request encoding."""
+
+from runpod_flash.runtime.batch import (
+    decode_batch_results,
+    deserialize_batch_item,
+    serialize_batch,
+)
+from runpod_flash.runtime.blob_store import LocalBlobStore, set_blob_store
+from runpod_flash.runtime.exceptions import RemoteExecutionError
+from runpod_flash.runtime.serialization import serialize_arg
+
+
+def test_serialize_batch_round_trip():
+    items = serialize_batch([((1, 2), {}), ((), {"x": [3]})])
+
+    assert deserialize_batch_item(items[0]) == ([1, 2], {})
+    assert deserialize_batch_item(items[1]) == ([], {"x": [3]})
+
+
+def test_serialize_batch_spills_over_limit(tmp_path):
+    set_blob_store(LocalBlobStore(tmp_path))
+    big = bytes(range(256)) * 16
+
+    try:
+        items = serialize_batch([((big,), {}), ((big,), {})], max_size=4096)
+
+        assert sum(len(arg) for item in items for arg in item["args"]) < 4096
+        assert deserialize_batch_item(items[1]) == ([big], {})
+    finally:
+        set_blob_store(None)
+
+
+def test_decode_batch_results():
+    outcomes = decode_batch_results(
+        [
+            {"success": True, "result": serialize_arg(5)},
+            {"success": False, "error": "boom"},
+        ]
+    )
+
+    assert outcomes[0] == 5
+    assert isinstance(outcomes[1], RemoteExecutionError)
+    assert "boom" in str(outcomes[1])
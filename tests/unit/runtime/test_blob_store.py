@@ -0,0 +1,196 @@
+"""Tests for the blob store: argument de-duplication and payload spilling."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from runpod_flash.runtime import blob_store
+from runpod_flash.runtime.blob_store import (
+    BlobDeduplicator,
+    LocalBlobStore,
+    blob_ref_digest,
+    get_blob_store,
+    is_blob_ref,
+    set_blob_store,
+)
+from runpod_flash.runtime.compression import CODEC_ZLIB, CompressionPolicy
+from runpod_flash.runtime.exceptions import SerializationError
+from runpod_flash.runtime.generic_handler import create_handler
+from runpod_flash.runtime.serialization import (
+    deserialize_arg,
+    deserialize_arg_frames,
+    deserialize_args,
+    deserialize_kwargs,
+    serialize_arg,
+    serialize_arg_frames,
+    serialize_args,
+    serialize_call_args,
+)
+
+PAYLOAD = bytes(range(256)) * 1024
+
+
+@pytest.fixture(autouse=True)
+def reset_blob_state():
+    blob_store._RESOLVED_BLOBS.clear()
+    yield
+    set_blob_store(None)
+    blob_store._RESOLVED_BLOBS.clear()
+
+
+@pytest.fixture
+def store(tmp_path):
+    local = LocalBlobStore(tmp_path / "blobs")
+    set_blob_store(local)
+    return local
+
+
+@pytest.fixture
+def dedup(store):
+    return BlobDeduplicator(store, min_size=1024)
+
+
+class TestLocalBlobStore:
+    """Test the filesystem backend."""
+
+    def test_put_get_exists(self, tmp_path):
+        local = LocalBlobStore(tmp_path)
+        digest = "ab" * 32
+
+        assert not local.exists(digest)
+        local.put(digest, b"data")
+
+        assert local.exists(digest)
+        assert local.get(digest) == b"data"
+        assert (tmp_path / "ab" / digest).is_file()
+
+    def test_missing_raises_key_error(self, tmp_path):
+        with pytest.raises(KeyError):
+            LocalBlobStore(tmp_path).get("cd" * 32)
+
+    def test_store_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(blob_store, "_store_configured", False)
+        monkeypatch.setenv("FLASH_BLOB_STORE_PATH", str(tmp_path))
+
+        assert isinstance(get_blob_store(), LocalBlobStore)
+        assert BlobDeduplicator.from_env() is not None
+
+    def test_disabled_without_env(self, monkeypatch):
+        monkeypatch.setattr(blob_store, "_store_configured", False)
+        monkeypatch.delenv("FLASH_BLOB_STORE_PATH", raising=False)
+
+        assert BlobDeduplicator.from_env() is None
+
+
+class TestBlobDeduplicator:
+    """Test client-side reference encoding."""
+
+    def test_small_blob_unchanged(self, dedup):
+        data = b"x" * 10
+        assert dedup.encode(data) is data
+
+    def test_uploads_once(self, dedup):
+        with patch.object(dedup.store, "put", wraps=dedup.store.put) as put:
+            first = dedup.encode(PAYLOAD)
+            second = dedup.encode(PAYLOAD)
+
+        assert first == second
+        assert is_blob_ref(first)
+        put.assert_called_once()
+        assert dedup.store.get(blob_ref_digest(first)) == PAYLOAD
+
+    def test_store_failure_sends_inline(self):
+        failing = MagicMock()
+        failing.exists.return_value = False
+        failing.put.side_effect = OSError("volume not mounted")
+
+        assert BlobDeduplicator(failing, min_size=1).encode(PAYLOAD) is PAYLOAD
+
+
+class TestSerializationDedup:
+    """Test references through the serialization helpers."""
+
+    def test_roundtrip(self, dedup):
+        encoded = serialize_arg(PAYLOAD, dedup=dedup)
+
+        assert len(encoded) < 100
+        assert deserialize_arg(encoded) == PAYLOAD
+
+    def test_worker_reuses_resolved_object(self, dedup, store):
+        encoded = serialize_arg([PAYLOAD], dedup=dedup)
+
+        with patch.object(store, "open", wraps=store.open) as open_blob:
+            first = deserialize_arg(encoded)
+            second = deserialize_arg(encoded)
+
+        assert first is second
+        open_blob.assert_called_once()
+
+    def test_frames_use_single_reference(self, dedup):
+        frames = serialize_arg_frames(bytearray(PAYLOAD), dedup=dedup)
+
+        assert len(frames) == 1
+        assert is_blob_ref(frames[0])
+        assert deserialize_arg_frames(frames) == PAYLOAD
+
+    def test_missing_store_raises(self, dedup):
+        encoded = serialize_arg(PAYLOAD, dedup=dedup)
+        set_blob_store(None)
+
+        with pytest.raises(SerializationError, match="no blob store"):
+            deserialize_arg(encoded)
+
+    def test_missing_blob_raises(self, dedup, tmp_path):
+        encoded = serialize_arg(PAYLOAD, dedup=dedup)
+        set_blob_store(LocalBlobStore(tmp_path / "other"))
+
+        with pytest.raises(SerializationError, match="not found"):
+            deserialize_arg(encoded)
+
+
+class TestPayloadSpill:
+    """Test spilling payloads above the size limit."""
+
+    def test_spills_largest_until_under_limit(self, store):
+        small = b"s" * 1000
+        args, kwargs = serialize_call_args(
+            (PAYLOAD, small), {"big": PAYLOAD * 2}, max_size=len(PAYLOAD) * 2
+        )
+
+        assert len(kwargs["big"]) < 100
+        assert len(args[1]) > 1000
+        assert deserialize_args(args) == [PAYLOAD, small]
+        assert deserialize_kwargs(kwargs) == {"big": PAYLOAD * 2}
+
+    def test_under_limit_stays_inline(self, store):
+        args, _ = serialize_call_args((PAYLOAD,), {})
+
+        assert len(args[0]) > len(PAYLOAD)
+
+    def test_without_store_sends_inline(self):
+        set_blob_store(None)
+
+        args, _ = serialize_call_args((PAYLOAD,), {}, max_size=1024)
+
+        assert deserialize_arg(args[0]) == PAYLOAD
+
+    def test_spilled_compressed_blob_roundtrip(self, store):
+        compressible = b"flash " * 100_000
+        policy = CompressionPolicy(codec=CODEC_ZLIB, min_size=1024)
+
+        encoded = serialize_arg(compressible, policy, max_size=1024)
+
+        assert len(encoded) < 100
+        assert deserialize_arg(encoded) == compressible
+
+    def test_handler_spills_result_for_store_clients(self, store):
+        handler = create_handler({"echo": lambda x: x})
+        job_input = {"function_name": "echo", "args": serialize_args((PAYLOAD,))}
+
+        with patch("runpod_flash.runtime.generic_handler.MAX_PAYLOAD_SIZE", 1024):
+            inline = handler({"input": job_input})
+            spilled = handler({"input": dict(job_input, blob_store=True)})
+
+        assert len(inline["result"]) > len(PAYLOAD)
+        assert len(spilled["result"]) < 100
+        assert deserialize_arg(spilled["result"]) == PAYLOAD
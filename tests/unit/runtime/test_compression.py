@@ -0,0 +1,200 @@
+"""Tests for optional blob compression."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import cloudpickle
+import httpx
+import pytest
+
+from runpod_flash.runtime.compression import (
+    CODEC_ZLIB,
+    CompressionPolicy,
+    available_codecs,
+    compress_blob,
+    decompress_blob,
+    is_compressed,
+)
+from runpod_flash.runtime.exceptions import SerializationError
+from runpod_flash.runtime.generic_handler import create_handler
+from runpod_flash.runtime.lb_handler import create_lb_handler
+from runpod_flash.runtime.serialization import (
+    deserialize_arg,
+    deserialize_arg_frames,
+    serialize_arg,
+    serialize_arg_frames,
+    serialize_args,
+)
+from runpod_flash.stubs.load_balancer_sls import LoadBalancerSlsStub
+
+COMPRESSIBLE = b"flash " * 50_000
+
+
+@pytest.fixture
+def zlib_policy():
+    return CompressionPolicy(codec=CODEC_ZLIB, min_size=1024)
+
+
+class TestCompressBlob:
+    """Test compress_blob/decompress_blob."""
+
+    def test_roundtrip(self, zlib_policy):
+        blob = compress_blob(COMPRESSIBLE, zlib_policy)
+
+        assert is_compressed(blob)
+        assert len(blob) < len(COMPRESSIBLE) // 10
+        assert decompress_blob(blob) == COMPRESSIBLE
+
+    def test_below_threshold_unchanged(self, zlib_policy):
+        data = b"x" * 100
+        assert compress_blob(data, zlib_policy) is data
+
+    def test_adaptive_skips_incompressible(self, zlib_policy):
+        data = os.urandom(256 * 1024)
+
+        assert compress_blob(data, zlib_policy) is data
+
+    def test_non_adaptive_still_falls_back_when_larger(self):
+        policy = CompressionPolicy(codec=CODEC_ZLIB, min_size=1024, adaptive=False)
+        data = os.urandom(256 * 1024)
+
+        assert compress_blob(data, policy) is data
+
+    def test_magic_prefixed_data_is_escaped(self):
+        data = b"\xffFZ" + b"raw buffer"
+
+        blob = compress_blob(data)
+
+        assert blob != data
+        assert bytes(decompress_blob(blob)) == data
+
+    def test_uncompressed_pickle_passes_through(self):
+        data = cloudpickle.dumps({"a": 1})
+        assert decompress_blob(data) is data
+
+    def test_unknown_codec_rejected(self):
+        blob = b"\xffFZ\x7f" + (10).to_bytes(8, "big") + b"payload"
+
+        with pytest.raises(SerializationError, match="not available"):
+            decompress_blob(blob)
+
+    def test_corrupt_payload_rejected(self, zlib_policy):
+        blob = bytearray(compress_blob(COMPRESSIBLE, zlib_policy))
+        blob[20:40] = b"\x00" * 20
+
+        with pytest.raises(SerializationError, match="decompress"):
+            decompress_blob(blob)
+
+
+class TestCompressionPolicy:
+    """Test policy configuration and negotiation."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("FLASH_COMPRESSION", raising=False)
+        assert CompressionPolicy.from_env() is None
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("FLASH_COMPRESSION", "zlib")
+        monkeypatch.setenv("FLASH_COMPRESSION_LEVEL", "9")
+        monkeypatch.setenv("FLASH_COMPRESSION_MIN_SIZE", "2048")
+        monkeypatch.setenv("FLASH_COMPRESSION_ADAPTIVE", "false")
+
+        policy = CompressionPolicy.from_env()
+
+        assert policy == CompressionPolicy(
+            codec=CODEC_ZLIB, level=9, min_size=2048, adaptive=False
+        )
+
+    def test_unavailable_codec_falls_back(self):
+        policy = CompressionPolicy(codec="brotli")
+        assert policy.codec == available_codecs()[0]
+
+    def test_for_peer_picks_shared_codec(self, monkeypatch):
+        monkeypatch.delenv("FLASH_COMPRESSION", raising=False)
+
+        assert CompressionPolicy.for_peer(None) is None
+        assert CompressionPolicy.for_peer(["brotli"]) is None
+        assert CompressionPolicy.for_peer(["brotli", "zlib"]).codec == CODEC_ZLIB
+
+
+class TestSerializationCompression:
+    """Test compression through the serialization helpers."""
+
+    def test_serialize_arg_roundtrip(self, zlib_policy):
+        encoded = serialize_arg(COMPRESSIBLE, zlib_policy)
+
+        assert len(encoded) < len(serialize_arg(COMPRESSIBLE)) // 10
+        assert deserialize_arg(encoded) == COMPRESSIBLE
+
+    def test_frames_roundtrip_keeps_buffers_writable(self, zlib_policy):
+        value = bytearray(COMPRESSIBLE)
+
+        frames = serialize_arg_frames(value, zlib_policy)
+        result = deserialize_arg_frames(frames)
+
+        assert all(is_compressed(f) for f in frames[1:])
+        assert result == value
+        result[0] = 0
+
+    def test_generic_handler_compresses_result_on_request(self):
+        handler = create_handler({"echo": lambda x: x})
+        args = serialize_args((COMPRESSIBLE,))
+
+        plain = handler({"input": {"function_name": "echo", "args": args}})
+        compressed = handler(
+            {"input": {"function_name": "echo", "args": args, "compression": ["zlib"]}}
+        )
+
+        assert len(compressed["result"]) < len(plain["result"]) // 10
+        assert deserialize_arg(compressed["result"]) == COMPRESSIBLE
+        assert deserialize_arg(plain["result"]) == COMPRESSIBLE
+
+
+def repeat(data, times):
+    return data * times
+
+
+REPEAT_CODE = "def repeat(data, times):\n    return data * times\n"
+
+
+class TestExecuteCompression:
+    """End-to-end /execute with compression between stub and handler."""
+
+    @pytest.mark.parametrize("binary_wire", [False, True])
+    async def test_args_and_result_compressed(self, zlib_policy, binary_wire):
+        app = create_lb_handler({}, include_execute=True)
+        sizes = []
+
+        async def record(response):
+            await response.aread()
+            sizes.append(len(response.content))
+
+        def factory(base_url):
+            return httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                event_hooks={"response": [record]},
+            )
+
+        server = MagicMock()
+        server.endpoint_url = "http://worker"
+        stub = LoadBalancerSlsStub(
+            server, binary_wire=binary_wire, compression=zlib_policy
+        )
+        stub._peer_accepts_frames = binary_wire or None
+
+        with (
+            patch(
+                "runpod_flash.stubs.load_balancer_sls.get_shared_httpx_client",
+                side_effect=factory,
+            ),
+            patch(
+                "runpod_flash.stubs.load_balancer_sls.get_function_source",
+                return_value=(REPEAT_CODE, "hash"),
+            ),
+        ):
+            request = stub._prepare_request(repeat, None, None, True, COMPRESSIBLE, 2)
+            response = await stub._execute_function(request)
+
+        assert request["compression"] == available_codecs()
+        assert stub._handle_response(response) == COMPRESSIBLE * 2
+        assert sizes[0] < len(COMPRESSIBLE) // 10
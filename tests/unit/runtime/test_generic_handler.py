@@ -4,6 +4,7 @@ import base64
 
 import cloudpickle
 
+from runpod_flash.runtime.batch import serialize_batch
 from runpod_flash.runtime.generic_handler import (
     create_handler,
     deserialize_arguments,
@@ -366,3 +367,27 @@ def test_create_handler_with_return_none():
     assert response["success"] is True
     result = cloudpickle.loads(base64.b64decode(response["result"]))
     assert result is None
+
+
+def test_create_handler_batch():
+    """Test handler executing a batched job with a failing item."""
+
+    def divide(a, b):
+        return a / b
+
+    handler = create_handler({"divide": divide})
+
+    job = {
+        "input": {
+            "function_name": "divide",
+            "execution_type": "function",
+            "batch": serialize_batch([((6, 3), {}), ((1,), {"b": 0})]),
+        }
+    }
+
+    response = handler(job)
+    assert response["success"] is True
+    assert len(response["results"]) == 2
+    assert cloudpickle.loads(base64.b64decode(response["results"][0]["result"])) == 2
+    assert response["results"][1]["success"] is False
+    assert "division by zero" in response["results"][1]["error"]
@@ -0,0 +1,189 @@
+"""Tests for the worker-side class instance pool."""
+
+import base64
+from unittest.mock import patch
+
+import cloudpickle
+import pytest
+
+from runpod_flash.runtime.generic_handler import create_handler
+from runpod_flash.runtime.instance_pool import InstancePool, set_instance_pool
+
+
+class Model:
+    constructed = 0
+
+    def __init__(self, name="model"):
+        Model.constructed += 1
+        self.name = name
+        self.calls = 0
+
+    def predict(self, x):
+        self.calls += 1
+        return f"{self.name}:{x}:{self.calls}"
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    Model.constructed = 0
+    pool = InstancePool(max_instances=2)
+    set_instance_pool(pool)
+    yield pool
+    set_instance_pool(None)
+
+
+def _encode(value):
+    return base64.b64encode(cloudpickle.dumps(value)).decode("utf-8")
+
+
+def _job(
+    instance_id=None, create_new=False, x=1, require_instance=False, worker_id=None
+):
+    job_input = {
+        "function_name": "Model",
+        "execution_type": "class",
+        "args": [_encode("m")],
+        "method_name": "predict",
+        "method_args": [_encode(x)],
+        "create_new_instance": create_new,
+        "require_instance": require_instance,
+    }
+    if instance_id:
+        job_input["instance_id"] = instance_id
+    if worker_id:
+        job_input["worker_id"] = worker_id
+    return {"input": job_input}
+
+
+def _result(response):
+    return cloudpickle.loads(base64.b64decode(response["result"]))
+
+
+class TestInstancePool:
+    """Test reuse and eviction."""
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError, match="max_instances"):
+            InstancePool(max_instances=0)
+        with pytest.raises(ValueError, match="idle_ttl"):
+            InstancePool(idle_ttl=0)
+
+    def test_reuses_live_instance(self, pool):
+        first, info = pool.acquire("a", Model)
+        second, info = pool.acquire("a", Model)
+
+        assert first is second
+        assert Model.constructed == 1
+        assert info["hit"] is True and info["call_count"] == 2
+        assert (pool.hits, pool.misses) == (1, 1)
+
+    def test_create_new_replaces_instance(self, pool):
+        first, _ = pool.acquire("a", Model)
+        second, info = pool.acquire("a", Model, create_new=True)
+
+        assert first is not second
+        assert info["hit"] is False and info["call_count"] == 1
+
+    def test_evicts_least_recently_used(self, pool):
+        pool.acquire("a", Model)
+        pool.acquire("b", Model)
+        pool.acquire("a", Model)
+        pool.acquire("c", Model)
+
+        assert "a" in pool and "c" in pool and "b" not in pool
+
+    def test_evicts_idle_instances(self, pool):
+        pool.acquire("a", Model)
+
+        with patch(
+            "runpod_flash.runtime.instance_pool.time.time",
+            return_value=1e12,
+        ):
+            _, info = pool.acquire("a", Model)
+
+        assert info["hit"] is False
+        assert Model.constructed == 2
+
+    def test_memory_budget_evicts_oldest(self):
+        pool = InstancePool(max_instances=10, max_bytes=150)
+        with patch(
+            "runpod_flash.runtime.instance_pool._rss_bytes",
+            side_effect=[0, 100, 0, 100],
+        ):
+            pool.acquire("a", Model)
+            pool.acquire("b", Model)
+
+        assert "a" not in pool and "b" in pool
+        assert pool.memory_bytes == 100
+
+
+class TestHandlerInstanceReuse:
+    """Test instance reuse through the generic handler."""
+
+    def test_repeated_calls_share_instance(self):
+        handler = create_handler({"Model": Model})
+
+        first = handler(_job("Model_1", create_new=True))
+        second = handler(_job("Model_1", x=2))
+
+        assert _result(first) == "m:1:1"
+        assert _result(second) == "m:2:2"
+        assert Model.constructed == 1
+        assert second["instance_id"] == "Model_1"
+        assert second["instance_pooled"] is True
+        assert second["instance_info"]["hit"] is True
+        assert second["instance_info"]["call_count"] == 2
+
+    def test_jobs_without_instance_id_construct_each_time(self):
+        handler = create_handler({"Model": Model})
+
+        responses = [handler(_job()) for _ in range(2)]
+
+        assert [_result(r) for r in responses] == ["m:1:1", "m:1:1"]
+        assert "instance_info" not in responses[0]
+        assert "instance_pooled" not in responses[0]
+        assert Model.constructed == 2
+
+    def test_require_instance_reports_missing_instance(self):
+        handler = create_handler({"Model": Model})
+
+        missing = handler(_job("Model_1", require_instance=True))
+        handler(_job("Model_1"))
+        lean = handler(_job("Model_1", x=3, require_instance=True))
+
+        assert missing["success"] is False
+        assert missing["instance_missing"] is True
+        assert missing["instance_id"] == "Model_1"
+        assert _result(lean) == "m:3:2"
+        assert Model.constructed == 1
+
+
+class TestHandlerAffinity:
+    """Test instances pinned to a worker."""
+
+    @pytest.fixture(autouse=True)
+    def worker(self, monkeypatch):
+        monkeypatch.setenv("RUNPOD_POD_ID", "worker-a")
+
+    def test_pinned_worker_reuses_instance(self):
+        handler = create_handler({"Model": Model})
+
+        first = handler(_job("Model_1"))
+        second = handler(_job("Model_1", x=2, worker_id="worker-a"))
+
+        assert first["worker_id"] == "worker-a"
+        assert _result(second) == "m:2:2"
+        assert Model.constructed == 1
+
+    def test_hint_for_another_worker_uses_live_copy(self):
+        handler = create_handler({"Model": Model})
+        handler(_job("Model_1"))
+
+        # Endpoints cannot route by worker; the hint does not change the call
+        lean = handler(
+            _job("Model_1", x=2, require_instance=True, worker_id="worker-b")
+        )
+
+        assert _result(lean) == "m:2:2"
+        assert lean["worker_id"] == "worker-a"
+        assert Model.constructed == 1
@@ -6,10 +6,13 @@ import pytest
 
 from runpod_flash.runtime.exceptions import SerializationError
 from runpod_flash.runtime.serialization import (
+    OUT_OF_BAND_THRESHOLD,
     deserialize_arg,
+    deserialize_arg_frames,
     deserialize_args,
     deserialize_kwargs,
     serialize_arg,
+    serialize_arg_frames,
     serialize_args,
     serialize_kwargs,
 )
@@ -189,3 +192,51 @@ class TestDeserializeKwargs:
                 SerializationError, match="Failed to deserialize kwargs"
             ):
                 deserialize_kwargs({"key": "value"})
+
+
+class TestOutOfBandFrames:
+    """Test serialize_arg_frames/deserialize_arg_frames (pickle protocol 5)."""
+
+    def test_small_values_stay_in_band(self):
+        frames = serialize_arg_frames({"x": b"small"})
+        assert len(frames) == 1
+        assert deserialize_arg_frames(frames) == {"x": b"small"}
+
+    @pytest.mark.parametrize("kind", [bytes, bytearray, memoryview])
+    def test_large_bytes_like_out_of_band(self, kind):
+        payload = b"\x01" * OUT_OF_BAND_THRESHOLD
+
+        frames = serialize_arg_frames(kind(payload))
+
+        assert len(frames) == 2
+        assert len(frames[0]) < 256
+        assert frames[1].nbytes == len(payload)
+        result = deserialize_arg_frames(frames)
+        assert result == payload
+        assert isinstance(result, bytearray if kind is bytearray else bytes)
+
+    def test_out_of_band_buffer_references_source(self):
+        payload = bytearray(OUT_OF_BAND_THRESHOLD)
+
+        frames = serialize_arg_frames(payload)
+        payload[0] = 7
+
+        assert frames[1][0] == 7
+
+    def test_numpy_array_rebuilt_on_received_memory(self):
+        np = pytest.importorskip("numpy")
+        array = np.arange(100_000, dtype=np.float64).reshape(1000, 100)
+
+        frames = serialize_arg_frames(array)
+        received = [frames[0]] + [memoryview(bytearray(f)) for f in frames[1:]]
+        result = deserialize_arg_frames(received)
+
+        assert len(frames) == 2
+        np.testing.assert_array_equal(result, array)
+        assert result.flags.writeable
+        result[0, 0] = -1.0
+        assert received[1].cast("d")[0] == -1.0
+
+    def test_deserialize_frames_error(self):
+        with pytest.raises(SerializationError, match="Failed to deserialize"):
+            deserialize_arg_frames([b"not a pickle", b""])
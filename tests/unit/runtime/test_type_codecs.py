@@ -0,0 +1,163 @@
+"""Tests for per-type codecs."""
+
+import base64
+import importlib.util
+import struct
+from dataclasses import dataclass
+
+import pytest
+
+from runpod_flash.runtime import type_codecs
+from runpod_flash.runtime.exceptions import SerializationError
+from runpod_flash.runtime.generic_handler import create_handler
+from runpod_flash.runtime.serialization import (
+    deserialize_arg,
+    deserialize_arg_frames,
+    serialize_arg,
+    serialize_arg_frames,
+    serialize_args,
+)
+from runpod_flash.runtime.type_codecs import (
+    TypeCodec,
+    accepted_type_codecs,
+    is_typed,
+    register_type_codec,
+    type_codecs_from_env,
+)
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+_POINT = struct.Struct("!qq")
+
+requires_orjson = pytest.mark.skipif(
+    importlib.util.find_spec("orjson") is None, reason="orjson not installed"
+)
+
+
+@pytest.fixture
+def point_codec(monkeypatch):
+    monkeypatch.setattr(type_codecs, "_CODECS", dict(type_codecs._CODECS))
+    monkeypatch.setattr(
+        type_codecs, "_CODECS_BY_TYPE", dict(type_codecs._CODECS_BY_TYPE)
+    )
+    register_type_codec(
+        TypeCodec(
+            "point",
+            (f"{Point.__module__}.{Point.__qualname__}",),
+            lambda p: _POINT.pack(p.x, p.y),
+            lambda payload: Point(*_POINT.unpack(payload)),
+        )
+    )
+    return ["point"]
+
+
+def _blob(encoded: str) -> bytes:
+    return base64.b64decode(encoded)
+
+
+class TestRegistry:
+    """Test registration and dispatch."""
+
+    def test_custom_codec_roundtrip(self, point_codec):
+        encoded = serialize_arg(Point(3, -4), type_codecs=point_codec)
+
+        assert is_typed(_blob(encoded))
+        assert deserialize_arg(encoded) == Point(3, -4)
+
+    def test_disabled_without_allowed_codecs(self, point_codec):
+        encoded = serialize_arg(Point(1, 2))
+
+        assert not is_typed(_blob(encoded))
+        assert deserialize_arg(encoded) == Point(1, 2)
+
+    def test_unknown_codec_rejected(self):
+        blob = b"\xffFC\x05bogus" + b"payload"
+        encoded = base64.b64encode(blob).decode()
+
+        with pytest.raises(SerializationError, match="bogus"):
+            deserialize_arg(encoded)
+
+    @requires_orjson
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv("FLASH_TYPE_CODECS", raising=False)
+        assert type_codecs_from_env() is None
+
+        monkeypatch.setenv("FLASH_TYPE_CODECS", "json,bogus")
+        assert type_codecs_from_env() == ["json"]
+
+        monkeypatch.setenv("FLASH_TYPE_CODECS", "all")
+        assert "json" not in (type_codecs_from_env() or [])
+
+    @requires_orjson
+    def test_accepted_filters_unavailable(self):
+        assert accepted_type_codecs(None) is None
+        assert accepted_type_codecs(["bogus", "json"]) == ["json"]
+
+
+@requires_orjson
+class TestJsonCodec:
+    """Test the orjson codec for plain data."""
+
+    def test_plain_data_roundtrip(self):
+        value = {"a": [1, 2.5, None, True], "b": {"c": "text"}}
+
+        encoded = serialize_arg(value, type_codecs=["json"])
+
+        assert is_typed(_blob(encoded))
+        assert deserialize_arg(encoded) == value
+
+    @pytest.mark.parametrize(
+        "value",
+        [{"t": (1, 2)}, {1: "int key"}, {"nan": float("nan")}, {"big": 2**70}],
+    )
+    def test_lossy_values_fall_back_to_pickle(self, value):
+        encoded = serialize_arg(value, type_codecs=["json"])
+
+        assert not is_typed(_blob(encoded))
+        result = deserialize_arg(encoded)
+        assert type(result) is dict and result.keys() == value.keys()
+
+    def test_frames_use_single_typed_frame(self):
+        frames = serialize_arg_frames({"a": [1, 2]}, type_codecs=["json"])
+
+        assert len(frames) == 1 and is_typed(frames[0])
+        assert deserialize_arg_frames(frames) == {"a": [1, 2]}
+
+    def test_handler_encodes_result_for_listed_codecs(self):
+        handler = create_handler({"echo": lambda x: x})
+        job_input = {"function_name": "echo", "args": serialize_args(({"k": 1},))}
+
+        plain = handler({"input": job_input})
+        typed = handler({"input": dict(job_input, type_codecs=["json"])})
+
+        assert not is_typed(_blob(plain["result"]))
+        assert is_typed(_blob(typed["result"]))
+        assert deserialize_arg(typed["result"]) == {"k": 1}
+
+
+class TestNumpyCodec:
+    """Test the .npy codec."""
+
+    def test_array_roundtrip(self):
+        np = pytest.importorskip("numpy")
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        encoded = serialize_arg(array, type_codecs=["npy"])
+        result = deserialize_arg(encoded)
+
+        assert is_typed(_blob(encoded))
+        assert result.dtype == array.dtype and (result == array).all()
+
+    def test_frames_keep_out_of_band_buffers(self):
+        np = pytest.importorskip("numpy")
+        array = np.zeros(1024 * 1024, dtype=np.uint8)
+
+        frames = serialize_arg_frames(array, type_codecs=["npy"])
+
+        assert len(frames) == 2
+        assert (deserialize_arg_frames(frames) == array).all()
@@ -0,0 +1,240 @@
+"""Tests for the binary frames envelope and /execute content negotiation."""
+
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+import cloudpickle
+import httpx
+import pytest
+
+from runpod_flash.runtime.exceptions import SerializationError
+from runpod_flash.runtime.lb_handler import create_lb_handler
+from runpod_flash.runtime.serialization import (
+    OUT_OF_BAND_THRESHOLD,
+    deserialize_arg_frames,
+    serialize_arg_frames,
+)
+from runpod_flash.runtime.wire import (
+    FRAMES_ACCEPT,
+    FRAMES_CONTENT_TYPE,
+    accepts_frames,
+    encode_message,
+    encoded_size,
+    is_frames_content_type,
+    iter_chunks,
+    pack_message,
+    read_body,
+    unpack_message,
+)
+from runpod_flash.stubs.load_balancer_sls import LoadBalancerSlsStub
+
+MULTIPLY_CODE = "def multiply(x, y):\n    return x * y\n"
+
+
+class TestFramesEnvelope:
+    """Test pack_message/unpack_message."""
+
+    def test_request_roundtrip(self):
+        message = {
+            "function_name": "f",
+            "dependencies": ["numpy"],
+            "args": [b"a", b"\x00" * 10],
+            "kwargs": {"k": b"value"},
+        }
+
+        decoded = unpack_message(pack_message(message))
+
+        assert decoded["function_name"] == "f"
+        assert decoded["dependencies"] == ["numpy"]
+        assert [bytes(a) for a in decoded["args"]] == [b"a", b"\x00" * 10]
+        assert {k: bytes(v) for k, v in decoded["kwargs"].items()} == {"k": b"value"}
+        assert "result" not in decoded
+
+    def test_response_roundtrip(self):
+        payload = cloudpickle.dumps({"x": 1})
+
+        decoded = unpack_message(pack_message({"success": True, "result": payload}))
+
+        assert decoded["success"] is True
+        assert cloudpickle.loads(decoded["result"]) == {"x": 1}
+
+    def test_frames_are_not_base64_inflated(self):
+        blob = bytes(range(256)) * 4096
+        framed = pack_message({"args": [blob]})
+        as_json = json.dumps({"args": [base64.b64encode(blob).decode("utf-8")]})
+
+        assert len(framed) < len(blob) + 128
+        assert len(framed) < len(as_json)
+
+    def test_segmented_blobs_roundtrip(self):
+        big = bytearray(b"z" * OUT_OF_BAND_THRESHOLD)
+        message = {
+            "args": [serialize_arg_frames(big), serialize_arg_frames(1)],
+            "kwargs": {"k": b"raw"},
+        }
+
+        decoded = unpack_message(pack_message(message))
+
+        first, second = decoded["args"]
+        assert len(first) == 2 and len(second) == 1
+        assert deserialize_arg_frames(first) == big
+        assert deserialize_arg_frames(second) == 1
+        assert [bytes(f) for f in decoded["kwargs"]["k"]] == [b"raw"]
+
+    async def test_streamed_body_roundtrip(self):
+        message = {"args": [serialize_arg_frames(b"q" * 3_000_000)]}
+        parts = encode_message(message)
+
+        chunks = [chunk async for chunk in iter_chunks(parts, chunk_size=65536)]
+        assert max(len(c) for c in chunks) <= 65536
+
+        async def replay():
+            for chunk in chunks:
+                yield chunk
+
+        for size in (encoded_size(parts), 0, 10):
+            body = await read_body(replay(), size)
+            assert isinstance(body, bytearray)
+            assert body == pack_message(message)
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"nope", pack_message({"args": [b"abcdef"]})[:-3]]
+    )
+    def test_malformed_envelope(self, data):
+        with pytest.raises(SerializationError, match="Malformed frames envelope"):
+            unpack_message(data)
+
+    def test_header_negotiation_helpers(self):
+        assert is_frames_content_type(f"{FRAMES_CONTENT_TYPE}; charset=binary")
+        assert not is_frames_content_type("application/json")
+        assert accepts_frames(FRAMES_ACCEPT)
+        assert not accepts_frames("application/json")
+        assert not accepts_frames("")
+
+
+@pytest.fixture
+def asgi_client_factory():
+    """Patch the stub's HTTP client to talk to an in-process /execute app."""
+    app = create_lb_handler({}, include_execute=True)
+    requests = []
+
+    async def record(request):
+        requests.append(request)
+
+    def factory(base_url):
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            event_hooks={"request": [record]},
+        )
+
+    with patch(
+        "runpod_flash.stubs.load_balancer_sls.get_shared_httpx_client",
+        side_effect=factory,
+    ):
+        yield requests
+
+
+def _stub(binary_wire):
+    server = MagicMock()
+    server.endpoint_url = "http://worker"
+    server.name = "worker"
+    return LoadBalancerSlsStub(server, binary_wire=binary_wire)
+
+
+def multiply(x, y):
+    return x * y
+
+
+class TestExecuteNegotiation:
+    """End-to-end /execute negotiation between stub and handler."""
+
+    async def test_json_only_client_unchanged(self, asgi_client_factory):
+        stub = _stub(binary_wire=False)
+
+        with patch(
+            "runpod_flash.stubs.load_balancer_sls.get_function_source",
+            return_value=(MULTIPLY_CODE, "hash"),
+        ):
+            request = stub._prepare_request(multiply, None, None, True, 6, 7)
+            response = await stub._execute_function(request)
+
+        assert isinstance(response["result"], str)
+        assert stub._handle_response(response) == 42
+        assert not accepts_frames(asgi_client_factory[0].headers.get("accept", ""))
+
+    async def test_binary_client_upgrades_after_first_response(
+        self, asgi_client_factory
+    ):
+        stub = _stub(binary_wire=True)
+
+        with patch(
+            "runpod_flash.stubs.load_balancer_sls.get_function_source",
+            return_value=(MULTIPLY_CODE, "hash"),
+        ):
+            results = []
+            for _ in range(2):
+                request = stub._prepare_request(multiply, None, None, True, 6, 7)
+                response = await stub._execute_function(request)
+                results.append(stub._handle_response(response))
+
+        assert results == [42, 42]
+        first, second = asgi_client_factory
+        assert first.headers["content-type"] == "application/json"
+        assert second.headers["content-type"] == FRAMES_CONTENT_TYPE
+        assert stub._peer_accepts_frames is True
+
+    async def test_large_buffers_travel_out_of_band(self, asgi_client_factory):
+        stub = _stub(binary_wire=True)
+        stub._peer_accepts_frames = True
+        payload = bytearray(b"\x02" * (2 * OUT_OF_BAND_THRESHOLD))
+
+        with patch(
+            "runpod_flash.stubs.load_balancer_sls.get_function_source",
+            return_value=(MULTIPLY_CODE, "hash"),
+        ):
+            request = stub._prepare_request(multiply, None, None, True, payload, 2)
+            response = await stub._execute_function(request)
+
+        assert len(request["args"][0]) == 2
+        assert isinstance(response["result"], list)
+        assert stub._handle_response(response) == payload * 2
+        sent = asgi_client_factory[0]
+        assert int(sent.headers["content-length"]) < len(payload) + 1024
+
+    async def test_frames_rejected_by_legacy_worker_falls_back(self):
+        stub = _stub(binary_wire=True)
+        stub._peer_accepts_frames = True
+        seen = []
+
+        def legacy_worker(request):
+            seen.append(request.headers.get("content-type"))
+            try:
+                body = json.loads(request.content)
+            except ValueError as e:
+                return httpx.Response(
+                    200, json={"success": False, "error": f"Invalid request body: {e}"}
+                )
+            x, y = (cloudpickle.loads(base64.b64decode(a)) for a in body["args"])
+            result = base64.b64encode(cloudpickle.dumps(x * y)).decode("utf-8")
+            return httpx.Response(200, json={"success": True, "result": result})
+
+        def factory(base_url):
+            return httpx.AsyncClient(transport=httpx.MockTransport(legacy_worker))
+
+        with (
+            patch(
+                "runpod_flash.stubs.load_balancer_sls.get_shared_httpx_client",
+                side_effect=factory,
+            ),
+            patch(
+                "runpod_flash.stubs.load_balancer_sls.get_function_source",
+                return_value=(MULTIPLY_CODE, "hash"),
+            ),
+        ):
+            request = stub._prepare_request(multiply, None, None, True, 6, 7)
+            response = await stub._execute_function(request)
+
+        assert stub._handle_response(response) == 42
+        assert seen == [FRAMES_CONTENT_TYPE, "application/json"]
+        assert stub._peer_accepts_frames is False
@@ -0,0 +1,180 @@
+"""Unit tests for per-function call plan caching."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from runpod_flash.call_plan import CallPlanner
+from runpod_flash.client import remote
+from runpod_flash.core.resources import LiveServerless, ResourceManager
+
+
+@pytest.fixture
+def resource_config():
+    return LiveServerless(name="call-plan-test")
+
+
+@pytest.fixture
+def deployed(resource_config):
+    deployed = MagicMock()
+    deployed.get_resource_key.return_value = resource_config.get_resource_key()
+    return deployed
+
+
+class TestCallPlanner:
+    """Test CallPlanner resolution and invalidation."""
+
+    async def test_plan_resolved_once(self, resource_config, deployed):
+        """Repeated get() calls reuse the resolved plan."""
+        planner = CallPlanner(resource_config)
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ) as mock_deploy,
+            patch("runpod_flash.call_plan.stub_resource") as mock_stub,
+        ):
+            first = await planner.get()
+            for _ in range(10):
+                assert await planner.get() is first
+
+        mock_deploy.assert_awaited_once_with(resource_config)
+        mock_stub.assert_called_once_with(deployed)
+        assert first.resource is deployed
+
+    async def test_generation_change_invalidates_plan(self, resource_config, deployed):
+        """A ResourceManager update for the key forces re-resolution."""
+        planner = CallPlanner(resource_config)
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ) as mock_deploy,
+            patch("runpod_flash.call_plan.stub_resource"),
+        ):
+            first = await planner.get()
+            ResourceManager()._bump_generation(resource_config.get_resource_key())
+            second = await planner.get()
+
+        assert first is not second
+        assert mock_deploy.await_count == 2
+
+    async def test_invalidate_forces_refresh(self, resource_config, deployed):
+        """invalidate() drops the cached plan."""
+        planner = CallPlanner(resource_config)
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ) as mock_deploy,
+            patch("runpod_flash.call_plan.stub_resource"),
+        ):
+            await planner.get()
+            planner.invalidate()
+            assert planner.plan is None
+            await planner.get()
+
+        assert mock_deploy.await_count == 2
+
+    async def test_deploy_failure_not_cached(self, resource_config, deployed):
+        """A failed resolution leaves no plan behind and is retried."""
+        planner = CallPlanner(resource_config)
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(side_effect=[RuntimeError("deploy failed"), deployed]),
+            ),
+            patch("runpod_flash.call_plan.stub_resource"),
+        ):
+            with pytest.raises(RuntimeError, match="deploy failed"):
+                await planner.get()
+            assert planner.plan is None
+
+            plan = await planner.get()
+
+        assert plan.resource is deployed
+
+
+class TestRemoteCallPlan:
+    """Test that @remote functions reuse their call plan."""
+
+    async def test_wrapper_resolves_resource_once(self, resource_config, deployed):
+        stub = AsyncMock(return_value="ok")
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ) as mock_deploy,
+            patch("runpod_flash.call_plan.stub_resource", return_value=stub),
+        ):
+
+            @remote(resource_config)
+            async def add(x, y):
+                return x + y
+
+            results = [await add(i, i) for i in range(5)]
+
+            add.refresh()
+            await add(1, 2)
+
+        assert results == ["ok"] * 5
+        assert stub.await_count == 6
+        assert mock_deploy.await_count == 2
+
+    async def test_failed_call_drops_plan(self, resource_config, deployed):
+        stub = AsyncMock(side_effect=[ConnectionError("gone"), "ok"])
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ) as mock_deploy,
+            patch("runpod_flash.call_plan.stub_resource", return_value=stub),
+        ):
+
+            @remote(resource_config)
+            async def ping():
+                return "pong"
+
+            with pytest.raises(ConnectionError):
+                await ping()
+            assert ping.__call_planner__.plan is None
+            assert await ping() == "ok"
+
+        assert mock_deploy.await_count == 2
+
+    async def test_user_error_keeps_plan(self, resource_config, deployed):
+        stub = AsyncMock(
+            side_effect=[Exception("Remote execution failed: bad input"), "ok"]
+        )
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ) as mock_deploy,
+            patch("runpod_flash.call_plan.stub_resource", return_value=stub),
+        ):
+
+            @remote(resource_config)
+            async def ping():
+                return "pong"
+
+            with pytest.raises(Exception, match="bad input"):
+                await ping()
+            assert ping.__call_planner__.plan is not None
+            assert await ping() == "ok"
+
+        assert mock_deploy.await_count == 1
@@ -5,16 +5,21 @@ These tests verify the caching behavior of remote class execution including:
 - Cache key generation
 - Cache hit/miss scenarios
 - Error handling for unserializable arguments
+- Per-class source caching and the byte budget of the cache
 """
 
 import tempfile
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+import pytest
 
 from runpod_flash.core.resources import ServerlessResource
+from runpod_flash.core.utils.lru_cache import LRUCache
 from runpod_flash.execute_class import (
     _SERIALIZED_CLASS_CACHE,
     create_remote_class,
     get_class_cache_key,
+    get_class_data,
 )
 
 
@@ -415,3 +420,110 @@ class TestCacheDataStructure:
         decoded_arg = cloudpickle.loads(base64.b64decode(encoded_arg))
 
         assert decoded_arg == test_data
+
+
+class TestClassSourceReuse:
+    """Test that class source and constructor arguments are processed once."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        _SERIALIZED_CLASS_CACHE.clear()
+
+    def test_source_extracted_once_per_class(self):
+        """Test that instances of one class share a single source extraction."""
+
+        class ReuseTestClass:
+            def __init__(self, value):
+                self.value = value
+
+        with patch(
+            "runpod_flash.execute_class.extract_class_code_simple",
+            return_value="class ReuseTestClass:\n    pass",
+        ) as mock_extract:
+            for value in range(5):
+                get_class_data(ReuseTestClass, (value,), {})
+            get_class_cache_key(ReuseTestClass, (0,), {})
+
+        assert mock_extract.call_count == 1
+
+    def test_key_matches_get_class_cache_key(self):
+        """Test that get_class_data and get_class_cache_key agree."""
+
+        class KeyTestClass:
+            def __init__(self, x, y=None, z=None):
+                self.x = x
+
+        key, data = get_class_data(KeyTestClass, (1,), {"y": 2, "z": 3})
+
+        assert key == get_class_cache_key(KeyTestClass, (1,), {"z": 3, "y": 2})
+        assert _SERIALIZED_CLASS_CACHE[key] is data
+
+    def test_cache_hit_reuses_serialized_arguments(self):
+        """Test that a cache hit returns the stored entry."""
+
+        class HitTestClass:
+            def __init__(self, value):
+                self.value = value
+
+        _, first = get_class_data(HitTestClass, ([1, 2, 3],), {})
+        hits = _SERIALIZED_CLASS_CACHE.hits
+        _, second = get_class_data(HitTestClass, ([1, 2, 3],), {})
+
+        assert second is first
+        assert _SERIALIZED_CLASS_CACHE.hits == hits + 1
+
+
+class TestCacheByteBudget:
+    """Test the byte budget and statistics of LRUCache."""
+
+    def test_evicts_oldest_above_budget(self):
+        cache = LRUCache(max_bytes=10, sizeof=len)
+
+        cache.set("a", "aaaa")
+        cache.set("b", "bbbb")
+        cache.get("a")
+        cache.set("c", "cccc")
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.stats() == {"size": 2, "bytes": 8, "hits": 1, "misses": 0}
+
+    def test_skips_values_larger_than_budget(self):
+        cache = LRUCache(max_bytes=4, sizeof=len)
+        cache.set("a", "aa")
+
+        cache.set("a", "too large")
+
+        assert cache.get("a") is None
+        assert cache.total_bytes == 0
+
+    def test_requires_sizeof(self):
+        with pytest.raises(ValueError, match="sizeof"):
+            LRUCache(max_bytes=10)
+
+    def test_instance_survives_eviction(self):
+        """Test that an instance keeps its class data after cache eviction."""
+
+        class EvictionTestClass:
+            def __init__(self, value):
+                self.value = value
+
+        RemoteEvictionTestClass = create_remote_class(
+            EvictionTestClass, Mock(), [], [], True, {}
+        )
+        instance = RemoteEvictionTestClass(42)
+        _SERIALIZED_CLASS_CACHE.clear()
+
+        request = instance._establish_request("get", [], {})
+
+        assert "class EvictionTestClass:" in request.class_code
+        assert len(request.constructor_args) == 1
+
+    def test_class_cache_accepts_values_without_class_data(self):
+        """Test that sizing a non-class-data value does not fail the set."""
+        _SERIALIZED_CLASS_CACHE.clear()
+
+        _SERIALIZED_CLASS_CACHE.set("other", {"data": "not class data"})
+
+        assert _SERIALIZED_CLASS_CACHE.get("other") == {"data": "not class data"}
+        assert _SERIALIZED_CLASS_CACHE.total_bytes > 0
+        _SERIALIZED_CLASS_CACHE.clear()
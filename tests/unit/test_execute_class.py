@@ -12,6 +12,7 @@ import pytest
 from runpod_flash.core.resources import ServerlessResource
 from runpod_flash.execute_class import create_remote_class, extract_class_code_simple
 from runpod_flash.protos.remote_execution import FunctionRequest
+from runpod_flash.runtime.exceptions import UnknownInstanceError
 
 
 class TestExtractClassCodeSimple:
@@ -508,17 +509,126 @@ class TestCreateRemoteClass:
         with patch.object(
             instance, "_ensure_initialized", side_effect=mock_ensure_initialized
         ):
-            # Test current behavior: create_new_instance is False after _ensure_initialized sets _stub
+            # The first call asks the worker to construct the instance
             await instance.method1()
             first_call_args = mock_stub.execute_class_method.call_args[0][0]
-            # After _ensure_initialized, _stub exists, so create_new_instance is False
-            assert first_call_args.create_new_instance is False
+            assert first_call_args.create_new_instance is True
 
             # Subsequent calls also have create_new_instance as False
             await instance.method2()
             second_call_args = mock_stub.execute_class_method.call_args[0][0]
             assert second_call_args.create_new_instance is False
 
+    def _session_instance(self, execute, affinity=False):
+        """Remote instance on a stub whose worker pools instances."""
+
+        class Model:
+            def __init__(self, weights):
+                self.weights = weights
+
+            def predict(self, x):
+                return x
+
+        instance = create_remote_class(
+            Model, self.mock_resource_config, [], [], True, {}, affinity=affinity
+        )(b"w" * 1024)
+        instance._stub = Mock(pooled_instances=set(), instance_workers={})
+        instance._stub.execute_class_method = AsyncMock(side_effect=execute)
+        instance._initialized = True
+        return instance
+
+    @pytest.mark.asyncio
+    async def test_session_calls_omit_constructor_payload(self):
+        """Test that calls after the worker pools the instance are lean."""
+
+        async def execute(request):
+            instance._stub.pooled_instances.add(request.instance_id)
+            return "ok"
+
+        instance = self._session_instance(execute)
+
+        await instance.predict(1)
+        await instance.predict(2)
+
+        first, second = [
+            call.args[0] for call in instance._stub.execute_class_method.call_args_list
+        ]
+        assert first.class_code and first.constructor_args
+        assert first.create_new_instance is True
+        assert second.class_code is None
+        assert second.constructor_args == []
+        assert second.require_instance is True
+        assert second.instance_id == first.instance_id
+
+    @pytest.mark.asyncio
+    async def test_session_reestablished_on_unknown_instance(self):
+        """Test that a worker missing the instance gets the full payload again."""
+
+        async def execute(request):
+            if request.require_instance:
+                raise UnknownInstanceError(request.instance_id)
+            return "ok"
+
+        instance = self._session_instance(execute)
+        instance._stub.pooled_instances.add(instance._instance_id)
+        instance._instance_requested = True
+
+        assert await instance.predict(1) == "ok"
+
+        lean, retry = [
+            call.args[0] for call in instance._stub.execute_class_method.call_args_list
+        ]
+        assert lean.require_instance is True
+        assert retry.constructor_args and retry.class_code
+        assert retry.create_new_instance is False
+        assert instance._instance_id not in instance._stub.pooled_instances
+
+    @pytest.mark.asyncio
+    async def test_affinity_pins_instance_to_worker(self, caplog):
+        """Test that requests name the worker that last served the instance."""
+        workers = iter(["worker-a", "worker-a", "worker-b"])
+
+        async def execute(request):
+            instance._stub.pooled_instances.add(request.instance_id)
+            instance._stub.instance_workers[request.instance_id] = next(workers)
+            return "ok"
+
+        instance = self._session_instance(execute, affinity=True)
+
+        for x in range(3):
+            await instance.predict(x)
+
+        requests = [
+            call.args[0] for call in instance._stub.execute_class_method.call_args_list
+        ]
+        assert [r.worker_id for r in requests] == [None, "worker-a", "worker-a"]
+        assert instance._worker_id == "worker-b"
+        assert "moved from worker worker-a to worker-b" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_affinity_call_on_other_worker_costs_one_extra_request(self):
+        """Test that a call landing off the pinned worker is not resubmitted."""
+
+        async def execute(request):
+            if request.require_instance:
+                raise UnknownInstanceError(request.instance_id)
+            instance._stub.instance_workers[request.instance_id] = "worker-b"
+            return "ok"
+
+        instance = self._session_instance(execute, affinity=True)
+        instance._stub.pooled_instances.add(instance._instance_id)
+        instance._instance_requested = True
+        instance._worker_id = "worker-a"
+
+        assert await instance.predict(1) == "ok"
+
+        lean, full = [
+            call.args[0] for call in instance._stub.execute_class_method.call_args_list
+        ]
+        assert lean.worker_id == "worker-a"
+        assert full.class_code and full.create_new_instance is False
+        assert instance._worker_id == "worker-b"
+
     @pytest.mark.asyncio
     async def test_method_proxy_no_args_no_kwargs(self):
         """Test method proxy with no arguments."""
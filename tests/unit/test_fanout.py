@@ -0,0 +1,158 @@
+"""Unit tests for bounded fan-out and the @remote .map() API."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from runpod_flash import call_plan
+from runpod_flash.client import remote
+from runpod_flash.core.resources import LiveServerless, ResourceManager
+from runpod_flash.fanout import map_inputs
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestMapInputs:
+    """Test map_inputs chunking, ordering and bounds."""
+
+    async def test_chunks_inputs(self):
+        chunks = []
+
+        async def run(chunk):
+            chunks.append(list(chunk))
+            return [x * 2 for x in chunk]
+
+        results = await _collect(map_inputs(run, range(7), chunk_size=3))
+
+        assert results == [0, 2, 4, 6, 8, 10, 12]
+        assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+    async def test_bounds_chunks_in_flight(self):
+        in_flight = 0
+        peak = 0
+
+        async def run(chunk):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return chunk
+
+        results = await _collect(map_inputs(run, range(20), concurrency=3))
+
+        assert results == list(range(20))
+        assert peak == 3
+
+    async def test_unordered_yields_as_completed(self):
+        async def run(chunk):
+            await asyncio.sleep(0.02 if chunk[0] == 0 else 0)
+            return chunk
+
+        results = await _collect(map_inputs(run, range(3), ordered=False))
+
+        assert sorted(results) == [0, 1, 2]
+        assert results[-1] == 0
+
+    async def test_accepts_async_iterable(self):
+        async def source():
+            for i in range(4):
+                yield i
+
+        async def run(chunk):
+            return chunk
+
+        assert await _collect(map_inputs(run, source(), chunk_size=2)) == [0, 1, 2, 3]
+
+    async def test_failed_input_raises(self):
+        async def run(chunk):
+            return [ValueError("bad") if x == 1 else x for x in chunk]
+
+        with pytest.raises(ValueError, match="bad"):
+            await _collect(map_inputs(run, range(3)))
+
+    async def test_return_exceptions(self):
+        async def run(chunk):
+            raise ConnectionError("down")
+
+        results = await _collect(
+            map_inputs(run, range(2), chunk_size=2, return_exceptions=True)
+        )
+
+        assert [type(r) for r in results] == [ConnectionError, ConnectionError]
+
+    async def test_invalid_concurrency(self):
+        async def run(chunk):
+            return chunk
+
+        with pytest.raises(ValueError, match="concurrency"):
+            await _collect(map_inputs(run, range(3), concurrency=0))
+
+
+class TestRemoteMap:
+    """Test .map() on @remote functions."""
+
+    @pytest.fixture
+    def deployed(self):
+        resource_config = LiveServerless(name="fanout-test")
+        deployed = MagicMock()
+        deployed.get_resource_key.return_value = resource_config.get_resource_key()
+        return resource_config, deployed
+
+    async def test_map_uses_execute_batch(self, deployed):
+        resource_config, resource = deployed
+        stub = AsyncMock(return_value=5)
+        stub.execute_batch = AsyncMock(
+            side_effect=lambda func, deps, sys_deps, accel, inputs: [
+                args[0] + 1 for args, _ in inputs
+            ]
+        )
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=resource),
+            ),
+            patch.object(call_plan, "stub_resource", return_value=stub),
+        ):
+
+            @remote(resource_config)
+            async def inc(x):
+                return x + 1
+
+            results = await _collect(inc.map(range(5), chunk_size=2))
+
+        assert results == [1, 2, 3, 4, 5]
+        # Two full chunks batched, the single-input tail sent as a plain call
+        assert stub.execute_batch.await_count == 2
+        assert stub.await_count == 1
+
+    async def test_map_without_batch_support(self, deployed):
+        resource_config, resource = deployed
+
+        async def call(func, deps, sys_deps, accel, x):
+            return x * 10
+
+        stub = AsyncMock(side_effect=call, spec=["__call__"])
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=resource),
+            ),
+            patch.object(call_plan, "stub_resource", return_value=stub),
+        ):
+
+            @remote(resource_config)
+            async def times_ten(x):
+                return x * 10
+
+            results = await _collect(times_ten.map([1, 2, 3], chunk_size=2))
+
+        assert results == [10, 20, 30]
+        assert stub.await_count == 3
@@ -0,0 +1,151 @@
+"""Unit tests for hedged requests to load-balanced endpoints."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from runpod_flash.client import remote
+from runpod_flash.core.resources import LoadBalancerSlsResource
+from runpod_flash.hedging import Hedger, HedgePolicy
+from runpod_flash.stubs.load_balancer_sls import LoadBalancerSlsStub
+
+
+def _warm(hedger: Hedger, latency: float = 0.01) -> None:
+    """Fill the latency window and budget so the next slow call is hedged."""
+    hedger._latencies.extend([latency] * hedger.policy.window)
+    hedger._credit = 1.0
+
+
+class TestHedgePolicy:
+    """Test HedgePolicy validation."""
+
+    def test_rejects_out_of_range_percentile(self):
+        with pytest.raises(ValueError, match="percentile"):
+            HedgePolicy(percentile=100)
+
+    def test_rejects_out_of_range_budget(self):
+        with pytest.raises(ValueError, match="budget"):
+            HedgePolicy(budget=1.5)
+
+    def test_rejects_window_smaller_than_min_samples(self):
+        with pytest.raises(ValueError, match="window"):
+            HedgePolicy(min_samples=10, window=5)
+
+
+class TestHedger:
+    """Test hedging delay, budget and cancellation."""
+
+    async def test_no_hedging_while_warming_up(self):
+        hedger = Hedger(HedgePolicy(min_samples=3, window=10))
+        call = AsyncMock(return_value=1)
+
+        for _ in range(2):
+            assert await hedger.run(call) == 1
+
+        assert hedger.hedge_delay() is None
+        assert call.await_count == 2
+        assert hedger.hedges == 0
+
+    def test_delay_is_latency_percentile(self):
+        hedger = Hedger(HedgePolicy(percentile=90, min_samples=1, window=100))
+        hedger._latencies.extend(i / 100 for i in range(100))
+
+        assert hedger.hedge_delay() == 0.9
+
+    async def test_slow_call_is_hedged_and_loser_cancelled(self):
+        hedger = Hedger(HedgePolicy(min_samples=1, window=10))
+        _warm(hedger)
+        started = []
+        cancelled = []
+
+        async def call():
+            attempt = len(started)
+            started.append(attempt)
+            try:
+                # The first request hangs on a slow worker
+                await asyncio.sleep(10 if attempt == 0 else 0)
+            except asyncio.CancelledError:
+                cancelled.append(attempt)
+                raise
+            return attempt
+
+        assert await hedger.run(call) == 1
+        await asyncio.sleep(0)
+
+        assert started == [0, 1]
+        assert cancelled == [0]
+        assert hedger.hedges == 1
+
+    async def test_budget_limits_hedges(self):
+        hedger = Hedger(HedgePolicy(budget=0.0, min_samples=1, window=10))
+        hedger._latencies.extend([0.001] * 10)
+        calls = []
+
+        async def call():
+            calls.append(None)
+            await asyncio.sleep(0.02)
+            return "slow"
+
+        assert await hedger.run(call) == "slow"
+        assert len(calls) == 1
+        assert hedger.hedges == 0
+
+    async def test_hedge_covers_failed_request(self):
+        hedger = Hedger(HedgePolicy(min_samples=1, window=10))
+        _warm(hedger, latency=0.001)
+        attempts = []
+
+        async def call():
+            attempts.append(None)
+            if len(attempts) == 1:
+                await asyncio.sleep(0.02)
+                raise ConnectionError("worker went away")
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        assert await hedger.run(call) == "ok"
+
+    async def test_raises_first_error_when_all_fail(self):
+        hedger = Hedger(HedgePolicy(min_samples=1, window=10))
+        _warm(hedger, latency=0.001)
+        attempts = []
+
+        async def call():
+            attempts.append(None)
+            await asyncio.sleep(0.02)
+            raise RuntimeError(f"attempt {len(attempts)}")
+
+        with pytest.raises(RuntimeError, match="attempt"):
+            await hedger.run(call)
+        assert len(attempts) == 2
+
+
+class TestRemoteHedge:
+    """Test @remote(hedge=...) wiring."""
+
+    def test_hedge_requires_idempotent(self):
+        resource = LoadBalancerSlsResource(name="hedge-test", imageName="image")
+
+        with pytest.raises(
+            ValueError,
+            match="hedge sends duplicate requests and requires idempotent=True",
+        ):
+
+            @remote(
+                resource,
+                method="POST",
+                path="/echo",
+                hedge=HedgePolicy(),
+            )
+            async def echo(x):
+                return x
+
+    async def test_stub_hedges_calls(self):
+        stub = LoadBalancerSlsStub(MagicMock(), hedge=HedgePolicy())
+
+        with patch.object(stub, "_call", new=AsyncMock(return_value=3)) as call:
+            assert await stub(MagicMock(), None, None, True, 1, 2) == 3
+
+        call.assert_awaited_once()
+        assert stub.hedger.calls == 1
@@ -0,0 +1,131 @@
+"""Unit tests for decoupled job submission and collection."""
+
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import cloudpickle
+import pytest
+
+from runpod_flash import jobs
+from runpod_flash.jobs import DECODE_OUTPUT, JobHandle, decode_job
+from runpod_flash.protos.remote_execution import FunctionRequest
+from runpod_flash.stubs.live_serverless import LiveServerlessStub
+
+
+def _completed(job_id, value):
+    result = base64.b64encode(cloudpickle.dumps(value)).decode("utf-8")
+    return {
+        "id": job_id,
+        "status": "COMPLETED",
+        "delayTime": 10,
+        "executionTime": 20,
+        "output": {"success": True, "result": result},
+    }
+
+
+@pytest.fixture
+def job_api():
+    """Patch EndpointClient.status with per-job canned responses."""
+    responses = {}
+
+    async def status(self, job_id):
+        return responses[job_id]
+
+    with patch.object(jobs.EndpointClient, "status", new=status):
+        yield responses
+
+
+class TestJobHandle:
+    """Test handle persistence and waiting."""
+
+    def test_round_trips_through_json(self):
+        handle = JobHandle("job-1", "ep-1", function_name="process")
+
+        restored = JobHandle.from_dict(json.loads(json.dumps(handle.to_dict())))
+
+        assert restored == handle
+
+    async def test_await_returns_decoded_result(self, job_api):
+        job_api["job-1"] = _completed("job-1", {"answer": 42})
+
+        assert await JobHandle("job-1", "ep-1") == {"answer": 42}
+
+    async def test_cancel_uses_job_api(self):
+        with patch.object(jobs.EndpointClient, "cancel", new=AsyncMock()) as cancel:
+            await JobHandle("job-1", "ep-1").cancel()
+
+        cancel.assert_awaited_once_with("job-1")
+
+
+class TestDecodeJob:
+    """Test turning final job responses into results."""
+
+    def test_failed_job_raises_remote_error(self):
+        job = {"status": "FAILED", "error": "boom", "output": None}
+
+        with pytest.raises(Exception, match="Remote execution failed: boom"):
+            decode_job(JobHandle("job-1", "ep-1"), job)
+
+    def test_cancelled_job_raises(self):
+        with pytest.raises(Exception, match="job-1 CANCELLED"):
+            decode_job(JobHandle("job-1", "ep-1"), {"status": "CANCELLED"})
+
+    def test_raw_output_for_serverless_endpoints(self):
+        handle = JobHandle("job-1", "ep-1", decode=DECODE_OUTPUT)
+
+        assert decode_job(handle, {"status": "COMPLETED", "output": [1]}) == [1]
+
+
+class TestBulkCollection:
+    """Test gather() and as_completed()."""
+
+    async def test_gather_in_order_with_exceptions(self, job_api):
+        job_api["job-1"] = _completed("job-1", 1)
+        job_api["job-2"] = {"id": "job-2", "status": "FAILED", "error": "bad input"}
+        job_api["job-3"] = _completed("job-3", 3)
+        handles = [JobHandle(f"job-{i}", "ep-1") for i in (1, 2, 3)]
+
+        results = await jobs.gather(handles, return_exceptions=True)
+
+        assert results[0] == 1 and results[2] == 3
+        assert "bad input" in str(results[1])
+        with pytest.raises(Exception, match="bad input"):
+            await jobs.gather(handles)
+
+    async def test_as_completed_yields_every_job(self, job_api):
+        for i in range(5):
+            job_api[f"job-{i}"] = _completed(f"job-{i}", i)
+        handles = [JobHandle(f"job-{i}", "ep-1") for i in range(5)]
+
+        finished = {
+            handle.job_id: result async for handle, result in jobs.as_completed(handles)
+        }
+
+        assert finished == {f"job-{i}": i for i in range(5)}
+
+
+class TestSubmit:
+    """Test queuing requests through the stub."""
+
+    async def test_stub_submit_returns_handle(self):
+        server = MagicMock()
+        server.id = "ep-1"
+        server.endpoint_client.endpoint_id = "ep-1"
+        server.endpoint_client.base_url = "https://api.example/v2"
+        server.endpoint_client.run = AsyncMock(
+            return_value={"id": "job-9", "status": "IN_QUEUE"}
+        )
+        request = FunctionRequest(function_name="process", function_code="pass")
+
+        handle = await LiveServerlessStub(server).submit(request)
+
+        # The stub imports JobHandle lazily; compare fields, not class identity
+        assert (
+            handle.to_dict()
+            == JobHandle(
+                "job-9", "ep-1", "https://api.example/v2", function_name="process"
+            ).to_dict()
+        )
+        payload = server.endpoint_client.run.await_args.args[0]
+        assert payload["function_name"] == "process"
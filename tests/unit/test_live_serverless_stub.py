@@ -1,7 +1,18 @@
 """Unit tests for live_serverless stub functionality."""
 
 import ast
-from runpod_flash.stubs.live_serverless import get_function_source
+import base64
+from unittest.mock import patch
+
+import cloudpickle
+
+from runpod_flash.protos.remote_execution import FunctionResponse
+from runpod_flash.stubs import live_serverless
+from runpod_flash.stubs.live_serverless import (
+    LiveServerlessStub,
+    _extract_function_source,
+    get_function_source,
+)
 from runpod_flash import remote, LiveServerless
 
 
@@ -133,3 +144,71 @@ class TestGetFunctionSource:
         _, hash2 = get_function_source(function_two)
 
         assert hash1 != hash2
+
+    def test_source_memoized_per_function(self):
+        """Test that source is extracted once per function object."""
+
+        def memo_function(x: int) -> int:
+            return x + 1
+
+        with patch.object(
+            live_serverless,
+            "_extract_function_source",
+            wraps=_extract_function_source,
+        ) as extract:
+            first = get_function_source(memo_function)
+            second = get_function_source(memo_function)
+
+        assert first == second
+        assert extract.call_count == 1
+
+    def test_memo_invalidated_when_code_changes(self):
+        """Test that replacing __code__ (hot reload) re-extracts the source."""
+
+        def reloaded_function(x: int) -> int:
+            return x + 1
+
+        def replacement(x: int) -> int:
+            return x + 2
+
+        source1, hash1 = get_function_source(reloaded_function)
+        reloaded_function.__code__ = replacement.__code__
+
+        with patch.object(
+            live_serverless,
+            "_extract_function_source",
+            return_value=("def reloaded_function(x): ...", "new-hash"),
+        ) as extract:
+            source2, hash2 = get_function_source(reloaded_function)
+
+        assert extract.call_count == 1
+        assert hash2 == "new-hash"
+        assert hash1 != hash2
+
+
+class TestInstancePooling:
+    """Test tracking of instances the worker keeps alive."""
+
+    def _response(self, **fields):
+        return FunctionResponse(
+            success=True,
+            result=base64.b64encode(cloudpickle.dumps("ok")).decode(),
+            instance_id="Model_1",
+            **fields,
+        )
+
+    def test_pooled_flag_enables_lean_calls(self):
+        stub = LiveServerlessStub(dummy_config)
+
+        assert stub.handle_response(self._response(instance_pooled=True)) == "ok"
+
+        assert stub.pooled_instances == {"Model_1"}
+
+    def test_echoed_instance_id_alone_is_not_trusted(self):
+        # Workers without an instance pool echo the instance_id back
+        stub = LiveServerlessStub(dummy_config)
+        stub.pooled_instances.add("Model_1")
+
+        stub.handle_response(self._response())
+
+        assert stub.pooled_instances == set()
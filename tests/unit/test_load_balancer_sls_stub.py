@@ -1,12 +1,15 @@
 """Unit tests for LoadBalancerSlsStub functionality."""
 
+import asyncio
 import base64
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import cloudpickle
+import httpx
 
 from runpod_flash import LoadBalancerSlsResource
+from runpod_flash.stubs import load_balancer_sls
 from runpod_flash.stubs.load_balancer_sls import LoadBalancerSlsStub
 
 
@@ -180,10 +183,8 @@ class TestLoadBalancerSlsStubExecuteFunction:
 
         import httpx
 
-        with patch(
-            "runpod_flash.stubs.load_balancer_sls.httpx.AsyncClient"
-        ) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch.object(load_balancer_sls, "get_shared_httpx_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Timeout")
             )
 
@@ -209,15 +210,11 @@ class TestLoadBalancerSlsStubExecuteFunction:
         mock_response.status_code = 500
         mock_response.text = "Internal server error"
 
-        with patch(
-            "runpod_flash.stubs.load_balancer_sls.httpx.AsyncClient"
-        ) as mock_client:
+        with patch.object(load_balancer_sls, "get_shared_httpx_client") as mock_client:
             error = httpx.HTTPStatusError(
                 "Error", request=MagicMock(), response=mock_response
             )
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                side_effect=error
-            )
+            mock_client.return_value.post = AsyncMock(side_effect=error)
 
             with pytest.raises(RuntimeError, match="HTTP error from endpoint"):
                 await stub._execute_function(request)
@@ -336,25 +333,21 @@ class TestLoadBalancerSlsStubRouting:
         mock_response = MagicMock()
         mock_response.json.return_value = {"result": 8}
 
-        with patch(
-            "runpod_flash.stubs.load_balancer_sls.httpx.AsyncClient"
-        ) as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+        with patch.object(load_balancer_sls, "get_shared_httpx_client") as mock_client:
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await stub._execute_via_user_route(add, "POST", "/api/add", 5, 3)
 
             assert result == {"result": 8}
             # Verify correct HTTP method and URL
-            mock_client.return_value.__aenter__.return_value.request.assert_called_once()
-            call_args = (
-                mock_client.return_value.__aenter__.return_value.request.call_args
-            )
+            mock_client.return_value.request.assert_called_once()
+            call_args = mock_client.return_value.request.call_args
             assert call_args[0][0] == "POST"
             assert call_args[0][1] == "http://localhost:8000/api/add"
             # Verify correct JSON body with mapped parameters
             assert call_args[1]["json"] == {"x": 5, "y": 3}
+            assert call_args[1]["timeout"] == stub.timeout
+            mock_client.assert_called_once_with("http://localhost:8000")
 
     @pytest.mark.asyncio
     async def test_execute_via_user_route_with_kwargs(self):
@@ -370,12 +363,8 @@ class TestLoadBalancerSlsStubRouting:
         mock_response = MagicMock()
         mock_response.json.return_value = "Hi, Alice!"
 
-        with patch(
-            "runpod_flash.stubs.load_balancer_sls.httpx.AsyncClient"
-        ) as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+        with patch.object(load_balancer_sls, "get_shared_httpx_client") as mock_client:
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await stub._execute_via_user_route(
                 greet, "POST", "/api/greet", "Alice", greeting="Hi"
@@ -383,9 +372,7 @@ class TestLoadBalancerSlsStubRouting:
 
             assert result == "Hi, Alice!"
             # Verify JSON body has both positional arg and kwargs
-            call_args = (
-                mock_client.return_value.__aenter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             assert call_args[1]["json"] == {"name": "Alice", "greeting": "Hi"}
 
     @pytest.mark.asyncio
@@ -443,3 +430,78 @@ class TestLoadBalancerSlsStubRouting:
             assert result == "handled"
 
         await run_test()
+
+
+def add_one(x):
+    return x + 1
+
+
+class TestFunctionCodeByHash:
+    """Test sending function source once and then only its hash."""
+
+    @pytest.fixture
+    def app_requests(self):
+        from runpod_flash.runtime import lb_handler
+
+        lb_handler._COMPILED_CODE.clear()
+        app = lb_handler.create_lb_handler({}, include_execute=True)
+        sent = []
+
+        async def record(request):
+            sent.append(b"def add_one" in await request.aread())
+            # Worker latency, so concurrent calls are in flight together
+            await asyncio.sleep(0.01)
+
+        def factory(base_url):
+            return httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                event_hooks={"request": [record]},
+            )
+
+        with patch.object(
+            load_balancer_sls,
+            "get_shared_httpx_client",
+            side_effect=factory,
+        ):
+            yield lb_handler, sent
+
+    async def _call(self, stub, x):
+        request = stub._prepare_request(add_one, None, None, True, x)
+        return stub._handle_response(await stub._execute_function(request, add_one))
+
+    async def test_source_sent_until_acknowledged(self, app_requests):
+        _, sent = app_requests
+        server = MagicMock()
+        server.endpoint_url = "http://worker"
+        stub = LoadBalancerSlsStub(server, binary_wire=False)
+
+        assert await self._call(stub, 1) == 2
+        assert await self._call(stub, 2) == 3
+        assert sent == [True, False]
+
+    async def test_resends_source_after_worker_eviction(self, app_requests):
+        lb_handler, sent = app_requests
+        server = MagicMock()
+        server.endpoint_url = "http://worker"
+        stub = LoadBalancerSlsStub(server, binary_wire=False)
+
+        await self._call(stub, 1)
+        lb_handler._COMPILED_CODE.clear()
+
+        assert await self._call(stub, 5) == 6
+        assert sent == [True, False, True]
+
+    async def test_concurrent_misses_all_resend_source(self, app_requests):
+        lb_handler, sent = app_requests
+        server = MagicMock()
+        server.endpoint_url = "http://worker"
+        stub = LoadBalancerSlsStub(server, binary_wire=False)
+
+        await self._call(stub, 1)
+        lb_handler._COMPILED_CODE.clear()
+        sent.clear()
+
+        results = await asyncio.gather(*(self._call(stub, x) for x in range(20)))
+
+        assert results == [x + 1 for x in range(20)]
+        assert sent[:20] == [False] * 20
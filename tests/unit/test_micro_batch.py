@@ -0,0 +1,122 @@
+"""Unit tests for micro-batching of concurrent @remote calls."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from runpod_flash import call_plan
+from runpod_flash.client import remote
+from runpod_flash.core.resources import LiveServerless, ResourceManager
+from runpod_flash.micro_batch import BatchPolicy, MicroBatcher
+
+
+class TestBatchPolicy:
+    """Test BatchPolicy validation."""
+
+    def test_rejects_empty_batches(self):
+        with pytest.raises(ValueError, match="max_size"):
+            BatchPolicy(max_size=0)
+
+    def test_rejects_negative_wait(self):
+        with pytest.raises(ValueError, match="max_wait_ms"):
+            BatchPolicy(max_wait_ms=-1)
+
+
+class TestMicroBatcher:
+    """Test coalescing and fan-back of results."""
+
+    async def test_coalesces_concurrent_calls(self):
+        calls = []
+
+        async def double(xs):
+            calls.append(list(xs))
+            return [x * 2 for x in xs]
+
+        batcher = MicroBatcher(BatchPolicy(max_size=10, max_wait_ms=5), double)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+
+        assert results == [0, 2, 4, 6]
+        assert calls == [[0, 1, 2, 3]]
+
+    async def test_full_batch_sent_immediately(self):
+        calls = []
+
+        async def echo(xs):
+            calls.append(list(xs))
+            return xs
+
+        batcher = MicroBatcher(BatchPolicy(max_size=2, max_wait_ms=10_000), echo)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert calls == [[0, 1], [2, 3]]
+
+    async def test_keyword_arguments_become_lists(self):
+        async def add(xs, y):
+            return [x + y_ for x, y_ in zip(xs, y)]
+
+        batcher = MicroBatcher(BatchPolicy(), add)
+        results = await asyncio.gather(batcher.submit(1, y=10), batcher.submit(2, y=20))
+
+        assert results == [11, 22]
+
+    async def test_failure_reaches_every_caller(self):
+        async def fail(xs):
+            raise RuntimeError("worker down")
+
+        batcher = MicroBatcher(BatchPolicy(), fail)
+        results = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+    async def test_result_count_mismatch(self):
+        async def short(xs):
+            return xs[:1]
+
+        batcher = MicroBatcher(BatchPolicy(), short)
+        with pytest.raises(ValueError, match="1 results for 2 inputs"):
+            await asyncio.gather(batcher.submit(1), batcher.submit(2))
+
+
+class TestRemoteBatch:
+    """Test @remote(batch=...) wiring."""
+
+    async def test_concurrent_calls_share_one_remote_call(self):
+        resource_config = LiveServerless(name="micro-batch-test")
+        deployed = MagicMock()
+        deployed.get_resource_key.return_value = resource_config.get_resource_key()
+
+        async def call(func, deps, sys_deps, accel, texts):
+            return [len(text) for text in texts]
+
+        stub = AsyncMock(side_effect=call)
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ),
+            patch.object(call_plan, "stub_resource", return_value=stub),
+        ):
+
+            @remote(resource_config, batch=BatchPolicy(max_size=8, max_wait_ms=5))
+            async def lengths(texts):
+                return [len(text) for text in texts]
+
+            results = await asyncio.gather(lengths("a"), lengths("bb"), lengths("ccc"))
+
+        assert results == [1, 2, 3]
+        assert stub.await_count == 1
+
+    def test_batch_rejected_for_classes(self):
+        with pytest.raises(ValueError, match="only supported for functions"):
+
+            @remote(LiveServerless(name="micro-batch-class"), batch=BatchPolicy())
+            class Model:
+                pass
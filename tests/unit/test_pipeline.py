@@ -0,0 +1,218 @@
+"""Unit tests for pipelined method calls on remote class instances."""
+
+import base64
+from unittest.mock import AsyncMock, Mock
+
+import cloudpickle
+import pytest
+
+from runpod_flash.execute_class import create_remote_class
+from runpod_flash.pipeline import Pipeline, StepRef
+from runpod_flash.runtime.batch import decode_batch_results
+from runpod_flash.runtime.exceptions import RemoteExecutionError
+from runpod_flash.runtime.generic_handler import create_handler
+from runpod_flash.runtime.instance_pool import InstancePool, set_instance_pool
+from runpod_flash.runtime.pipeline import PipelineResults
+from runpod_flash.runtime.serialization import deserialize_arg
+
+
+class Tokenizer:
+    def __init__(self, lower=True):
+        self.lower = lower
+
+    def tokenize(self, text):
+        return (text.lower() if self.lower else text).split()
+
+    def count(self, tokens):
+        return len(tokens)
+
+    def fail(self):
+        raise ValueError("boom")
+
+
+@pytest.fixture
+def worker():
+    """Run pipeline steps through the generic handler."""
+    set_instance_pool(InstancePool())
+    handler = create_handler({"Tokenizer": Tokenizer})
+    jobs = []
+
+    async def run(steps):
+        job_input = {
+            "function_name": "Tokenizer",
+            "execution_type": "class",
+            "instance_id": "Tokenizer_1",
+            "pipeline": steps,
+        }
+        response = handler({"input": job_input})
+        jobs.append((job_input, response))
+        assert response["pipeline"] is True
+        return PipelineResults(decode_batch_results(response["results"]))
+
+    yield run, jobs
+    set_instance_pool(None)
+
+
+class TestPipeline:
+    """Test recording and running steps."""
+
+    async def test_later_steps_use_earlier_results(self, worker):
+        run, jobs = worker
+
+        async with Pipeline(run, AsyncMock()) as p:
+            tokens = p.tokenize("Hello Flash World")
+            p.count(tokens)
+
+        assert await p == [3]
+        assert len(jobs) == 1
+        job_input, response = jobs[0]
+        assert job_input["pipeline"][1]["args"] == [{"ref": 0}]
+        assert len(response["results"]) == 1
+
+    async def test_marked_steps_are_returned(self, worker):
+        run, jobs = worker
+
+        async with Pipeline(run, AsyncMock()) as p:
+            tokens = p.tokenize("Hello Flash World")
+            p.count(tokens)
+            p.count([1])
+            p.mark_returned(tokens)
+
+        assert await p == [["hello", "flash", "world"], 1]
+        _, response = jobs[0]
+        assert [deserialize_arg(entry["result"]) for entry in response["results"]] == [
+            ["hello", "flash", "world"],
+            1,
+        ]
+
+    async def test_failed_step_skips_the_rest(self, worker):
+        run, _ = worker
+        p = Pipeline(run, AsyncMock(), return_exceptions=True)
+        p.mark_returned(p.fail())
+        p.count([1])
+
+        first, second = await p
+
+        assert "boom" in str(first)
+        assert "Skipped: step 0 failed: boom" in str(second)
+
+    async def test_unreturned_failure_is_reported_by_the_last_step(self, worker):
+        run, _ = worker
+
+        with pytest.raises(RemoteExecutionError, match="step 0 failed: boom"):
+            async with Pipeline(run, AsyncMock()) as p:
+                p.fail()
+                p.count([1])
+
+    async def test_failed_step_raises_by_default(self, worker):
+        run, _ = worker
+
+        with pytest.raises(RemoteExecutionError, match="boom"):
+            async with Pipeline(run, AsyncMock()) as p:
+                p.fail()
+
+    async def test_runs_once(self):
+        run = AsyncMock(return_value=PipelineResults([1]))
+        p = Pipeline(run, AsyncMock())
+        p.count([1])
+
+        assert await p == [1]
+        assert await p == [1]
+        run.assert_awaited_once()
+        with pytest.raises(RuntimeError, match="already ran"):
+            p.count([2])
+
+    def test_rejects_refs_from_other_pipelines(self):
+        p = Pipeline(AsyncMock(), AsyncMock())
+
+        with pytest.raises(ValueError, match="different pipeline"):
+            p.count(StepRef(0, id(object())))
+        with pytest.raises(ValueError, match="different pipeline"):
+            p.mark_returned(StepRef(0, id(object())))
+
+    async def test_unexpected_result_count_is_rejected(self):
+        p = Pipeline(AsyncMock(return_value=PipelineResults([1, 2])), AsyncMock())
+        p.count([1])
+
+        with pytest.raises(RemoteExecutionError, match="expected 1 pipeline"):
+            await p
+
+    async def test_unmarked_response_runs_remaining_steps_one_by_one(self):
+        # An endpoint without pipeline support runs only the first step and
+        # returns its result, even if it is a list of the right length
+        run = AsyncMock(return_value=["a", "b"])
+        call = AsyncMock(side_effect=[2, 3])
+        p = Pipeline(run, call)
+        tokens = p.tokenize("a b")
+        count = p.count(tokens)
+        p.add(count, 1)
+        p.mark_returned(tokens)
+
+        assert await p == [["a", "b"], 3]
+        run.assert_awaited_once()
+        (name, args, kwargs), _ = call.await_args_list[0]
+        assert name == "count" and kwargs == {}
+        assert [deserialize_arg(arg) for arg in args] == [["a", "b"]]
+        (name, args, _), _ = call.await_args_list[1]
+        assert name == "add"
+        assert [deserialize_arg(arg) for arg in args] == [2, 1]
+
+    async def test_one_by_one_failure_skips_the_rest(self):
+        call = AsyncMock(side_effect=RemoteExecutionError("boom"))
+        p = Pipeline(AsyncMock(return_value=["a"]), call, return_exceptions=True)
+        p.count(p.tokenize("a"))
+        p.count([1])
+
+        assert [str(e) for e in await p] == [
+            "Remote execution failed: Skipped: step 1 failed: boom"
+        ]
+        call.assert_awaited_once()
+
+
+class TestRemoteClassPipeline:
+    """Test obj.pipeline() on remote class instances."""
+
+    async def test_pipeline_is_one_request(self):
+        instance = create_remote_class(Tokenizer, Mock(), [], [], True, {})()
+        instance._stub = Mock(pooled_instances=set(), instance_workers={})
+        instance._stub.execute_class_method = AsyncMock(
+            return_value=PipelineResults([["a"], 1])
+        )
+        instance._initialized = True
+
+        async with instance.pipeline() as p:
+            tokens = p.tokenize("a")
+            p.count(tokens)
+            p.mark_returned(tokens)
+
+        assert await p == [["a"], 1]
+        request = instance._stub.execute_class_method.await_args.args[0]
+        assert [step["method_name"] for step in request.pipeline] == [
+            "tokenize",
+            "count",
+        ]
+        assert (
+            cloudpickle.loads(base64.b64decode(request.pipeline[0]["args"][0])) == "a"
+        )
+        assert [step["returned"] for step in request.pipeline] == [True, True]
+        # The request's own method call is the first step
+        assert request.method_name == "tokenize"
+        assert request.args == request.pipeline[0]["args"]
+        assert request.class_code and request.instance_id == instance._instance_id
+
+    async def test_endpoint_without_pipelines_gets_single_calls(self):
+        instance = create_remote_class(Tokenizer, Mock(), [], [], True, {})()
+        instance._stub = Mock(pooled_instances=set(), instance_workers={})
+        instance._stub.execute_class_method = AsyncMock(side_effect=[["a"], 1])
+        instance._initialized = True
+
+        async with instance.pipeline() as p:
+            p.count(p.tokenize("a"))
+
+        assert await p == [1]
+        requests = [
+            call.args[0] for call in instance._stub.execute_class_method.await_args_list
+        ]
+        assert requests[1].pipeline is None
+        assert requests[1].method_name == "count"
+        assert deserialize_arg(requests[1].args[0]) == ["a"]
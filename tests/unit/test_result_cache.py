@@ -0,0 +1,198 @@
+"""Unit tests for the client-side result cache of @remote functions."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from runpod_flash import call_plan, result_cache
+from runpod_flash.client import remote
+from runpod_flash.core.resources import LiveServerless, ResourceManager
+from runpod_flash.result_cache import CachePolicy, DiskResultStore, ResultCache
+from runpod_flash.runtime import metrics as runtime_metrics
+
+
+def square(x):
+    return x * x
+
+
+@pytest.fixture
+def metrics():
+    collector = MagicMock()
+    with patch.object(runtime_metrics, "_collector", collector):
+        yield collector
+
+
+def _counted(name, collector):
+    return [
+        call.kwargs["labels"]
+        for call in collector.counter.call_args_list
+        if call.args[0] == name
+    ]
+
+
+class TestCachePolicy:
+    """Test CachePolicy validation."""
+
+    def test_rejects_non_positive_ttl(self):
+        with pytest.raises(ValueError, match="ttl"):
+            CachePolicy(ttl=0)
+
+    def test_rejects_negative_max_bytes(self):
+        with pytest.raises(ValueError, match="max_bytes"):
+            CachePolicy(max_bytes=-1)
+
+
+class TestResultCache:
+    """Test lookups, single-flight and persistence."""
+
+    async def test_repeated_call_served_from_memory(self, tmp_path, metrics):
+        cache = ResultCache(CachePolicy(directory=str(tmp_path)))
+        run = AsyncMock(return_value=[1, 2])
+
+        first = await cache.call(square, run, (3,), {})
+        second = await cache.call(square, run, (3,), {})
+
+        assert first == second == [1, 2]
+        assert first is not second
+        run.assert_awaited_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert _counted("result_cache_hits", metrics) == [
+            {"function_name": "square", "tier": "memory"}
+        ]
+        assert _counted("result_cache_misses", metrics) == [{"function_name": "square"}]
+
+    async def test_different_arguments_are_different_entries(self, metrics):
+        cache = ResultCache(CachePolicy(persist=False))
+        run = AsyncMock(return_value=0)
+
+        await cache.call(square, run, (3,), {})
+        await cache.call(square, run, (4,), {})
+        await cache.call(square, run, (), {"x": 3})
+
+        assert run.await_count == 3
+
+    async def test_concurrent_identical_calls_share_one_execution(self, metrics):
+        cache = ResultCache(CachePolicy(persist=False))
+        runs = []
+
+        async def run():
+            runs.append(None)
+            await asyncio.sleep(0.01)
+            return 9
+
+        results = await asyncio.gather(
+            *(cache.call(square, run, (3,), {}) for _ in range(5))
+        )
+
+        assert results == [9] * 5
+        assert len(runs) == 1
+        assert cache.hits == 4
+
+    async def test_results_persist_across_caches(self, tmp_path, metrics):
+        policy = CachePolicy(directory=str(tmp_path))
+        await ResultCache(policy).call(square, AsyncMock(return_value=9), (3,), {})
+
+        run = AsyncMock()
+        assert await ResultCache(policy).call(square, run, (3,), {}) == 9
+
+        run.assert_not_awaited()
+        assert _counted("result_cache_hits", metrics)[-1]["tier"] == "disk"
+
+    async def test_expired_entries_are_not_served(self, tmp_path, metrics):
+        cache = ResultCache(CachePolicy(ttl=60, directory=str(tmp_path)))
+        run = AsyncMock(return_value=9)
+        await cache.call(square, run, (3,), {})
+
+        with patch.object(result_cache.time, "time", return_value=1e12):
+            await cache.call(square, run, (3,), {})
+
+        assert run.await_count == 2
+
+    async def test_corrupt_disk_entry_is_a_miss(self, tmp_path, metrics):
+        policy = CachePolicy(directory=str(tmp_path))
+        await ResultCache(policy).call(square, AsyncMock(return_value=9), (3,), {})
+        (path,) = [p for p in tmp_path.glob("*/*")]
+        path.write_bytes(path.read_bytes()[:-4])
+
+        run = AsyncMock(return_value=9)
+        assert await ResultCache(policy).call(square, run, (3,), {}) == 9
+
+        run.assert_awaited_once()
+        assert [p for p in tmp_path.glob("*/*")] == [path]
+
+    async def test_failures_are_not_cached(self, metrics):
+        cache = ResultCache(CachePolicy(persist=False))
+        run = AsyncMock(side_effect=[RuntimeError("worker crashed"), 9])
+
+        with pytest.raises(RuntimeError):
+            await cache.call(square, run, (3,), {})
+        assert await cache.call(square, run, (3,), {}) == 9
+
+    async def test_memory_limit_evicts_oldest(self, metrics):
+        cache = ResultCache(CachePolicy(persist=False, max_bytes=100))
+        run = AsyncMock(return_value=b"x" * 40)
+
+        for x in range(3):
+            await cache.call(square, run, (x,), {})
+        await cache.call(square, run, (0,), {})
+
+        assert run.await_count == 4
+
+
+class TestDiskResultStore:
+    """Test the on-disk store."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        store = DiskResultStore(tmp_path, max_bytes=250)
+        store.put("aa" * 32, b"a" * 100, 0.0)
+        store.put("bb" * 32, b"b" * 100, 0.0)
+        store.put("cc" * 32, b"c" * 100, 0.0)
+
+        assert store.get("aa" * 32) is None
+        assert store.get("cc" * 32) == (0.0, b"c" * 100)
+
+    def test_truncated_entry_is_deleted(self, tmp_path):
+        store = DiskResultStore(tmp_path, max_bytes=250)
+        store.put("aa" * 32, b"a" * 100, 0.0)
+        path = tmp_path / "aa" / ("aa" * 32)
+        path.write_bytes(b"\x00" * 3)
+
+        assert store.get("aa" * 32) is None
+        assert not path.exists()
+
+
+class TestRemoteCache:
+    """Test @remote(cache=...) wiring."""
+
+    async def test_repeated_calls_skip_the_endpoint(self, tmp_path, metrics):
+        resource_config = LiveServerless(name="result-cache-test")
+        deployed = MagicMock()
+        deployed.get_resource_key.return_value = resource_config.get_resource_key()
+        stub = AsyncMock(return_value=16)
+
+        with (
+            patch.object(
+                ResourceManager,
+                "get_or_deploy_resource",
+                new=AsyncMock(return_value=deployed),
+            ),
+            patch.object(call_plan, "stub_resource", return_value=stub),
+        ):
+
+            @remote(resource_config, cache=CachePolicy(directory=str(tmp_path)))
+            async def square_remote(x):
+                return x * x
+
+            assert await square_remote(4) == 16
+            assert await square_remote(4) == 16
+
+        assert stub.await_count == 1
+        assert square_remote.result_cache.hits == 1
+
+    def test_cache_rejected_for_classes(self):
+        with pytest.raises(ValueError, match="only supported for functions"):
+
+            @remote(LiveServerless(name="result-cache-class"), cache=CachePolicy())
+            class Model:
+                pass